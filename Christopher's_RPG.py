@@ -6,118 +6,78 @@
 #   - Inheritance (Character → Player → subclasses)
 #   - Method overriding (attack, display_stats)
 #   - Composition (characters have weapons)
+#   - Pluggable dice for special-ability damage rolls
+#   - Experience and level-ups (same XP curve as project2_starter)
+#
+# The random-damage variant of the game. The classes are the ones
+# from rpg/core.py bound to RandomRangeModel (see
+# rpg/damage_models.py): basic attacks use the usual formulas, while
+# special abilities roll their damage from the character's dice:
+#   power_strike 25-45, fireball 10-50, sneak_attack 15-40
+#   (each clamped to 10-50)
+# Each class here subclasses both its parent in this file and the
+# engine class, so Warrior -> Player -> Character holds as usual.
 # ============================================================
 
-import random
+from rpg.dice import SystemDice
+from rpg.damage_models import CombatEngine, RandomRangeModel
+from rpg.core import Weapon  # re-exported: characters here hold the usual weapons
+
+# Dice used when a character is created without one
+DEFAULT_DICE = SystemDice()
+
+ENGINE = CombatEngine(RandomRangeModel(DEFAULT_DICE))
 
 # ------------------------------------------------------------
 # Base Class: Character
 # ------------------------------------------------------------
-class Character:
+class Character(ENGINE.Character):
     """Base class for all characters (both players and NPCs)."""
-    def __init__(self, name: str, health: int, strength: int, magic: int):
-        self.name = name
-        self.health = health
-        self.strength = strength
-        self.magic = magic
-        self.weapon = None  # Composition: may hold a Weapon object
-
     def take_damage(self, amount: int):
-        """Reduce health by amount, but never below 0."""
-        if amount is None or amount < 0:
-            amount = 0
-        self.health = max(self.health - amount, 0)
-
-    def attack(self, target):
-        """Base attack — deals damage equal to strength (+ weapon bonus)."""
-        damage = self.strength + (self.weapon.damage_bonus if self.weapon else 0)
-        target.take_damage(damage)
-
-    def display_stats(self):
-        """Display current stats."""
-        print(f"Name: {self.name}")
-        print(f"Health: {self.health}")
-        print(f"Strength: {self.strength}")
-        print(f"Magic: {self.magic}")
-        if self.weapon:
-            print(f"Weapon: {self.weapon.name} (+{self.weapon.damage_bonus} dmg)")
-
-# ------------------------------------------------------------
-# Composition Class: Weapon
-# ------------------------------------------------------------
-class Weapon:
-    """A simple class to represent a weapon held by a character."""
-    def __init__(self, name: str, damage_bonus: int):
-        self.name = name
-        self.damage_bonus = damage_bonus
-
-    def display_info(self):
-        print(f"Weapon Name: {self.name}, Damage Bonus: {self.damage_bonus}")
+        """Reduce health by amount, but never below 0 (None counts as no damage)."""
+        super().take_damage(0 if amount is None else amount)
 
 # ------------------------------------------------------------
 # Derived Class: Player
 # ------------------------------------------------------------
-class Player(Character):
+class Player(Character, ENGINE.Player):
     """A player character with a defined class type."""
-    def __init__(self, name: str, health: int, strength: int, magic: int, character_class: str, level: int = 1):
-        super().__init__(name, health, strength, magic)
-        self.character_class = character_class
-        self.level = level
-
-    def display_stats(self):
-        super().display_stats()
-        print(f"Class: {self.character_class}")
-        print(f"Level: {self.level}")
+    def __init__(self, name: str, health: int, strength: int, magic: int, character_class: str, level: int = 1, dice=None):
+        super().__init__(name, health, strength, magic, character_class, level)
+        if dice is not None:
+            self.dice = dice
 
 # ------------------------------------------------------------
 # Subclass: Warrior
 # ------------------------------------------------------------
-class Warrior(Player):
-   	def __init__(self, name: str, level: int = 1):
-        super().__init__(name, health=150, strength=15, magic=3, character_class="Warrior", level=level)
-        self.weapon = Weapon("Iron Sword", 10)  # Default weapon
-
-    def attack(self, target):
-        damage = self.strength + (self.weapon.damage_bonus if self.weapon else 0)
-        target.take_damage(damage)
-
-    def power_strike(self, target):
-        damage = random.randint(25, 45)
-        damage = max(10, min(50, damage))
-        target.take_damage(damage)
+class Warrior(Player, ENGINE.Warrior):
+    """Warrior: power_strike rolls 25-45 damage."""
+    def __init__(self, name: str, level: int = 1, dice=None):
+        # Player.__init__ here takes the full stat list; the engine
+        # class fills in the Warrior stats.
+        ENGINE.Warrior.__init__(self, name, level)
+        if dice is not None:
+            self.dice = dice
 
 # ------------------------------------------------------------
 # Subclass: Mage
 # ------------------------------------------------------------
-class Mage(Player):
-    def __init__(self, name: str, level: int = 1):
-        super().__init__(name, health=80, strength=5, magic=20, character_class="Mage", level=level)
-        self.weapon = Weapon("Magic Staff", 12)
-
-    def attack(self, target):
-        damage = self.magic + (self.weapon.damage_bonus if self.weapon else 0)
-        target.take_damage(damage)
-
-    def fireball(self, target):
-        damage = random.randint(10, 50)
-        target.take_damage(damage)
+class Mage(Player, ENGINE.Mage):
+    """Mage: fireball rolls 10-50 damage."""
+    def __init__(self, name: str, level: int = 1, dice=None):
+        ENGINE.Mage.__init__(self, name, level)
+        if dice is not None:
+            self.dice = dice
 
 # ------------------------------------------------------------
 # Subclass: Rogue
 # ------------------------------------------------------------
-class Rogue(Player):
-    def __init__(self, name: str, level: int = 1):
-        super().__init__(name, health=100, strength=10, magic=8, character_class="Rogue", level=level)
-        self.weapon = Weapon("Steel Dagger", 8)
-
-    def attack(self, target):
-        damage = self.strength + 3 + (self.weapon.damage_bonus if self.weapon else 0)
-        target.take_damage(damage)
-
-    def sneak_attack(self, target):
-        damage = random.randint(15, 40)
-        damage = max(10, min(50, damage))
-        target.take_damage(damage)
+class Rogue(Player, ENGINE.Rogue):
+    """Rogue: sneak_attack rolls 15-40 damage."""
+    def __init__(self, name: str, level: int = 1, dice=None):
+        ENGINE.Rogue.__init__(self, name, level)
+        if dice is not None:
+            self.dice = dice
 
 # ------------------------------------------------------------
 # Example Usage (Optional Manual Test)
@@ -0,0 +1,127 @@
+# ============================================================
+# Benchmark Suite: Combat Hot Paths (pytest-benchmark)
+# ============================================================
+# Measures construction, attack, take_damage, every special
+# ability, polymorphic dispatch over a mixed roster and
+# display_stats, each at several roster sizes.
+#
+# The file is named bench_*.py so the normal test run skips it.
+# Run it through benchmarks/compare.py (needs `pip install
+# pytest-benchmark`), which compares against the baseline committed
+# in benchmarks/.baselines and fails on a >10% slowdown:
+#
+#   python benchmarks/compare.py            # check for regressions
+#   python benchmarks/compare.py --save     # record a new baseline
+#
+# Scales go from 1 to 1,000,000 entities; set RPG_BENCH_MAX_SCALE
+# to skip the larger ones (default: 100000).
+# ============================================================
+
+import contextlib
+import io
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from project2_starter import Character, Warrior, Mage, Rogue
+
+ALL_SCALES = (1, 1_000, 100_000, 1_000_000)
+MAX_SCALE = int(os.environ.get("RPG_BENCH_MAX_SCALE", "100000"))
+SCALES = [scale for scale in ALL_SCALES if scale <= MAX_SCALE]
+
+CLASSES = {"Warrior": Warrior, "Mage": Mage, "Rogue": Rogue}
+ABILITIES = {"Warrior": "power_strike", "Mage": "fireball", "Rogue": "sneak_attack"}
+
+# Health large enough that no target is ever clamped during a run
+HUGE_HEALTH = 10 ** 15
+
+
+def mixed_roster(scale):
+    classes = (Warrior, Mage, Rogue)
+    return [classes[i % 3](f"Hero{i}") for i in range(scale)]
+
+
+@pytest.mark.parametrize("scale", SCALES)
+@pytest.mark.parametrize("class_name", sorted(CLASSES))
+def test_construction(benchmark, class_name, scale):
+    """Create scale characters of one class."""
+    cls = CLASSES[class_name]
+    benchmark(lambda: [cls("Hero") for _ in range(scale)])
+
+
+@pytest.mark.parametrize("scale", SCALES)
+def test_npc_construction(benchmark, scale):
+    """Create scale plain Character NPCs."""
+    benchmark(lambda: [Character("Goblin", 100, 8, 0) for _ in range(scale)])
+
+
+@pytest.mark.parametrize("scale", SCALES)
+@pytest.mark.parametrize("class_name", sorted(CLASSES))
+def test_attack(benchmark, class_name, scale):
+    """scale basic attacks from one class against one target."""
+    attacker = CLASSES[class_name]("Attacker")
+    target = Character("Dummy", HUGE_HEALTH, 0, 0)
+
+    def run():
+        for _ in range(scale):
+            attacker.attack(target)
+
+    benchmark(run)
+
+
+@pytest.mark.parametrize("scale", SCALES)
+def test_take_damage(benchmark, scale):
+    """scale direct take_damage calls."""
+    target = Character("Dummy", HUGE_HEALTH, 0, 0)
+
+    def run():
+        for _ in range(scale):
+            target.take_damage(7)
+
+    benchmark(run)
+
+
+@pytest.mark.parametrize("scale", SCALES)
+@pytest.mark.parametrize("class_name", sorted(ABILITIES))
+def test_special_ability(benchmark, class_name, scale):
+    """scale uses of each class's special ability."""
+    attacker = CLASSES[class_name]("Caster")
+    ability = getattr(attacker, ABILITIES[class_name])
+    target = Character("Dummy", HUGE_HEALTH, 0, 0)
+
+    def run():
+        for _ in range(scale):
+            ability(target)
+
+    benchmark(run)
+
+
+@pytest.mark.parametrize("scale", SCALES)
+def test_polymorphic_dispatch(benchmark, scale):
+    """One attack from every member of a mixed Warrior/Mage/Rogue roster."""
+    roster = mixed_roster(scale)
+    target = Character("Dummy", HUGE_HEALTH, 0, 0)
+
+    def run():
+        for character in roster:
+            character.attack(target)
+
+    benchmark(run)
+
+
+@pytest.mark.parametrize("scale", SCALES)
+def test_display_stats(benchmark, scale):
+    """display_stats for every member of a mixed roster (stdout captured)."""
+    roster = mixed_roster(scale)
+
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()):
+            for character in roster:
+                character.display_stats()
+
+    benchmark(run)
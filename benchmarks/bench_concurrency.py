@@ -0,0 +1,59 @@
+# ============================================================
+# Benchmark: Locked Damage Throughput vs Thread Count
+# ============================================================
+# Each worker thread hammers its own target with thread_safe_damage()
+# active, so the stripe locks rarely contend. Reports total hits per
+# second for 1, 2, 4, ... threads and the speedup over one thread.
+# With the GIL the speedup stays around 1x; run it on a free-threaded
+# interpreter (e.g. python3.13t) to see whether hits actually scale.
+#
+# Usage:
+#   python benchmarks/bench_concurrency.py [hits_per_thread] [max_threads]
+# ============================================================
+
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from project2_starter import Character, Warrior
+from rpg.concurrency import thread_safe_damage
+
+
+def run(threads, hits):
+    """Seconds for threads workers to land hits each on separate targets."""
+    barrier = threading.Barrier(threads + 1)
+
+    def work():
+        hero, target = Warrior("W"), Character("Dummy", 10 ** 12, 0, 0)
+        barrier.wait()
+        for _ in range(hits):
+            hero.attack(target)
+
+    workers = [threading.Thread(target=work) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    with thread_safe_damage():
+        barrier.wait()
+        started = time.perf_counter()
+        for worker in workers:
+            worker.join()
+        return time.perf_counter() - started
+
+
+def main(hits=200_000, max_threads=os.cpu_count() or 1):
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"GIL {'enabled' if gil else 'disabled'}, {os.cpu_count()} CPUs")
+    base = None
+    threads = 1
+    while threads <= max_threads:
+        rate = threads * hits / run(threads, hits)
+        base = base or rate
+        print(f"{threads:>3} threads {rate:>14,.0f} hits/s {rate / base:>6.2f}x")
+        threads *= 2
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
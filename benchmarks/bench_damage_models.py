@@ -0,0 +1,53 @@
+# ============================================================
+# Benchmark: A/B Damage Models on the Same Engine
+# ============================================================
+# Runs the same attack / special-ability loop against each damage
+# model and reports nanoseconds per action, so rule changes can be
+# compared on identical code paths.
+#
+# Usage:
+#   python benchmarks/bench_damage_models.py [actions]
+# ============================================================
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rpg.damage_models import build_engine
+from rpg.dice import SeededDice
+
+SPECIALS = {"Warrior": "power_strike", "Mage": "fireball", "Rogue": "sneak_attack"}
+
+
+def actions_per_second(engine, actions):
+    """Alternate basic attacks and specials against one very sturdy target."""
+    party = [engine.Warrior("W"), engine.Mage("M"), engine.Rogue("R")]
+    boss = engine.Character("Boss", 10 ** 15, 0, 0)
+    moves = [move for hero in party
+             for move in (hero.attack, getattr(hero, SPECIALS[hero.character_class]))]
+    rounds = actions // len(moves)
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for move in moves:
+            move(boss)
+    elapsed = time.perf_counter() - started
+    return rounds * len(moves) / elapsed, 10 ** 15 - boss.health
+
+
+def main(actions=600_000):
+    table = {"Warrior": {"power_strike": 40}, "Mage": {"fireball": 52}, "Rogue": {"sneak_attack": 38}}
+    engines = (
+        build_engine("deterministic"),
+        build_engine("random-range", dice=SeededDice(1)),
+        build_engine("table", table=table),
+    )
+    print(f"{'model':<16}{'ns/action':>12}{'damage':>14}")
+    for engine in engines:
+        rate, damage = actions_per_second(engine, actions)
+        print(f"{engine.model.name:<16}{1e9 / rate:>12.1f}{damage:>14}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 600_000)
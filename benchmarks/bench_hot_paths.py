@@ -0,0 +1,49 @@
+# ============================================================
+# Benchmark: Per-Call Cost of the Combat Hot Paths
+# ============================================================
+# Times single calls (best of several repeats) of attack, each
+# special ability, take_damage, construction and a plain stat read,
+# in nanoseconds. Pass the root of another checkout to time that
+# tree instead, e.g. to compare against an older commit:
+#
+#   git worktree add /tmp/before <commit>
+#   python benchmarks/bench_hot_paths.py /tmp/before
+#   python benchmarks/bench_hot_paths.py
+# ============================================================
+
+import os
+import sys
+import timeit
+
+ROOT = sys.argv[1] if len(sys.argv) > 1 else os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from project2_starter import Character, Warrior, Mage, Rogue
+
+CASES = (
+    ("Warrior.attack", "warrior.attack(target)"),
+    ("Mage.attack", "mage.attack(target)"),
+    ("power_strike", "warrior.power_strike(target)"),
+    ("fireball", "mage.fireball(target)"),
+    ("sneak_attack", "rogue.sneak_attack(target)"),
+    ("take_damage", "target.take_damage(1)"),
+    ("Warrior()", "Warrior('W')"),
+    ("Character()", "Character('Goblin', 100, 8, 0)"),
+    ("read strength", "warrior.strength"),
+)
+
+
+def main(number=200_000, repeat=9):
+    namespace = {
+        "warrior": Warrior("W"), "mage": Mage("M"), "rogue": Rogue("R"),
+        "target": Character("Dummy", 10 ** 15, 0, 0),
+        "Warrior": Warrior, "Character": Character,
+    }
+    print(f"tree: {ROOT}")
+    for label, statement in CASES:
+        best = min(timeit.repeat(statement, globals=namespace, number=number, repeat=repeat))
+        print(f"{label:<16}{best / number * 1e9:>10.1f} ns")
+
+
+if __name__ == "__main__":
+    main()
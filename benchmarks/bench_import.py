@@ -0,0 +1,64 @@
+# ============================================================
+# Benchmark: Cold-Start Import Time
+# ============================================================
+# Starts a fresh interpreter per run and times how long the given
+# imports take inside it (interpreter startup itself excluded).
+# The first run of each case also writes the bytecode cache, so it
+# is discarded. With PYTHONDONTWRITEBYTECODE set every run compiles
+# from source and the numbers are much higher.
+#
+# Usage:
+#   python benchmarks/bench_import.py [runs] [--budget-ms MS]
+# Exits with status 1 when a worker that only needs Character
+# ("from rpg import Character") takes longer than the budget.
+# ============================================================
+
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CASES = (
+    ("from rpg import Character", "from rpg import Character"),
+    ("import project2_starter", "import project2_starter"),
+    ("rpg + simulation", "import rpg; rpg.simulation"),
+    ("rpg + rendering", "import rpg; rpg.rendering"),
+    ("rpg + snapshot", "import rpg; rpg.snapshot"),
+    ("rpg + random model", "import rpg; rpg.random_model"),
+)
+
+TIMER = "import time; t = time.perf_counter(); {code}; print(time.perf_counter() - t)"
+
+
+def import_seconds(code):
+    """Seconds spent running code in a fresh interpreter."""
+    output = subprocess.run([sys.executable, "-c", TIMER.format(code=code)], cwd=ROOT,
+                            capture_output=True, text=True, check=True).stdout
+    return float(output)
+
+
+def main(runs=15, budget_ms=5.0):
+    print(f"{'case':<28}{'median ms':>10}{'min ms':>10}")
+    results = {}
+    for label, code in CASES:
+        import_seconds(code)  # warm the bytecode cache
+        samples = [import_seconds(code) * 1e3 for _ in range(runs)]
+        results[label] = statistics.median(samples)
+        print(f"{label:<28}{results[label]:>10.2f}{min(samples):>10.2f}")
+    core = results[CASES[0][0]]
+    if core > budget_ms:
+        print(f"core import {core:.2f} ms exceeds the {budget_ms} ms budget")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    budget = 5.0
+    if "--budget-ms" in args:
+        position = args.index("--budget-ms")
+        budget = float(args[position + 1])
+        del args[position:position + 2]
+    sys.exit(main(int(args[0]) if args else 15, budget))
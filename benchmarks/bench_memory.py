@@ -0,0 +1,54 @@
+# ============================================================
+# Benchmark: Regular vs Slotted Character Hierarchy
+# ============================================================
+# Reports bytes per entity (measured with tracemalloc) and
+# attribute-access speed for both representations. Both intern
+# their starting weapons, so the weapon is shared, not per entity.
+#
+# Usage:
+#   python benchmarks/bench_memory.py [count]
+# ============================================================
+
+import os
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rpg.slotted_characters import REGULAR_CLASSES, SLOTTED_CLASSES
+
+
+def bytes_per_entity(cls, count):
+    """Average traced allocation size of one instance of cls."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    entities = [cls(f"Hero{i}") for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # Names are shared by both representations; leave them out.
+    name_bytes = sum(sys.getsizeof(entity.name) for entity in entities)
+    list_bytes = sys.getsizeof(entities)
+    return (after - before - name_bytes - list_bytes) / count
+
+
+def access_time(cls, number):
+    """Seconds per read of the stats used by attack()."""
+    hero = cls("Speedy")
+    timer = timeit.Timer("h.strength; h.magic; h.health; h.weapon.damage_bonus",
+                         globals={"h": hero})
+    return timer.timeit(number) / number
+
+
+def main(count=100_000):
+    print(f"{'class':<10}{'repr':<10}{'bytes/entity':>14}{'ns/access':>12}")
+    for class_name in ("Warrior", "Mage", "Rogue"):
+        for label, classes in (("regular", REGULAR_CLASSES), ("slotted", SLOTTED_CLASSES)):
+            cls = getattr(classes, class_name)
+            size = bytes_per_entity(cls, count)
+            speed = access_time(cls, 1_000_000) * 1e9
+            print(f"{class_name:<10}{label:<10}{size:>14.1f}{speed:>12.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,53 @@
+# ============================================================
+# Benchmark: Fresh NPC Allocation vs NPCPool Recycling
+# ============================================================
+# Runs the same encounter loop twice: once creating a new
+# Character for every monster, once recycling them through an
+# NPCPool. Reports wall time, garbage collections and total / worst
+# GC pause for both, plus the pool's reuse rate.
+#
+# Usage:
+#   python benchmarks/bench_npc_pool.py [waves] [monsters_per_wave]
+# ============================================================
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from project2_starter import Character, Warrior
+from rpg.npc_pool import NPCPool, GCMonitor
+
+
+def run(waves, size, pool=None):
+    """Fight waves of goblins; returns (seconds, GCMonitor)."""
+    hero = Warrior("Aragorn")
+    hero.health = 10 ** 12
+    spawn = pool.acquire if pool is not None else Character
+    started = time.perf_counter()
+    with GCMonitor() as monitor:
+        for _ in range(waves):
+            encounter = [spawn("Goblin", 100, 8, 0) for _ in range(size)]
+            for goblin in encounter:
+                while goblin.health > 0:
+                    hero.power_strike(goblin)
+            if pool is not None:
+                pool.reclaim(encounter)
+    return time.perf_counter() - started, monitor
+
+
+def main(waves=2000, size=500):
+    pool = NPCPool(capacity=size)
+    print(f"{'mode':<10}{'seconds':>10}{'GCs':>8}{'pause ms':>10}{'max ms':>9}")
+    for label, mode_pool in (("allocate", None), ("pooled", pool)):
+        seconds, monitor = run(waves, size, mode_pool)
+        stats = monitor.stats()
+        print(f"{label:<10}{seconds:>10.3f}{stats['collections']:>8}"
+              f"{stats['pause_ms']:>10.2f}{stats['max_pause_ms']:>9.3f}")
+    print(f"reuse rate: {pool.stats()['reuse_rate']:.4f}")
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:3]]
+    main(*args)
@@ -0,0 +1,46 @@
+# ============================================================
+# Benchmark Regression Check for bench_combat.py
+# ============================================================
+# Runs the pytest-benchmark suite against the committed baseline in
+# benchmarks/.baselines and fails (exit code 1) when any benchmark's
+# median time is more than 10% slower:
+#
+#   python benchmarks/compare.py            # compare, fail on regressions
+#   python benchmarks/compare.py --save     # record a new baseline
+#
+# Extra arguments are passed on to pytest, e.g. -k attack. Baselines
+# are stored per machine (OS, interpreter, bitness), so a new machine
+# needs its own --save run before comparing. Timings from different
+# hardware are not comparable.
+# ============================================================
+
+import os
+import sys
+
+import pytest
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+STORAGE = os.path.join(HERE, ".baselines")
+SUITE = os.path.join(HERE, "bench_combat.py")
+
+# Fail when a benchmark's median time grows by more than this. The
+# median of at least MIN_ROUNDS warmed-up rounds is the most stable
+# statistic on shared machines; mean and min both swing by 20%+.
+THRESHOLD = "median:10%"
+MIN_ROUNDS = 20
+
+
+def main(argv):
+    save = "--save" in argv
+    extra = [arg for arg in argv if arg != "--save"]
+    options = ["-p", "no:cacheprovider", SUITE, f"--benchmark-storage=file://{STORAGE}",
+               "--benchmark-warmup=on", f"--benchmark-min-rounds={MIN_ROUNDS}"]
+    if save:
+        options.append("--benchmark-autosave")
+    else:
+        options += ["--benchmark-compare", f"--benchmark-compare-fail={THRESHOLD}"]
+    return pytest.main(options + extra)
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,228 @@
+# ============================================================
+# Battle Server: Many Concurrent Matches on One Event Loop
+# ============================================================
+# MatchHost keeps every running duel in memory and applies player
+# commands to the regular Warrior / Mage / Rogue classes. Commands
+# are JSON objects, one per line, sent over a local TCP socket:
+#
+#   {"cmd": "create", "classes": ["Warrior", "Mage"], "names": ["A", "B"]}
+#   {"cmd": "act", "match": 1, "player": 0, "action": "attack"}
+#   {"cmd": "act", "match": 1, "player": 1, "action": "special"}
+#   {"cmd": "state", "match": 1}
+#   {"cmd": "stats"}
+#
+# Every reply is one JSON line with "ok": true/false. Commands are
+# applied synchronously (they are microseconds of work), so no locks
+# are needed and a slow client never blocks another match.
+# ============================================================
+
+import asyncio
+import itertools
+import json
+import time
+
+from .core import Warrior, Mage, Rogue
+
+PLAYER_CLASSES = {"Warrior": Warrior, "Mage": Mage, "Rogue": Rogue}
+SPECIAL_ABILITIES = {"Warrior": "power_strike", "Mage": "fireball", "Rogue": "sneak_attack"}
+
+
+class CommandError(ValueError):
+    """Raised for commands the host cannot apply."""
+
+
+# ------------------------------------------------------------
+# Matches
+# ------------------------------------------------------------
+class Match:
+    """A turn-based duel between two players."""
+
+    __slots__ = ("match_id", "players", "turn", "winner", "actions")
+
+    def __init__(self, match_id, players):
+        self.match_id = match_id
+        self.players = players
+        self.turn = 0        # index of the player expected to act next
+        self.winner = None   # index of the winning player once decided
+        self.actions = 0
+
+    def act(self, player, action):
+        if self.winner is not None:
+            raise CommandError(f"match {self.match_id} is over")
+        if player != self.turn:
+            raise CommandError(f"it is player {self.turn}'s turn")
+        actor = self.players[player]
+        target = self.players[1 - player]
+        if action == "attack":
+            actor.attack(target)
+        elif action == "special":
+            getattr(actor, SPECIAL_ABILITIES[actor.character_class])(target)
+        else:
+            raise CommandError(f"unknown action: {action}")
+        self.actions += 1
+        if target.health == 0:
+            self.winner = player
+        self.turn = 1 - player
+
+    def state(self):
+        return {
+            "match": self.match_id,
+            "players": [{"name": p.name, "class": p.character_class, "health": p.health}
+                        for p in self.players],
+            "turn": self.turn,
+            "winner": self.winner,
+        }
+
+
+# ------------------------------------------------------------
+# MatchHost
+# ------------------------------------------------------------
+class MatchHost:
+    """Applies commands to matches and serves them over a local socket."""
+
+    def __init__(self):
+        self.matches = {}
+        self._ids = itertools.count(1)
+        self.commands = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self._server = None
+
+    def handle(self, command):
+        """Apply one command dict and return the reply dict."""
+        started = time.perf_counter()
+        try:
+            reply = self._dispatch(command)
+            reply["ok"] = True
+        except (CommandError, KeyError, TypeError) as error:
+            reply = {"ok": False, "error": str(error)}
+        latency = time.perf_counter() - started
+        self.commands += 1
+        self.total_latency += latency
+        if latency > self.max_latency:
+            self.max_latency = latency
+        return reply
+
+    def _dispatch(self, command):
+        cmd = command.get("cmd")
+        if cmd == "create":
+            classes = command["classes"]
+            names = command.get("names") or [f"Player{i + 1}" for i in range(len(classes))]
+            if len(classes) != 2 or len(names) != 2:
+                raise CommandError("a match needs exactly two players")
+            if any(name not in PLAYER_CLASSES for name in classes):
+                raise CommandError(f"classes must be chosen from {sorted(PLAYER_CLASSES)}")
+            match_id = next(self._ids)
+            players = [PLAYER_CLASSES[cls](name) for cls, name in zip(classes, names)]
+            self.matches[match_id] = Match(match_id, players)
+            return self.matches[match_id].state()
+        if cmd == "act":
+            match = self._match(command)
+            match.act(command["player"], command["action"])
+            state = match.state()
+            if match.winner is not None:
+                del self.matches[match.match_id]  # finished matches free their memory
+            return state
+        if cmd == "state":
+            return self._match(command).state()
+        if cmd == "stats":
+            return self.stats()
+        raise CommandError(f"unknown command: {cmd}")
+
+    def _match(self, command):
+        match = self.matches.get(command["match"])
+        if match is None:
+            raise CommandError(f"no running match {command['match']}")
+        return match
+
+    def stats(self):
+        """Command count and per-command latency in microseconds."""
+        return {
+            "matches": len(self.matches),
+            "commands": self.commands,
+            "mean_latency_us": self.total_latency / self.commands * 1e6 if self.commands else 0.0,
+            "max_latency_us": self.max_latency * 1e6,
+        }
+
+    # -- networking -------------------------------------------
+    async def _serve_client(self, reader, writer):
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    command = json.loads(line)
+                    reply = self.handle(command) if isinstance(command, dict) \
+                        else {"ok": False, "error": "command must be a JSON object"}
+                except json.JSONDecodeError as error:
+                    reply = {"ok": False, "error": f"invalid JSON: {error}"}
+                writer.write(json.dumps(reply).encode() + b"\n")
+                await writer.drain()
+        finally:
+            writer.close()
+
+    async def start(self, host="127.0.0.1", port=0):
+        """Start listening; returns the (host, port) actually bound."""
+        self._server = await asyncio.start_server(self._serve_client, host, port)
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+
+# ------------------------------------------------------------
+# Local stand-in client
+# ------------------------------------------------------------
+class BattleClient:
+    """Minimal client speaking the line-based JSON protocol."""
+
+    def __init__(self, reader, writer):
+        self._reader = reader
+        self._writer = writer
+
+    @classmethod
+    async def connect(cls, host, port):
+        reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer)
+
+    async def send(self, **command):
+        self._writer.write(json.dumps(command).encode() + b"\n")
+        await self._writer.drain()
+        return json.loads(await self._reader.readline())
+
+    async def close(self):
+        self._writer.close()
+        await self._writer.wait_closed()
+
+
+async def play_match(client, classes=("Warrior", "Mage")):
+    """Play one match to the end, alternating special and basic attacks."""
+    state = await client.send(cmd="create", classes=list(classes))
+    match_id = state["match"]
+    turn = 0
+    while state.get("winner") is None:
+        action = "special" if turn % 4 < 2 else "attack"
+        state = await client.send(cmd="act", match=match_id, player=state["turn"], action=action)
+        turn += 1
+    return state
+
+
+# ------------------------------------------------------------
+# Example Usage (Optional Manual Test)
+# ------------------------------------------------------------
+if __name__ == "__main__":
+    async def demo(count=1000):
+        host = MatchHost()
+        address = await host.start()
+        clients = [await BattleClient.connect(*address) for _ in range(count)]
+        results = await asyncio.gather(*(play_match(client) for client in clients))
+        for client in clients:
+            await client.close()
+        await host.stop()
+        print(f"{len(results)} matches finished; {host.stats()}")
+
+    asyncio.run(demo())
@@ -0,0 +1,404 @@
+# ============================================================
+# CharacterPool: Struct-of-Arrays Storage for Large Battles
+# ============================================================
+# Instead of one Python object (with its own __dict__) per
+# combatant, the pool keeps every stat in a contiguous column:
+#   - names       -> list of str
+#   - health      -> array('q')
+#   - strength    -> array('q')
+#   - magic       -> array('q')
+#   - class_ids   -> array('b')  (CHARACTER / WARRIOR / MAGE / ROGUE)
+#   - weapon_ids  -> array('i')  (index into the weapon table, -1 = none)
+#   - positions   -> list of (x, y) or None
+#   - levels      -> array('h')
+#   - experience  -> array('q')
+#
+# Lightweight handle objects expose the usual Character API
+# (attack, take_damage, display_stats, special abilities) by
+# reading and writing the columns, so existing code keeps working.
+# ============================================================
+
+from array import array
+from bisect import bisect_right
+
+from .core import (Character, Player, Warrior, Mage, Rogue, WEAPONS,
+                              XP_CURVE, LEVEL_UP_GAINS, DEFAULT_LEVEL_UP_GAINS,
+                              damage_hooks_active, damage_router_active, deal_damage)
+
+
+# Class ids stored in the class_ids column
+CHARACTER = 0
+WARRIOR = 1
+MAGE = 2
+ROGUE = 3
+
+CLASS_NAMES = ("Character", "Warrior", "Mage", "Rogue")
+
+# Weapon id used when a character holds no weapon
+NO_WEAPON = -1
+
+# Basic attack formula per class id: damage = stat + offset + weapon bonus,
+# where stat is magic for Mages and strength for everyone else.
+ATTACK_USES_MAGIC = (False, False, True, False)
+ATTACK_OFFSET = (0, 0, 0, 3)
+
+# Starting stats per class: (health, strength, magic, weapon name, weapon bonus)
+CLASS_TEMPLATES = {
+    WARRIOR: (150, 15, 3, "Iron Sword", 10),
+    MAGE: (80, 5, 20, "Magic Staff", 12),
+    ROGUE: (100, 10, 8, "Steel Dagger", 8),
+}
+
+
+# ------------------------------------------------------------
+# Pool
+# ------------------------------------------------------------
+class CharacterPool:
+    """Columnar storage for many characters of any class."""
+
+    def __init__(self):
+        self.names = []
+        self.health = array("q")
+        self.strength = array("q")
+        self.magic = array("q")
+        self.class_ids = array("b")
+        self.weapon_ids = array("i")
+        self.positions = []
+        self.levels = array("h")
+        self.experience = array("q")
+        self.weapons = []         # Weapon table, indexed by weapon id
+        self._weapon_index = {}   # (name, damage_bonus) -> weapon id
+
+    def __len__(self):
+        return len(self.names)
+
+    def __getitem__(self, index):
+        """Return a handle for the character stored at index."""
+        if index < 0:
+            index += len(self.names)
+        if not 0 <= index < len(self.names):
+            raise IndexError("character index out of range")
+        return _HANDLE_TYPES[self.class_ids[index]](self, index)
+
+    def __iter__(self):
+        for index in range(len(self.names)):
+            yield _HANDLE_TYPES[self.class_ids[index]](self, index)
+
+    def weapon_id(self, weapon):
+        """Return the weapon-table id for a weapon, adding it if new."""
+        if weapon is None:
+            return NO_WEAPON
+        key = (weapon.name, weapon.damage_bonus)
+        weapon_id = self._weapon_index.get(key)
+        if weapon_id is None:
+            weapon_id = len(self.weapons)
+            self.weapons.append(weapon)
+            self._weapon_index[key] = weapon_id
+        return weapon_id
+
+    def add(self, name, health, strength, magic, class_id=CHARACTER, weapon=None):
+        """Append one character and return its handle."""
+        if class_id not in (CHARACTER, WARRIOR, MAGE, ROGUE):
+            raise ValueError(f"Unknown class id: {class_id}")
+        index = len(self.names)
+        self.names.append(name)
+        self.health.append(health)
+        self.strength.append(strength)
+        self.magic.append(magic)
+        self.class_ids.append(class_id)
+        self.weapon_ids.append(self.weapon_id(weapon))
+        self.positions.append(None)
+        self.levels.append(1)
+        self.experience.append(0)
+        return _HANDLE_TYPES[class_id](self, index)
+
+    def spawn(self, class_id, name):
+        """Append a Warrior, Mage or Rogue with its starting stats and weapon."""
+        health, strength, magic, weapon_name, bonus = CLASS_TEMPLATES[class_id]
+        weapon = WEAPONS.intern(weapon_name, bonus)
+        return self.add(name, health, strength, magic, class_id, weapon)
+
+    def spawn_many(self, class_id, names):
+        """Bulk version of spawn(); returns the index of the first new entry."""
+        first = len(self.names)
+        names = list(names)
+        count = len(names)
+        if class_id == CHARACTER:
+            raise ValueError("spawn_many() needs a player class id")
+        health, strength, magic, weapon_name, bonus = CLASS_TEMPLATES[class_id]
+        weapon_id = self.weapon_id(WEAPONS.intern(weapon_name, bonus))
+        self.names.extend(names)
+        self.health.extend(array("q", [health]) * count)
+        self.strength.extend(array("q", [strength]) * count)
+        self.magic.extend(array("q", [magic]) * count)
+        self.class_ids.extend(array("b", [class_id]) * count)
+        self.weapon_ids.extend(array("i", [weapon_id]) * count)
+        self.positions.extend([None] * count)
+        self.levels.extend(array("h", [1]) * count)
+        self.experience.extend(array("q", [0]) * count)
+        return first
+
+    def weapon_bonuses(self):
+        """Damage bonus per weapon id; the trailing 0 serves NO_WEAPON (-1)."""
+        return [weapon.damage_bonus for weapon in self.weapons] + [0]
+
+    def attack_damage(self, attackers):
+        """Basic attack damage for each attacker index, as an array."""
+        bonuses = self.weapon_bonuses()
+        strength, magic = self.strength, self.magic
+        class_ids, weapon_ids = self.class_ids, self.weapon_ids
+        return array("q", [
+            (magic[a] if ATTACK_USES_MAGIC[class_ids[a]] else strength[a])
+            + ATTACK_OFFSET[class_ids[a]] + bonuses[weapon_ids[a]]
+            for a in attackers
+        ])
+
+    def apply_damage(self, targets, damages):
+        """Apply many take_damage() calls at once, clamping health at 0.
+
+        Hits on the same target are summed first; because negative damage
+        counts as 0, clamping the sum gives the same result as clamping
+        after every individual hit. This writes the health column directly:
+        damage hooks are not notified and no damage router is consulted.
+        """
+        totals = {}
+        for target, damage in zip(targets, damages):
+            if damage > 0:
+                totals[target] = totals.get(target, 0) + damage
+        health = self.health
+        for target, total in totals.items():
+            remaining = health[target] - total
+            health[target] = remaining if remaining > 0 else 0
+
+    def resolve_attacks(self, attackers, targets):
+        """Resolve attackers[i].attack(targets[i]) for every pair in one pass.
+
+        Accepts pool indices or handles. Returns the damage dealt by each
+        attacker; final health matches calling attack() pair by pair.
+        While damage hooks or a damage router are active, each hit is
+        delivered separately through handles so they see every attack.
+        """
+        attackers = _as_indices(attackers)
+        targets = _as_indices(targets)
+        if len(attackers) != len(targets):
+            raise ValueError("attackers and targets must have the same length")
+        damages = self.attack_damage(attackers)
+        if damage_hooks_active() or damage_router_active():
+            for attacker, target, damage in zip(attackers, targets, damages):
+                deal_damage(self[attacker], self[target], damage, "attack")
+        else:
+            self.apply_damage(targets, damages)
+        return damages
+
+    def award_experience(self, indices, amounts):
+        """Add experience to many characters and apply their level-ups.
+
+        Each new level is one bisect into XP_CURVE and the stat gains for
+        all levels reached are applied in one step. Experience is kept
+        in whole points, so fractional amounts are rounded down. Plain
+        Character rows are not players and are skipped. Returns the
+        indices of the characters that levelled up.
+        """
+        levelled = []
+        levels, experience, class_ids = self.levels, self.experience, self.class_ids
+        for index, amount in zip(indices, amounts):
+            if class_ids[index] == CHARACTER:
+                continue
+            total = experience[index] + int(amount)
+            experience[index] = total
+            gained = bisect_right(XP_CURVE, total) - levels[index]
+            if gained > 0:
+                health, strength, magic = _LEVEL_UP_GAINS[class_ids[index]]
+                levels[index] += gained
+                self.health[index] += health * gained
+                self.strength[index] += strength * gained
+                self.magic[index] += magic * gained
+                levelled.append(index)
+        return levelled
+
+    def add_character(self, character):
+        """Copy an ordinary Character (or subclass) object into the pool.
+
+        The class id comes from the nearest Character, Warrior, Mage or
+        Rogue base class. Players of any other class cannot be stored,
+        so they raise ValueError instead of losing their class.
+        """
+        class_id = _class_id(type(character))
+        handle = self.add(character.name, character.health, character.strength,
+                          character.magic, class_id, character.weapon)
+        handle.position = getattr(character, "position", None)
+        if isinstance(character, Player):
+            handle.level = character.level
+            handle.experience = character.experience
+        return handle
+
+
+def _class_id(cls):
+    """Class id of the nearest pool-compatible base class of cls."""
+    for base in cls.__mro__:
+        class_id = _CLASS_IDS.get(base)
+        if class_id is not None:
+            return class_id
+        if base is Player:
+            break
+    raise ValueError(f"cannot store a {cls.__name__} in a CharacterPool "
+                     f"(only Character, Warrior, Mage and Rogue)")
+
+
+def _as_indices(entries):
+    """Convert a sequence of handles and/or indices to a list of indices."""
+    return [entry if isinstance(entry, int) else entry.index for entry in entries]
+
+
+def resolve_attacks(attackers, targets):
+    """Batch attack() for handles that all belong to the same pool."""
+    if not attackers:
+        return array("q")
+    pool = attackers[0]._pool
+    if any(handle._pool is not pool for handle in (*attackers, *targets)):
+        raise ValueError("resolve_attacks() needs handles from a single pool")
+    return pool.resolve_attacks(attackers, targets)
+
+
+# ------------------------------------------------------------
+# Handles
+# ------------------------------------------------------------
+# Handles subclass the regular classes so isinstance() checks and the
+# inherited attack / special ability / display_stats methods work
+# unchanged; the properties below redirect every stat to the pool.
+class _PooledFields:
+    """Properties mapping character attributes onto pool columns."""
+
+    __slots__ = ()
+
+    def __init__(self, pool, index):
+        self._pool = pool
+        self._index = index
+
+    @property
+    def index(self):
+        return self._index
+
+    @property
+    def name(self):
+        return self._pool.names[self._index]
+
+    @name.setter
+    def name(self, value):
+        self._pool.names[self._index] = value
+
+    @property
+    def health(self):
+        return self._pool.health[self._index]
+
+    @health.setter
+    def health(self, value):
+        self._pool.health[self._index] = value
+
+    @property
+    def strength(self):
+        return self._pool.strength[self._index]
+
+    @strength.setter
+    def strength(self, value):
+        self._pool.strength[self._index] = value
+
+    @property
+    def magic(self):
+        return self._pool.magic[self._index]
+
+    @magic.setter
+    def magic(self, value):
+        self._pool.magic[self._index] = value
+
+    @property
+    def weapon(self):
+        weapon_id = self._pool.weapon_ids[self._index]
+        return None if weapon_id == NO_WEAPON else self._pool.weapons[weapon_id]
+
+    @weapon.setter
+    def weapon(self, value):
+        self._pool.weapon_ids[self._index] = self._pool.weapon_id(value)
+
+    @property
+    def position(self):
+        return self._pool.positions[self._index]
+
+    @position.setter
+    def position(self, value):
+        self._pool.positions[self._index] = value
+
+    @property
+    def level(self):
+        return self._pool.levels[self._index]
+
+    @level.setter
+    def level(self, value):
+        self._pool.levels[self._index] = value
+
+    @property
+    def experience(self):
+        return self._pool.experience[self._index]
+
+    @experience.setter
+    def experience(self, value):
+        self._pool.experience[self._index] = value
+
+    def __eq__(self, other):
+        return (isinstance(other, _PooledFields)
+                and self._pool is other._pool and self._index == other._index)
+
+    def __hash__(self):
+        return hash((id(self._pool), self._index))
+
+    def __repr__(self):
+        return f"<{type(self).__name__} {self.name!r} #{self._index}>"
+
+
+class PooledCharacter(_PooledFields, Character):
+    """Handle for a plain Character (NPC) stored in a pool."""
+    __slots__ = ("_pool", "_index")
+
+
+def _character_class(self):
+    return CLASS_NAMES[self._pool.class_ids[self._index]]
+
+
+class PooledWarrior(_PooledFields, Warrior):
+    """Handle for a Warrior stored in a pool."""
+    __slots__ = ("_pool", "_index")
+    character_class = property(_character_class)
+
+
+class PooledMage(_PooledFields, Mage):
+    """Handle for a Mage stored in a pool."""
+    __slots__ = ("_pool", "_index")
+    character_class = property(_character_class)
+
+
+class PooledRogue(_PooledFields, Rogue):
+    """Handle for a Rogue stored in a pool."""
+    __slots__ = ("_pool", "_index")
+    character_class = property(_character_class)
+
+
+_HANDLE_TYPES = (PooledCharacter, PooledWarrior, PooledMage, PooledRogue)
+
+_LEVEL_UP_GAINS = tuple(LEVEL_UP_GAINS.get(name, DEFAULT_LEVEL_UP_GAINS) for name in CLASS_NAMES)
+
+_CLASS_IDS = {Character: CHARACTER, Warrior: WARRIOR, Mage: MAGE, Rogue: ROGUE}
+
+
+# ------------------------------------------------------------
+# Example Usage (Optional Manual Test)
+# ------------------------------------------------------------
+if __name__ == "__main__":
+    pool = CharacterPool()
+    hero = pool.spawn(WARRIOR, "Aragorn")
+    monster = pool.add("Goblin", 100, 8, 0)
+
+    hero.display_stats()
+    hero.attack(monster)
+    print(f"{monster.name}'s Health after attack: {monster.health}")
+    hero.power_strike(monster)
+    print(f"{monster.name}'s Health after Power Strike: {monster.health}")
@@ -0,0 +1,169 @@
+# ============================================================
+# Combat Event Stream
+# ============================================================
+# Records every damage event from attack(), take_damage() and the
+# special abilities as a CombatEvent, using the damage hooks in
+# core.py.
+#
+#   with EventStream(maxlen=1000) as stream:
+#       hero.attack(monster)
+#   for event in stream:          # drains buffered events
+#       print(event)
+#
+# The buffer is bounded. When it is full the overflow policy decides:
+#   "ring"  -> drop the oldest event (keep the most recent maxlen)
+#   "drop"  -> discard the new event
+#   "block" -> wait until a consumer thread drains the buffer
+# Every event is passed to the sinks before it is buffered, so a
+# sink can persist the full history even when the buffer drops some.
+# ============================================================
+
+import json
+import threading
+from collections import deque, namedtuple
+
+from .core import add_damage_hook, remove_damage_hook
+
+# attacker is None for direct take_damage() calls; names are stored
+# instead of objects so buffered events never keep characters alive.
+CombatEvent = namedtuple("CombatEvent", "seq attacker target ability damage health")
+
+OVERFLOW_POLICIES = ("ring", "drop", "block")
+
+
+# ------------------------------------------------------------
+# EventStream
+# ------------------------------------------------------------
+class EventStream:
+    """Bounded buffer of combat events fed by the damage hooks."""
+
+    def __init__(self, maxlen=10_000, overflow="ring", sinks=()):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow must be one of {OVERFLOW_POLICIES}")
+        if maxlen < 1:
+            raise ValueError("maxlen must be at least 1")
+        self.maxlen = maxlen
+        self.overflow = overflow
+        self.sinks = list(sinks)
+        self.emitted = 0
+        self.dropped = 0
+        self._buffer = deque()
+        self._ready = threading.Condition()
+        self._closed = False
+        self._attached = False
+
+    # -- hook management --------------------------------------
+    def attach(self):
+        """Start recording combat events."""
+        if not self._attached:
+            add_damage_hook(self._on_damage)
+            self._attached = True
+            self._closed = False
+        return self
+
+    def detach(self):
+        """Stop recording and wake any consumer waiting in follow()."""
+        if self._attached:
+            remove_damage_hook(self._on_damage)
+            self._attached = False
+        with self._ready:
+            self._closed = True
+            self._ready.notify_all()
+
+    def __enter__(self):
+        return self.attach()
+
+    def __exit__(self, *exc_info):
+        self.detach()
+
+    # -- producer side ----------------------------------------
+    def _on_damage(self, attacker, target, ability, damage):
+        with self._ready:
+            self.emitted += 1
+            event = CombatEvent(self.emitted, attacker.name if attacker is not None else None,
+                                target.name, ability, damage, target.health)
+        for sink in self.sinks:
+            sink(event)
+        self.push(event)
+
+    def push(self, event):
+        """Buffer one event, applying the overflow policy."""
+        with self._ready:
+            if len(self._buffer) >= self.maxlen:
+                if self.overflow == "ring":
+                    self._buffer.popleft()
+                    self.dropped += 1
+                elif self.overflow == "drop":
+                    self.dropped += 1
+                    return
+                else:
+                    while len(self._buffer) >= self.maxlen and not self._closed:
+                        self._ready.wait()
+            self._buffer.append(event)
+            self._ready.notify_all()
+
+    # -- consumer side ----------------------------------------
+    def __len__(self):
+        return len(self._buffer)
+
+    def __iter__(self):
+        return self.drain()
+
+    def drain(self):
+        """Yield buffered events until the buffer is empty."""
+        while True:
+            with self._ready:
+                if not self._buffer:
+                    return
+                event = self._buffer.popleft()
+                self._ready.notify_all()
+            yield event
+
+    def follow(self, timeout=None):
+        """Yield events as they arrive until detach() (for consumer threads).
+
+        Stops early if no event arrives within timeout seconds.
+        """
+        while True:
+            with self._ready:
+                while not self._buffer:
+                    if self._closed or not self._ready.wait(timeout):
+                        if not self._buffer:
+                            return
+                event = self._buffer.popleft()
+                self._ready.notify_all()
+            yield event
+
+
+# ------------------------------------------------------------
+# Sinks and pipeline helpers
+# ------------------------------------------------------------
+class JsonLinesSink:
+    """Sink that writes each event as one JSON object per line."""
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def __call__(self, event):
+        self.stream.write(json.dumps(event._asdict()) + "\n")
+
+
+def filter_events(events, ability=None, attacker=None, target=None):
+    """Yield only the events matching every given field."""
+    for event in events:
+        if ability is not None and event.ability != ability:
+            continue
+        if attacker is not None and event.attacker != attacker:
+            continue
+        if target is not None and event.target != target:
+            continue
+        yield event
+
+
+def total_damage(events, key="attacker"):
+    """Sum damage per attacker (or per target, ability, ...)."""
+    totals = {}
+    for event in events:
+        name = getattr(event, key)
+        totals[name] = totals.get(name, 0) + event.damage
+    return totals
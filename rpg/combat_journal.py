@@ -0,0 +1,385 @@
+# ============================================================
+# Combat Journal: Compact Replay Log with Keyframes
+# ============================================================
+# Records a fight as a stream of tiny binary events instead of full
+# character snapshots, then rebuilds or re-fights it on demand:
+#
+#   with CombatJournal(party + monsters) as journal:
+#       ...fight...
+#   journal.save("fight.rpgj")
+#   journal = CombatJournal.load("fight.rpgj")
+#   journal.state_at(120)          # every health after turn 120
+#   verify(journal)                # re-fight; None if identical
+#
+# Every damage event (one "turn") is four varints:
+#   attacker id + 1 (0 = direct take_damage), target id, ability id,
+#   zigzag(health delta of the target since its last event)
+# Every keyframe_interval turns the journal also keeps a keyframe
+# (all healths plus the byte offset of the next event), so seeking
+# decodes at most keyframe_interval events.
+#
+# Stats other than health are only stored for the starting roster;
+# verify() reports the first turn where a re-fought action does not
+# reproduce the recorded health (e.g. after a mid-fight level-up).
+# ============================================================
+
+from collections import namedtuple
+
+from .core import Character, Warrior, Mage, Rogue, WEAPONS, XP_CURVE
+from .core import add_damage_hook, remove_damage_hook, damage_applied
+
+MAGIC = b"RPGJRNL1"
+VERSION = 1
+
+# Starting state of one participant
+RosterEntry = namedtuple("RosterEntry", "name class_name health strength magic level weapon bonus")
+
+# One decoded event; attacker is None for direct take_damage() calls
+JournalEvent = namedtuple("JournalEvent", "turn attacker target ability delta")
+
+REPLAY_CLASSES = {"Character": Character, "Warrior": Warrior, "Mage": Mage, "Rogue": Rogue}
+
+
+class JournalError(ValueError):
+    """Raised when data is not a valid combat journal."""
+
+
+# ------------------------------------------------------------
+# Varint Encoding
+# ------------------------------------------------------------
+def _zigzag(value):
+    return value * 2 if value >= 0 else -value * 2 - 1
+
+
+def _unzigzag(value):
+    return value >> 1 if not value & 1 else -(value >> 1) - 1
+
+
+def _write_varint(buffer, value):
+    while value > 0x7F:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def _read_varint(data, position):
+    result = shift = 0
+    while True:
+        try:
+            byte = data[position]
+        except IndexError:
+            raise JournalError("truncated journal") from None
+        position += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, position
+        shift += 7
+
+
+def _write_string(buffer, text):
+    encoded = text.encode("utf-8")
+    _write_varint(buffer, len(encoded))
+    buffer += encoded
+
+
+def _read_string(data, position):
+    size, position = _read_varint(data, position)
+    if position + size > len(data):
+        raise JournalError("truncated journal")
+    return bytes(data[position:position + size]).decode("utf-8"), position + size
+
+
+# ------------------------------------------------------------
+# CombatJournal
+# ------------------------------------------------------------
+class CombatJournal:
+    """Delta-encoded damage events for a fixed roster, with keyframes."""
+
+    def __init__(self, characters=(), keyframe_interval=256):
+        if keyframe_interval < 1:
+            raise ValueError("keyframe_interval must be at least 1")
+        self.keyframe_interval = keyframe_interval
+        self.roster = []          # RosterEntry per entity id
+        self.abilities = []       # ability id -> name
+        self._ability_ids = {}
+        self._ids = {}            # live character -> entity id (recording only)
+        self._health = []         # last recorded health per entity id
+        self._events = bytearray()
+        self._keyframes = []      # (turn, byte offset, tuple of healths)
+        self.turns = 0
+        self._attached = False
+        for character in characters:
+            self.track(character)
+
+    def __len__(self):
+        return self.turns
+
+    # -- recording --------------------------------------------
+    def track(self, character, health=None):
+        """Add a participant; returns its entity id."""
+        entity = self._ids.get(character)
+        if entity is not None:
+            return entity
+        weapon = character.weapon
+        health = character.health if health is None else health
+        entity = len(self.roster)
+        self.roster.append(RosterEntry(
+            character.name, getattr(character, "character_class", "Character"), health,
+            character.strength, character.magic, getattr(character, "level", 1),
+            weapon.name if weapon else "", weapon.damage_bonus if weapon else 0))
+        self._ids[character] = entity
+        self._health.append(health)
+        return entity
+
+    def attach(self):
+        """Start journaling damage events."""
+        if not self._attached:
+            add_damage_hook(self.record)
+            self._attached = True
+        return self
+
+    def detach(self):
+        """Stop journaling."""
+        if self._attached:
+            remove_damage_hook(self.record)
+            self._attached = False
+
+    def __enter__(self):
+        return self.attach()
+
+    def __exit__(self, *exc_info):
+        self.detach()
+
+    def record(self, attacker, target, ability, damage):
+        """Append one damage event (damage hook signature)."""
+        if self.turns % self.keyframe_interval == 0:
+            self._keyframes.append((self.turns, len(self._events), tuple(self._health)))
+        target_id = self._ids.get(target)
+        if target_id is None:  # joined mid-fight: its health before this hit
+            applied = damage_applied()  # not damage: an overkill removes less
+            if applied is None:  # target outside the Character hierarchy
+                applied = max(damage, 0)
+            target_id = self.track(target, target.health + applied)
+        attacker_id = 0 if attacker is None else self.track(attacker) + 1
+        ability_id = self._ability_ids.get(ability)
+        if ability_id is None:
+            ability_id = self._ability_ids[ability] = len(self.abilities)
+            self.abilities.append(ability)
+        health = target.health
+        events = self._events
+        _write_varint(events, attacker_id)
+        _write_varint(events, target_id)
+        _write_varint(events, ability_id)
+        _write_varint(events, _zigzag(self._health[target_id] - health))
+        self._health[target_id] = health
+        self.turns += 1
+
+    # -- reading ----------------------------------------------
+    def _decode(self, position, start_turn, stop_turn):
+        data, abilities = self._events, self.abilities
+        for turn in range(start_turn, stop_turn):
+            attacker, position = _read_varint(data, position)
+            target, position = _read_varint(data, position)
+            ability, position = _read_varint(data, position)
+            delta, position = _read_varint(data, position)
+            yield JournalEvent(turn + 1, attacker - 1 if attacker else None, target,
+                               abilities[ability], _unzigzag(delta))
+
+    def events(self, start=0, stop=None):
+        """Decoded events for turns start+1 .. stop (entity ids, not objects)."""
+        stop = self.turns if stop is None else min(stop, self.turns)
+        keyframe = self._keyframe_before(start)
+        turn, position = keyframe[0], keyframe[1]
+        for event in self._decode(position, turn, stop):
+            if event.turn > start:
+                yield event
+
+    def _keyframe_before(self, turn):
+        if not self._keyframes:
+            return (0, 0, ())
+        index = min(turn // self.keyframe_interval, len(self._keyframes) - 1)
+        return self._keyframes[index]
+
+    def state_at(self, turn):
+        """Health of every participant after turn events (0 = the start)."""
+        if not 0 <= turn <= self.turns:
+            raise IndexError(f"turn {turn} outside 0..{self.turns}")
+        start, position, healths = self._keyframe_before(turn)
+        health = [entry.health for entry in self.roster]
+        health[:len(healths)] = healths  # later joiners keep their starting health
+        for event in self._decode(position, start, turn):
+            health[event.target] -= event.delta
+        return health
+
+    # -- persistence ------------------------------------------
+    def to_bytes(self):
+        out = bytearray(MAGIC)
+        for value in (VERSION, self.keyframe_interval, len(self.roster)):
+            _write_varint(out, value)
+        for entry in self.roster:
+            _write_string(out, entry.name)
+            _write_string(out, entry.class_name)
+            for value in (entry.health, entry.strength, entry.magic, entry.level):
+                _write_varint(out, _zigzag(value))
+            _write_string(out, entry.weapon)
+            _write_varint(out, _zigzag(entry.bonus))
+        _write_varint(out, len(self.abilities))
+        for ability in self.abilities:
+            _write_string(out, ability)
+        _write_varint(out, self.turns)
+        _write_varint(out, len(self._keyframes))
+        for turn, position, healths in self._keyframes:
+            _write_varint(out, turn)
+            _write_varint(out, position)
+            _write_varint(out, len(healths))
+            for health in healths:
+                _write_varint(out, _zigzag(health))
+        _write_varint(out, len(self._events))
+        out += self._events
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Rebuild a journal (for reading and replay) from to_bytes() output."""
+        data = memoryview(data)
+        if bytes(data[:len(MAGIC)]) != MAGIC:
+            raise JournalError("not a combat journal")
+        position = len(MAGIC)
+        version, position = _read_varint(data, position)
+        if version != VERSION:
+            raise JournalError(f"unsupported journal version {version}")
+        interval, position = _read_varint(data, position)
+        journal = cls(keyframe_interval=max(interval, 1))
+        count, position = _read_varint(data, position)
+        for _ in range(count):
+            name, position = _read_string(data, position)
+            class_name, position = _read_string(data, position)
+            numbers = []
+            for _ in range(4):
+                value, position = _read_varint(data, position)
+                numbers.append(_unzigzag(value))
+            weapon, position = _read_string(data, position)
+            bonus, position = _read_varint(data, position)
+            journal.roster.append(RosterEntry(name, class_name, *numbers, weapon, _unzigzag(bonus)))
+        count, position = _read_varint(data, position)
+        for _ in range(count):
+            ability, position = _read_string(data, position)
+            journal._ability_ids[ability] = len(journal.abilities)
+            journal.abilities.append(ability)
+        journal.turns, position = _read_varint(data, position)
+        count, position = _read_varint(data, position)
+        for _ in range(count):
+            turn, position = _read_varint(data, position)
+            offset, position = _read_varint(data, position)
+            size, position = _read_varint(data, position)
+            healths = []
+            for _ in range(size):
+                value, position = _read_varint(data, position)
+                healths.append(_unzigzag(value))
+            journal._keyframes.append((turn, offset, tuple(healths)))
+        size, position = _read_varint(data, position)
+        if position + size != len(data):
+            raise JournalError("journal event data has the wrong length")
+        journal._events = bytearray(data[position:])
+        journal._health = journal.state_at(journal.turns)
+        return journal
+
+    def save(self, path):
+        with open(path, "wb") as file:
+            file.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as file:
+            return cls.from_bytes(file.read())
+
+    def stats(self):
+        """Sizes of the journal, to compare with snapshot-per-turn storage."""
+        size = len(self.to_bytes())
+        return {
+            "turns": self.turns,
+            "participants": len(self.roster),
+            "keyframes": len(self._keyframes),
+            "event_bytes": len(self._events),
+            "total_bytes": size,
+            "bytes_per_turn": len(self._events) / self.turns if self.turns else 0.0,
+        }
+
+
+# ------------------------------------------------------------
+# Replay
+# ------------------------------------------------------------
+def rebuild_roster(journal, classes=REPLAY_CLASSES):
+    """Fresh characters with the journal's starting stats, by entity id."""
+    characters = []
+    for entry in journal.roster:
+        cls = classes.get(entry.class_name, classes["Character"])
+        if entry.class_name in classes and entry.class_name != "Character":
+            character = cls(entry.name)
+            character.health = entry.health
+            character.strength = entry.strength
+            character.magic = entry.magic
+            character.level = entry.level
+            character.experience = XP_CURVE[entry.level - 1]
+        else:
+            character = cls(entry.name, entry.health, entry.strength, entry.magic)
+        character.weapon = WEAPONS.intern(entry.weapon, entry.bonus) if entry.weapon else None
+        characters.append(character)
+    return characters
+
+
+def replay(journal, classes=REPLAY_CLASSES, until=None, check=False):
+    """Re-fight the journal through attack() / abilities / take_damage().
+
+    Returns the rebuilt characters, or with check=True a pair
+    (characters, first mismatching turn or None).
+    """
+    characters = rebuild_roster(journal, classes)
+    mismatch = None
+    for event in journal.events(0, until):
+        target = characters[event.target]
+        expected = target.health - event.delta
+        action = None
+        if event.attacker is not None:
+            action = getattr(characters[event.attacker], event.ability, None)
+        if callable(action):
+            action(target)
+        else:  # direct hits and effects without a method of their own
+            target.take_damage(event.delta)
+        if check and mismatch is None and target.health != expected:
+            mismatch = event.turn
+    return (characters, mismatch) if check else characters
+
+
+def verify(journal, characters=None, classes=REPLAY_CLASSES):
+    """Re-fight the whole journal; returns None if every turn reproduced.
+
+    Otherwise returns the first turn whose health differs. When the
+    live characters are given (in roster order), their final health
+    is compared as well ("final" is returned on a mismatch there).
+    """
+    replayed, mismatch = replay(journal, classes, check=True)
+    if mismatch is not None:
+        return mismatch
+    if characters is not None:
+        if [c.health for c in characters] != [c.health for c in replayed]:
+            return "final"
+    return None
+
+
+# ------------------------------------------------------------
+# Example Usage (Optional Manual Test)
+# ------------------------------------------------------------
+if __name__ == "__main__":
+    party = [Warrior("Aragorn"), Mage("Gandalf"), Rogue("Bilbo")]
+    monsters = [Character(f"Orc{i}", 300, 12, 0) for i in range(20)]
+    with CombatJournal(party + monsters, keyframe_interval=64) as journal:
+        for monster in monsters:
+            while monster.health > 0:
+                party[0].power_strike(monster)
+                party[1].fireball(monster)
+                party[2].attack(monster)
+                monster.attack(party[0])
+    print(journal.stats())
+    print(f"Orc0 after turn 3: {journal.state_at(3)[3]}")
+    print(f"Replay verified: {verify(journal, party + monsters) is None}")
@@ -0,0 +1,499 @@
+# ============================================================
+# Project 2: RPG Character Inheritance & Composition System
+# ============================================================
+# Author: Christopher Arnold
+# This project demonstrates:
+#   - Inheritance (Character → Player → subclasses)
+#   - Method overriding (attack, stat_lines behind display_stats)
+#   - Composition (characters have weapons)
+#   - Special abilities unique to each subclass
+#   - Flyweight weapons shared through a WeaponRegistry
+#   - Damage hooks for observing combat events
+#   - Damage routing for locked or deferred damage application
+#   - Experience and level-ups driven by a precomputed XP curve
+#
+# project2_starter.py at the repository root re-exports this module
+# for the classroom tests.
+# ============================================================
+
+import sys
+from bisect import bisect_right
+
+try:
+    # threading.local is this class; importing it directly skips the
+    # cost of importing threading for tools that never start threads.
+    from _thread import _local as thread_local
+except ImportError:
+    from threading import local as thread_local
+
+
+# ------------------------------------------------------------
+# Damage Hooks
+# ------------------------------------------------------------
+# Hooks are callables notified after every damage application:
+#   hook(attacker, target, ability, damage)
+# attacker is None and ability is "take_damage" when take_damage()
+# was called directly instead of through an attack or ability.
+# damage is the amount requested; inside a hook, damage_applied()
+# gives the health the hit actually removed (less on an overkill).
+# With no hooks registered the only cost is one truthiness check.
+_damage_hooks = []
+_attribution = thread_local()  # (attacker, ability) of the hit in progress
+
+
+def add_damage_hook(hook):
+    """Start notifying hook about every damage event."""
+    _damage_hooks.append(hook)
+
+
+def remove_damage_hook(hook):
+    """Stop notifying hook."""
+    _damage_hooks.remove(hook)
+
+
+def damage_hooks_active():
+    """True while at least one damage hook is registered."""
+    return bool(_damage_hooks)
+
+
+def damage_applied():
+    """Health removed by the hit being reported (None outside a hook or if unknown)."""
+    return getattr(_attribution, "applied", None)
+
+
+def _notify_damage(attacker, target, ability, damage):
+    for hook in tuple(_damage_hooks):
+        hook(attacker, target, ability, damage)
+
+
+def _take_damage_observed(target, amount):
+    """take_damage() while hooks are registered: apply, then notify."""
+    before = target.health
+    health = before - amount
+    target.health = health if health > 0 else 0
+    previous = getattr(_attribution, "applied", None)
+    _attribution.applied = before - target.health
+    try:
+        source = getattr(_attribution, "source", None)
+        if source is None:
+            _notify_damage(None, target, "take_damage", amount)
+        else:
+            _attribution.source = None
+            _notify_damage(source[0], target, source[1], amount)
+    finally:
+        _attribution.applied = previous  # a hook may itself have dealt damage
+
+
+# ------------------------------------------------------------
+# Damage Routing
+# ------------------------------------------------------------
+# Every hit from attack() or a special ability goes through
+# Character._deal(). By default it is applied at once; a router
+# installed with set_damage_router() receives
+#   router(attacker, target, damage, ability)
+# instead and decides when and how to call deliver_damage()
+# (e.g. under a lock, or batched at the end of a tick). Damage that
+# does not come from a Character method (effects, traps) should use
+# deal_damage() so it is routed the same way.
+_damage_router = None
+
+
+def set_damage_router(router):
+    """Install router (None restores immediate damage); returns the previous one."""
+    global _damage_router
+    previous = _damage_router
+    _damage_router = router
+    return previous
+
+
+def damage_router_active():
+    """True while a damage router is installed."""
+    return _damage_router is not None
+
+
+def deliver_damage(attacker, target, damage, ability):
+    """Apply one hit now, attributing it to attacker for the damage hooks."""
+    if not _damage_hooks:
+        target.take_damage(damage)
+        return
+    _attribution.source = (attacker, ability)
+    try:
+        target.take_damage(damage)
+    finally:
+        # Targets outside the Character hierarchy never consume the
+        # attribution, so report the hit from the attacker side.
+        if _attribution.source is not None:
+            _attribution.source = None
+            _notify_damage(attacker, target, ability, damage)
+
+
+def deal_damage(attacker, target, damage, ability):
+    """Route one hit like Character._deal() does (attacker may be None)."""
+    if _damage_router is not None:
+        _damage_router(attacker, target, damage, ability)
+    else:
+        deliver_damage(attacker, target, damage, ability)
+
+
+# ------------------------------------------------------------
+# Progression
+# ------------------------------------------------------------
+# XP_CURVE[i] is the total experience needed to reach level i + 1,
+# so finding a player's level is one bisect into the table.
+MAX_LEVEL = 50
+XP_CURVE = tuple(50 * level * (level - 1) for level in range(1, MAX_LEVEL + 1))
+
+# Experience for defeating a character, multiplied by its level
+KILL_EXPERIENCE = 50
+
+# Stat gains per level-up: (health, strength, magic)
+LEVEL_UP_GAINS = {
+    "Warrior": (12, 3, 1),
+    "Mage": (6, 1, 4),
+    "Rogue": (8, 2, 2),
+}
+DEFAULT_LEVEL_UP_GAINS = (8, 2, 2)
+
+
+def level_for_experience(experience):
+    """Level reached with the given total experience (at most MAX_LEVEL)."""
+    return bisect_right(XP_CURVE, experience)
+
+
+def kill_experience(target):
+    """Experience awarded for defeating target."""
+    return KILL_EXPERIENCE * getattr(target, "level", 1)
+
+
+# ------------------------------------------------------------
+# Base Class: Character
+# ------------------------------------------------------------
+class Character:
+    """Base class for all characters (both players and NPCs)."""
+
+    def __init__(self, name, health, strength, magic):
+        self.name = name
+        self.health = health
+        self.strength = strength
+        self.magic = magic
+        self.weapon = None  # Composition: may hold a Weapon object
+        self.position = None  # (x, y) once placed in a spatial index
+
+    def damage_table(self):
+        """Damage each of this character's attacks would deal now, by ability name.
+
+        Worked out from the current stats on every call, for stat sheets,
+        tools and tests. Nothing is cached: attack() and the special
+        abilities read the stats directly.
+        """
+        return {"attack": self.strength + (self.weapon.damage_bonus if self.weapon else 0)}
+
+    def take_damage(self, amount):
+        """Reduce health, but never below 0."""
+        if amount < 0:
+            amount = 0  # Safety check
+        if _damage_hooks:
+            _take_damage_observed(self, amount)
+            return
+        self.health -= amount
+        if self.health < 0:
+            self.health = 0
+
+    def _deal(self, target, damage, ability):
+        """Apply damage from one of this character's attacks to target."""
+        if _damage_router is not None:
+            _damage_router(self, target, damage, ability)
+        elif _damage_hooks:
+            deliver_damage(self, target, damage, ability)
+        else:
+            target.take_damage(damage)
+
+    def attack(self, target):
+        """Base attack — deals damage equal to strength (+ weapon bonus)."""
+        damage = self.strength
+        if self.weapon:
+            damage += self.weapon.damage_bonus
+        self._deal(target, damage, "attack")
+
+    def stat_lines(self):
+        """Return the lines shown by display_stats()."""
+        lines = [
+            f"Name: {self.name}",
+            f"Health: {self.health}",
+            f"Strength: {self.strength}",
+            f"Magic: {self.magic}",
+        ]
+        if self.weapon:
+            lines.append(f"Weapon: {self.weapon.name} (+{self.weapon.damage_bonus} dmg)")
+        return lines
+
+    def display_stats(self):
+        """Display current stats (one write instead of one print per line)."""
+        print("\n".join(self.stat_lines()))
+
+
+# ------------------------------------------------------------
+# Composition Class: Weapon
+# ------------------------------------------------------------
+class Weapon:
+    """A simple class to represent a weapon held by a character."""
+
+    def __init__(self, name, damage_bonus):
+        self.name = name
+        self.damage_bonus = damage_bonus
+
+    def display_info(self):
+        """Show weapon info."""
+        print(f"Weapon Name: {self.name}, Damage Bonus: {self.damage_bonus}")
+
+
+# ------------------------------------------------------------
+# Flyweight: SharedWeapon + WeaponRegistry
+# ------------------------------------------------------------
+class SharedWeapon(Weapon):
+    """An immutable Weapon that many characters can hold at once."""
+
+    def __init__(self, name, damage_bonus):
+        object.__setattr__(self, "name", name)
+        object.__setattr__(self, "damage_bonus", damage_bonus)
+
+    def __setattr__(self, attr, value):
+        raise AttributeError("shared weapons are read-only; equip a new Weapon instead")
+
+    def __delattr__(self, attr):
+        raise AttributeError("shared weapons are read-only")
+
+
+def _weapon_size(weapon):
+    """Bytes one extra copy of weapon would take."""
+    size = sys.getsizeof(weapon)
+    attributes = getattr(weapon, "__dict__", None)
+    return size + sys.getsizeof(attributes) if attributes is not None else size
+
+
+class WeaponRegistry:
+    """Interns weapon definitions and hands out shared instances.
+
+    weapon_type is the read-only class handed out (SharedWeapon here;
+    slotted_characters.py keeps a registry of slotted ones).
+    """
+
+    def __init__(self, weapon_type=SharedWeapon):
+        self.weapon_type = weapon_type
+        self._by_key = {}   # (name, damage_bonus) -> shared weapon
+        self._by_name = {}  # name -> first SharedWeapon defined with that name
+        self.hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+
+    def __len__(self):
+        return len(self._by_key)
+
+    def __contains__(self, name):
+        return name in self._by_name
+
+    def intern(self, name, damage_bonus):
+        """Return the shared weapon for (name, damage_bonus), creating it once."""
+        key = (name, damage_bonus)
+        weapon = self._by_key.get(key)
+        if weapon is None:
+            self.misses += 1
+            weapon = self.weapon_type(name, damage_bonus)
+            self._by_key[key] = weapon
+            self._by_name.setdefault(name, weapon)
+        else:
+            self.hits += 1
+            self.bytes_saved += _weapon_size(weapon)
+        return weapon
+
+    def get(self, name):
+        """Return the shared weapon registered under name."""
+        weapon = self._by_name.get(name)
+        if weapon is None:
+            raise KeyError(f"Unknown weapon: {name}")
+        self.hits += 1
+        self.bytes_saved += _weapon_size(weapon)
+        return weapon
+
+    def load(self, definitions):
+        """Bulk-register weapons from (name, damage_bonus) pairs or dicts.
+
+        Returns the number of new weapons added. Loading does not count
+        towards the hit/miss statistics.
+        """
+        added = 0
+        for definition in definitions:
+            if isinstance(definition, dict):
+                name, damage_bonus = definition["name"], definition["damage_bonus"]
+            else:
+                name, damage_bonus = definition
+            key = (name, damage_bonus)
+            if key not in self._by_key:
+                weapon = self.weapon_type(name, damage_bonus)
+                self._by_key[key] = weapon
+                self._by_name.setdefault(name, weapon)
+                added += 1
+        return added
+
+    def stats(self):
+        """Return hit/miss counters and the estimated memory saved."""
+        return {
+            "weapons": len(self._by_key),
+            "hits": self.hits,
+            "misses": self.misses,
+            "bytes_saved": self.bytes_saved,
+        }
+
+
+# Registry used for the starting weapons of every Player subclass
+WEAPONS = WeaponRegistry()
+
+
+# ------------------------------------------------------------
+# Derived Class: Player (inherits from Character)
+# ------------------------------------------------------------
+class Player(Character):
+    """A player character with a defined class type (Warrior, Mage, Rogue)."""
+
+    def __init__(self, name, health, strength, magic, character_class, level=1):
+        if not 1 <= level <= MAX_LEVEL:
+            raise ValueError(f"level must be between 1 and {MAX_LEVEL}, not {level}")
+        super().__init__(name, health, strength, magic)
+        self.character_class = character_class
+        self.level = level
+        self.experience = XP_CURVE[level - 1]
+
+    def gain_experience(self, amount):
+        """Add experience and apply any level-ups; returns the levels gained."""
+        self.experience += amount
+        gained = level_for_experience(self.experience) - self.level
+        if gained <= 0:
+            return 0
+        return self.level_up(gained)
+
+    def level_up(self, levels=1):
+        """Raise the level and scale stats by the class's per-level gains.
+
+        The level stops at MAX_LEVEL and experience is raised to at least
+        the new level's threshold. Returns the levels actually gained.
+        """
+        levels = min(levels, MAX_LEVEL - self.level)
+        if levels <= 0:
+            return 0
+        health, strength, magic = LEVEL_UP_GAINS.get(self.character_class, DEFAULT_LEVEL_UP_GAINS)
+        self.level += levels
+        self.health += health * levels
+        self.strength += strength * levels
+        self.magic += magic * levels
+        if self.experience < XP_CURVE[self.level - 1]:
+            self.experience = XP_CURVE[self.level - 1]
+        return levels
+
+    def stat_lines(self):
+        """Show all inherited stats plus class, level and experience."""
+        lines = super().stat_lines()
+        lines.append(f"Class: {self.character_class}")
+        lines.append(f"Level: {self.level}")
+        lines.append(f"Experience: {self.experience}")
+        return lines
+
+
+# ------------------------------------------------------------
+# Subclass: Warrior
+# ------------------------------------------------------------
+class Warrior(Player):
+    """Warrior: Strong and durable with a powerful melee ability."""
+
+    def __init__(self, name, level=1):
+        super().__init__(name, health=150, strength=15, magic=3, character_class="Warrior", level=level)
+        self.weapon = WEAPONS.intern("Iron Sword", 10)
+
+    def damage_table(self):
+        """Override: attack and power_strike damage at the current stats."""
+        bonus = self.weapon.damage_bonus if self.weapon else 0
+        return {
+            "attack": self.strength + bonus,
+            "power_strike": (self.strength * 2) + bonus,
+        }
+
+    def attack(self, target):
+        """Override: Stronger physical attack."""
+        damage = self.strength + (self.weapon.damage_bonus if self.weapon else 0)
+        self._deal(target, damage, "attack")
+
+    def power_strike(self, target):
+        """Special ability: Extra-powerful attack."""
+        damage = (self.strength * 2) + (self.weapon.damage_bonus if self.weapon else 0)
+        self._deal(target, damage, "power_strike")
+
+
+# ------------------------------------------------------------
+# Subclass: Mage
+# ------------------------------------------------------------
+class Mage(Player):
+    """Mage: Fragile but capable of high magic damage."""
+
+    def __init__(self, name, level=1):
+        super().__init__(name, health=80, strength=5, magic=20, character_class="Mage", level=level)
+        self.weapon = WEAPONS.intern("Magic Staff", 12)
+
+    def damage_table(self):
+        """Override: attack and fireball damage at the current stats."""
+        bonus = self.weapon.damage_bonus if self.weapon else 0
+        return {
+            "attack": self.magic + bonus,
+            "fireball": (self.magic * 2) + bonus,
+        }
+
+    def attack(self, target):
+        """Override: Basic magic attack."""
+        damage = self.magic + (self.weapon.damage_bonus if self.weapon else 0)
+        self._deal(target, damage, "attack")
+
+    def fireball(self, target):
+        """Special ability: Large burst of magical fire."""
+        damage = (self.magic * 2) + (self.weapon.damage_bonus if self.weapon else 0)
+        self._deal(target, damage, "fireball")
+
+
+# ------------------------------------------------------------
+# Subclass: Rogue
+# ------------------------------------------------------------
+class Rogue(Player):
+    """Rogue: Agile and precise, specializes in critical sneak attacks."""
+
+    def __init__(self, name, level=1):
+        super().__init__(name, health=100, strength=10, magic=8, character_class="Rogue", level=level)
+        self.weapon = WEAPONS.intern("Steel Dagger", 8)
+
+    def damage_table(self):
+        """Override: attack and sneak_attack damage at the current stats."""
+        bonus = self.weapon.damage_bonus if self.weapon else 0
+        return {
+            "attack": self.strength + 3 + bonus,
+            "sneak_attack": (self.strength * 2) + 10 + bonus,
+        }
+
+    def attack(self, target):
+        """Override: Quick attack with agility bonus."""
+        damage = self.strength + 3 + (self.weapon.damage_bonus if self.weapon else 0)
+        self._deal(target, damage, "attack")
+
+    def sneak_attack(self, target):
+        """Special ability: Critical backstab with high damage."""
+        damage = (self.strength * 2) + 10 + (self.weapon.damage_bonus if self.weapon else 0)
+        self._deal(target, damage, "sneak_attack")
+
+
+# ------------------------------------------------------------
+# Example Usage (Optional Manual Test)
+# ------------------------------------------------------------
+if __name__ == "__main__":
+    hero = Warrior("Aragorn")
+    monster = Character("Goblin", 100, 8, 0)
+
+    hero.display_stats()
+    hero.attack(monster)
+    print(f"{monster.name}'s Health after attack: {monster.health}")
+    hero.power_strike(monster)
+    print(f"{monster.name}'s Health after Power Strike: {monster.health}")
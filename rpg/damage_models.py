@@ -0,0 +1,191 @@
+# ============================================================
+# Damage Models: One Engine, Pluggable Damage Rules
+# ============================================================
+# core.py computes ability damage from fixed formulas;
+# Christopher's_RPG.py rolls it from ranges. Both now run on the same
+# classes: a CombatEngine asks its model, once per class, for the
+# attack and ability methods it decides, and builds subclasses with
+# those methods in place of the formula ones:
+#
+#   engine = CombatEngine(RandomRangeModel(dice))
+#   hero = engine.Warrior("Thorin")
+#   hero.power_strike(goblin)            # 25-45 damage from the dice
+#
+# Models:
+#   DeterministicModel -> the formulas of the hand-written methods
+#   RandomRangeModel   -> dice rolls per special ability, clamped
+#   TableModel         -> fixed damage per class and ability
+#
+# The model is resolved once per class, so the hot path never checks
+# which model is active; methods the model does not replace are the
+# original ones. Bound classes keep the hierarchy: engine.Warrior
+# subclasses both Warrior and engine.Player. DeterministicModel hands
+# back the original classes unchanged.
+# ============================================================
+
+from collections import namedtuple
+
+from .core import Character, Player, Warrior, Mage, Rogue
+
+# Damage roll for one ability: dice.roll(low, high), then clamped to [floor, cap]
+RollRange = namedtuple("RollRange", "low high floor cap")
+
+# The ranges Christopher's_RPG.py has always used
+RANDOM_RANGES = {
+    "power_strike": RollRange(25, 45, 10, 50),
+    "fireball": RollRange(10, 50, 10, 50),
+    "sneak_attack": RollRange(15, 40, 10, 50),
+}
+
+ENGINE_CLASSES = (Character, Player, Warrior, Mage, Rogue)
+
+
+# ------------------------------------------------------------
+# Models
+# ------------------------------------------------------------
+def _ability(name, doc, damage_of):
+    """Method using ability name, dealing damage_of(character)."""
+    def use(self, target):
+        self._deal(target, damage_of(self), name)
+    use.__name__ = use.__qualname__ = name
+    use.__doc__ = doc
+    return use
+
+
+class DeterministicModel:
+    """Damage from each class's own formulas (the default)."""
+
+    name = "deterministic"
+
+    def resolver(self, cls):
+        """Return {method name: function} replacing methods of cls, or None to keep them all."""
+        return None
+
+
+class RandomRangeModel:
+    """Special abilities roll their damage; other attacks stay deterministic.
+
+    Rolls use the character's own `dice` attribute, so each entity can
+    have its own (seeded) stream; `dice` is the default for the rest.
+    """
+
+    name = "random-range"
+
+    def __init__(self, dice=None, ranges=RANDOM_RANGES):
+        if dice is None:
+            from .dice import SystemDice
+            dice = SystemDice()
+        self.dice = dice
+        self.ranges = dict(ranges)
+
+    def resolver(self, cls):
+        methods = {}
+        for ability, (low, high, floor, cap) in self.ranges.items():
+            if not hasattr(cls, ability):
+                continue
+
+            def roll(character, low=low, high=high, floor=floor, cap=cap):
+                damage = character.dice.roll(low, high)
+                return floor if damage < floor else cap if damage > cap else damage
+
+            methods[ability] = _ability(ability, f"Special ability: {low}-{high} damage from the dice.", roll)
+        return methods or None
+
+
+class TableModel:
+    """Fixed damage per class name and ability, e.g. from a balance sheet.
+
+    Abilities missing from the table fall back to the class formulas.
+    """
+
+    name = "table"
+
+    def __init__(self, table):
+        self.table = {cls: dict(abilities) for cls, abilities in table.items()}
+
+    def resolver(self, cls):
+        class_table = self.table.get(cls.__name__)
+        if not class_table:
+            return None
+        return {ability: _ability(ability, f"{ability}: {damage} damage from the table.",
+                                  lambda character, damage=damage: damage)
+                for ability, damage in class_table.items()}
+
+
+MODELS = {model.name: model for model in (DeterministicModel, RandomRangeModel, TableModel)}
+
+
+# ------------------------------------------------------------
+# Engine
+# ------------------------------------------------------------
+class CombatEngine:
+    """The character classes, bound to one damage model."""
+
+    def __init__(self, model=None, classes=ENGINE_CLASSES):
+        self.model = model if model is not None else DeterministicModel()
+        self.classes = {}
+        bound = {}  # original class -> its class in this engine
+        for base in sorted(classes, key=lambda cls: len(cls.__mro__)):  # parents first
+            cls = bound[base] = self._bind(base, bound)
+            self.classes[base.__name__] = cls
+            setattr(self, base.__name__, cls)
+
+    def _bind(self, base, bound):
+        """Subclass base with the model's methods, under its nearest bound ancestor."""
+        methods = self.model.resolver(base) or {}
+        origin = next((ancestor for ancestor in base.__mro__[1:]
+                       if ancestor in bound and bound[ancestor] is not ancestor), None)
+        parent = bound[origin] if origin is not None else None
+        if parent is None and not methods:
+            return base
+        namespace = {}
+        if parent is not None:
+            # parent comes before base in the MRO, so its model methods
+            # would hide base's own overrides (e.g. Warrior.attack); keep
+            # every one that base or a class below origin defines.
+            for name in parent.model_methods:
+                for ancestor in base.__mro__[:base.__mro__.index(origin)]:
+                    if name in vars(ancestor):
+                        namespace[name] = vars(ancestor)[name]
+                        break
+        namespace.update(methods)
+        namespace.update(
+            damage_model=self.model, __doc__=base.__doc__, __module__=base.__module__,
+            model_methods=frozenset(methods).union(parent.model_methods if parent else ()),
+        )
+        if isinstance(self.model, RandomRangeModel):
+            namespace["dice"] = self.model.dice  # default for instances without their own
+        bases = (parent, base) if parent is not None else (base,)
+        return type(base.__name__, bases, namespace)
+
+    def __getitem__(self, class_name):
+        return self.classes[class_name]
+
+    def __repr__(self):
+        return f"<CombatEngine {self.model.name}>"
+
+
+def build_engine(model="deterministic", **options):
+    """Build a CombatEngine from a model name in MODELS (or a model instance)."""
+    if isinstance(model, str):
+        try:
+            model = MODELS[model](**options)
+        except KeyError:
+            raise ValueError(f"unknown damage model {model!r}; choose from {sorted(MODELS)}") from None
+    return CombatEngine(model)
+
+
+# ------------------------------------------------------------
+# Example Usage (Optional Manual Test)
+# ------------------------------------------------------------
+if __name__ == "__main__":
+    from .dice import SeededDice
+
+    table = {"Mage": {"fireball": 60}}
+    for engine in (build_engine(), build_engine("random-range", dice=SeededDice(1)),
+                   build_engine("table", table=table)):
+        mage = engine.Mage("Gandalf")
+        goblin = engine.Character("Goblin", 500, 8, 0)
+        for _ in range(3):
+            mage.fireball(goblin)
+        print(f"{engine}: goblin health after 3 fireballs = {goblin.health}")
@@ -0,0 +1,129 @@
+# ============================================================
+# Deferred Damage: Per-Tick Accumulation with Bulk Commit
+# ============================================================
+# While a DamageAccumulator is installed as the damage router,
+# attack() and the special abilities only record pending damage.
+# commit() then applies the summed damage of the tick to every
+# affected character at once, clamped at 0 like take_damage().
+#
+#   with deferred_damage() as tick:
+#       for attacker, target in pairs:
+#           attacker.attack(target)      # recorded, not applied
+#       tick.commit()                    # one write per target
+#
+# Everyone acts on the health they had at the start of the tick
+# (simultaneous resolution): a character killed this tick still
+# gets its own hits in. Each thread records into its own buffer, so
+# worker threads need no locks; call commit() between ticks, once
+# the workers for the tick are done. commit() drops the buffers of
+# threads that have finished, so short-lived workers do not pile up.
+#
+# Hits recorded while damage hooks are registered also keep partial
+# sums per (attacker, ability), and commit() delivers one attributed
+# hit per sum, so event streams, kill experience and journals still
+# see who did the damage. Other hits are committed as "tick" damage.
+# ============================================================
+
+import threading
+from contextlib import contextmanager
+
+from .core import damage_hooks_active, deliver_damage, set_damage_router
+from .character_pool import CharacterPool
+
+
+class DamageAccumulator:
+    """Damage router that sums hits per target until commit()."""
+
+    def __init__(self):
+        self._local = threading.local()
+        self._buffers = []            # (thread, ({target: total}, attributed)) per recording thread
+        self._register = threading.Lock()
+        self.hits = 0
+        self.writes = 0
+
+    def _buffer(self):
+        buffer = getattr(self._local, "buffer", None)
+        if buffer is None:
+            # attributed: {target: {(attacker, ability): damage}}, filled only while hooks run
+            buffer = self._local.buffer = ({}, {})
+            with self._register:
+                self._buffers.append((threading.current_thread(), buffer))
+        return buffer
+
+    def __call__(self, attacker, target, damage, ability):
+        if damage > 0:  # take_damage() treats negative damage as 0
+            totals, attributed = self._buffer()
+            totals[target] = totals.get(target, 0) + damage
+            if damage_hooks_active():
+                parts = attributed.setdefault(target, {})
+                key = (attacker, ability)
+                parts[key] = parts.get(key, 0) + damage
+        self.hits += 1  # statistic only; may undercount under heavy threading
+
+    def pending(self, target=None):
+        """Pending damage for target, or the number of targets with pending damage."""
+        if target is None:
+            return len(self._merge(clear=False)[0])
+        return sum(totals.get(target, 0) for _, (totals, _) in self._buffers)
+
+    def _merge(self, clear):
+        with self._register:
+            buffers = [buffer for _, buffer in self._buffers]
+            if clear:
+                # Finished threads record nothing more; merge their last hits below
+                self._buffers = [entry for entry in self._buffers if entry[0].is_alive()]
+        if len(buffers) == 1:
+            totals = dict(buffers[0][0])
+            attributed = {target: dict(parts) for target, parts in buffers[0][1].items()}
+        else:
+            totals, attributed = {}, {}
+            for buffer_totals, buffer_attributed in buffers:
+                for target, damage in buffer_totals.items():
+                    totals[target] = totals.get(target, 0) + damage
+                for target, parts in buffer_attributed.items():
+                    merged = attributed.setdefault(target, {})
+                    for key, damage in parts.items():
+                        merged[key] = merged.get(key, 0) + damage
+        if clear:
+            for buffer_totals, buffer_attributed in buffers:
+                buffer_totals.clear()
+                buffer_attributed.clear()
+        return totals, attributed
+
+    def commit(self):
+        """Apply all pending damage; returns the number of characters updated."""
+        totals, attributed = self._merge(clear=True)
+        bulk = not damage_hooks_active()  # hooks need one take_damage() per hit
+        pooled = {}
+        writes = 0
+        for target, damage in totals.items():
+            pool = getattr(target, "_pool", None)
+            if bulk and isinstance(pool, CharacterPool):
+                entry = pooled.setdefault(id(pool), (pool, [], []))
+                entry[1].append(target.index)
+                entry[2].append(damage)
+                writes += 1
+                continue
+            for (attacker, ability), part in attributed.get(target, {}).items():
+                deliver_damage(attacker, target, part, ability)
+                damage -= part
+                writes += 1
+            if damage > 0:  # recorded while no hooks were registered
+                deliver_damage(None, target, damage, "tick")
+                writes += 1
+        for pool, indices, damages in pooled.values():
+            pool.apply_damage(indices, damages)
+        self.writes += writes
+        return len(totals)
+
+
+@contextmanager
+def deferred_damage(accumulator=None):
+    """Record attack and ability damage until commit(); commits leftovers on exit."""
+    accumulator = accumulator if accumulator is not None else DamageAccumulator()
+    previous = set_damage_router(accumulator)
+    try:
+        yield accumulator
+    finally:
+        set_damage_router(previous)
+        accumulator.commit()
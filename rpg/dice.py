@@ -0,0 +1,83 @@
+# ============================================================
+# Dice: Pluggable Random Sources for Special Abilities
+# ============================================================
+# Every dice object has the same tiny interface:
+#   roll(low, high)         -> one int in [low, high]
+#   rolls(low, high, count) -> list of ints in [low, high]
+#   spawn(stream)           -> an independent dice for one entity
+#
+# SystemDice wraps the global `random` module (the original behavior).
+# SeededDice is reproducible: the same seed and stream always give
+# the same rolls, in any process, and rolls are pre-drawn in blocks
+# so tight combat loops do not pay for one RNG call per ability.
+# ============================================================
+
+import hashlib
+import random
+
+
+# ------------------------------------------------------------
+# SystemDice: global random module
+# ------------------------------------------------------------
+class SystemDice:
+    """Dice backed by the shared, unseeded `random` module."""
+
+    def roll(self, low, high):
+        return random.randint(low, high)
+
+    def rolls(self, low, high, count):
+        return [random.randint(low, high) for _ in range(count)]
+
+    def spawn(self, stream):
+        return self
+
+
+# ------------------------------------------------------------
+# SeededDice: reproducible, block-drawn streams
+# ------------------------------------------------------------
+def stream_seed(seed, stream):
+    """Derive a 64-bit seed for one stream; stable across processes."""
+    digest = hashlib.blake2b(f"{seed}:{stream}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+class SeededDice:
+    """Reproducible dice that pre-draw rolls in blocks per range."""
+
+    def __init__(self, seed, stream=0, block_size=1024):
+        if block_size < 1:
+            raise ValueError("block_size must be at least 1")
+        self.seed = seed
+        self.stream = stream
+        self.block_size = block_size
+        self._rng = random.Random(stream_seed(seed, stream))
+        self._pending = {}  # (low, high) -> remaining pre-drawn rolls, reversed
+
+    def _refill(self, low, high):
+        pending = self._rng.choices(range(low, high + 1), k=self.block_size)
+        pending.reverse()
+        self._pending[(low, high)] = pending
+        return pending
+
+    def roll(self, low, high):
+        """Return the next roll in [low, high]."""
+        pending = self._pending.get((low, high))
+        if not pending:
+            pending = self._refill(low, high)
+        return pending.pop()
+
+    def rolls(self, low, high, count):
+        """Return the next count rolls in [low, high] (same order as roll())."""
+        result = []
+        while len(result) < count:
+            pending = self._pending.get((low, high))
+            if not pending:
+                pending = self._refill(low, high)
+            take = min(count - len(result), len(pending))
+            result.extend(reversed(pending[len(pending) - take:]))
+            del pending[len(pending) - take:]
+        return result
+
+    def spawn(self, stream):
+        """Return an independent dice for one entity or worker."""
+        return SeededDice(self.seed, stream, self.block_size)
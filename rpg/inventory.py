@@ -0,0 +1,237 @@
+# ============================================================
+# Inventory & Equipment: Indexed Item Storage
+# ============================================================
+# Every character can carry a bag of weapons and equip them in
+# slots; the "main_hand" slot is the character's weapon, so
+# equipping there changes attack and ability damage at once.
+#
+#   bag = ITEMS.inventory_for(hero)         # starts with hero.weapon
+#   bag.add(WEAPONS.intern("Flame Blade", 18))
+#   bag.equip_best()
+#   ITEMS.holders("Magic Staff")            # everyone carrying one
+#
+# Storage:
+#   - each Inventory keeps item ids and their damage bonuses in two
+#     parallel arrays sorted by bonus, so best() is the last entry
+#   - ItemIndex maps item ids to the characters carrying or wielding
+#     them, and keeps every known item sorted by damage bonus, so
+#     holder lookups are O(1) and bonus range queries O(log N)
+#
+# Items are the shared, read-only weapons from WEAPONS, numbered by
+# the index the first time they are seen.
+# ============================================================
+
+from array import array
+from bisect import bisect_left, bisect_right, insort
+
+from .core import WEAPONS
+
+SLOTS = ("main_hand", "off_hand")
+WEAPON_SLOT = "main_hand"  # the slot mirrored into character.weapon
+
+
+# ------------------------------------------------------------
+# ItemIndex
+# ------------------------------------------------------------
+class ItemIndex:
+    """Global item table plus holder and damage-bonus indexes."""
+
+    def __init__(self, registry=WEAPONS):
+        self.registry = registry
+        self.items = []          # item id -> shared weapon
+        self._ids = {}           # (name, damage_bonus) -> item id
+        self._ids_by_name = {}   # name -> [item ids]
+        self._by_bonus = []      # sorted (damage_bonus, item id)
+        self._holders = {}       # item id -> {character: copies carried}
+        self._wielders = {}      # item id -> {character: None}, in equip order
+        self._inventories = {}   # character -> Inventory
+
+    def __len__(self):
+        return len(self.items)
+
+    def item_id(self, weapon):
+        """Return the id of a weapon definition, registering it if new."""
+        key = (weapon.name, weapon.damage_bonus)
+        item_id = self._ids.get(key)
+        if item_id is None:
+            item_id = len(self.items)
+            self.items.append(self.registry.intern(*key))
+            self._ids[key] = item_id
+            self._ids_by_name.setdefault(weapon.name, []).append(item_id)
+            insort(self._by_bonus, (weapon.damage_bonus, item_id))
+            self._holders[item_id] = {}
+            self._wielders[item_id] = {}
+        return item_id
+
+    def inventory_for(self, character):
+        """Return character's Inventory, creating it on first use."""
+        inventory = self._inventories.get(character)
+        if inventory is None:
+            inventory = self._inventories[character] = Inventory(character, self)
+        return inventory
+
+    def forget(self, character):
+        """Drop a character's inventory and remove it from every index."""
+        inventory = self._inventories.pop(character, None)
+        if inventory is not None:
+            inventory.clear()
+
+    # -- queries ----------------------------------------------
+    def _collect(self, table, name):
+        ids = self._ids_by_name.get(name, ())
+        if len(ids) == 1:
+            return list(table[ids[0]])
+        found = {}
+        for item_id in ids:
+            found.update(table[item_id])
+        return list(found)
+
+    def holders(self, name):
+        """Characters carrying at least one item called name."""
+        return self._collect(self._holders, name)
+
+    def wielders(self, name):
+        """Characters with an item called name in their weapon slot."""
+        return self._collect(self._wielders, name)
+
+    def items_by_bonus(self, min_bonus=None, max_bonus=None):
+        """Known items with min_bonus <= damage_bonus <= max_bonus, weakest first."""
+        start = 0 if min_bonus is None else bisect_left(self._by_bonus, (min_bonus, -1))
+        stop = len(self._by_bonus) if max_bonus is None else bisect_right(self._by_bonus, (max_bonus, len(self.items)))
+        return [self.items[item_id] for _, item_id in self._by_bonus[start:stop]]
+
+    def strongest(self):
+        """The known item with the highest damage bonus, or None."""
+        return self.items[self._by_bonus[-1][1]] if self._by_bonus else None
+
+
+# ------------------------------------------------------------
+# Inventory
+# ------------------------------------------------------------
+class Inventory:
+    """One character's bag and equipment slots, kept in sync with an ItemIndex."""
+
+    __slots__ = ("owner", "index", "_ids", "_bonuses", "equipped")
+
+    def __init__(self, owner, index):
+        self.owner = owner
+        self.index = index
+        self._ids = array("i")       # item ids, sorted by damage bonus
+        self._bonuses = array("q")   # damage bonus of each entry in _ids
+        self.equipped = {}           # slot -> item id
+        if owner.weapon is not None:
+            self.add(owner.weapon)
+            self.equip(owner.weapon)
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __iter__(self):
+        items = self.index.items
+        return (items[item_id] for item_id in self._ids)
+
+    def __contains__(self, weapon):
+        key = (weapon.name, weapon.damage_bonus)
+        return self.index._ids.get(key, -1) in self._ids
+
+    def add(self, weapon):
+        """Put a weapon in the bag; returns the shared item stored."""
+        item_id = self.index.item_id(weapon)
+        position = bisect_right(self._bonuses, weapon.damage_bonus)
+        self._bonuses.insert(position, weapon.damage_bonus)
+        self._ids.insert(position, item_id)
+        holders = self.index._holders[item_id]
+        holders[self.owner] = holders.get(self.owner, 0) + 1
+        return self.index.items[item_id]
+
+    def remove(self, weapon):
+        """Take one copy of a weapon out of the bag, unequipping it if needed."""
+        item_id = self.index._ids.get((weapon.name, weapon.damage_bonus))
+        if item_id is None or item_id not in self._ids:
+            raise ValueError(f"{self.owner.name} is not carrying {weapon.name}")
+        position = self._ids.index(item_id)
+        del self._ids[position]
+        del self._bonuses[position]
+        holders = self.index._holders[item_id]
+        if holders[self.owner] == 1:
+            del holders[self.owner]
+            for slot, equipped in list(self.equipped.items()):
+                if equipped == item_id:
+                    self.unequip(slot)
+        else:
+            holders[self.owner] -= 1
+
+    def clear(self):
+        """Unequip and drop every item."""
+        for slot in list(self.equipped):
+            self.unequip(slot)
+        for item_id in set(self._ids):
+            del self.index._holders[item_id][self.owner]
+        self._ids = array("i")
+        self._bonuses = array("q")
+
+    def best(self):
+        """The weapon with the highest damage bonus in the bag, or None."""
+        return self.index.items[self._ids[-1]] if self._ids else None
+
+    # -- equipment --------------------------------------------
+    def equip(self, weapon, slot=WEAPON_SLOT):
+        """Equip a carried weapon; the weapon slot also sets owner.weapon."""
+        if slot not in SLOTS:
+            raise ValueError(f"slot must be one of {SLOTS}")
+        if weapon not in self:
+            raise ValueError(f"{self.owner.name} is not carrying {weapon.name}")
+        item_id = self.index._ids[(weapon.name, weapon.damage_bonus)]
+        self.unequip(slot)
+        self.equipped[slot] = item_id
+        if slot == WEAPON_SLOT:
+            self.index._wielders[item_id][self.owner] = None
+            self.owner.weapon = self.index.items[item_id]
+
+    def unequip(self, slot=WEAPON_SLOT):
+        """Empty a slot; returns the weapon that was there, or None."""
+        item_id = self.equipped.pop(slot, None)
+        if item_id is None:
+            return None
+        if slot == WEAPON_SLOT:
+            self.index._wielders[item_id].pop(self.owner, None)
+            self.owner.weapon = None
+        return self.index.items[item_id]
+
+    def equip_best(self):
+        """Equip the strongest carried weapon in the weapon slot."""
+        best = self.best()
+        if best is not None:
+            self.equip(best)
+        return best
+
+    def slot(self, slot=WEAPON_SLOT):
+        """The weapon equipped in slot, or None."""
+        item_id = self.equipped.get(slot)
+        return None if item_id is None else self.index.items[item_id]
+
+
+# Global item index shared by the whole game
+ITEMS = ItemIndex()
+
+
+# ------------------------------------------------------------
+# Example Usage (Optional Manual Test)
+# ------------------------------------------------------------
+if __name__ == "__main__":
+    from .core import Warrior, Mage, Character
+
+    hero = Warrior("Aragorn")
+    wizard = Mage("Gandalf")
+    bag = ITEMS.inventory_for(hero)
+    bag.add(WEAPONS.intern("Flame Blade", 18))
+    bag.add(WEAPONS.intern("Magic Staff", 12))
+    ITEMS.inventory_for(wizard)
+
+    print(f"Best in bag: {bag.best().name}")
+    bag.equip_best()
+    goblin = Character("Goblin", 100, 8, 0)
+    hero.attack(goblin)
+    print(f"{goblin.name}'s Health after attack: {goblin.health}")
+    print(f"Carrying a Magic Staff: {[c.name for c in ITEMS.holders('Magic Staff')]}")
+    print(f"Wielding a Magic Staff: {[c.name for c in ITEMS.wielders('Magic Staff')]}")
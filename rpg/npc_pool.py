@@ -0,0 +1,195 @@
+# ============================================================
+# NPC Pool: Recycling Short-Lived Monsters
+# ============================================================
+# Encounters create and throw away huge numbers of monsters like
+# Character("Goblin", 100, 8, 0). NPCPool keeps dead ones on a free
+# list and re-issues them, reset to fresh stats, instead of
+# allocating new objects:
+#
+#   npcs = NPCPool(capacity=4096, max_idle=30.0)
+#   goblin = npcs.acquire("Goblin", 100, 8, 0)
+#   ...fight...
+#   npcs.reclaim(encounter)        # dead monsters go back to the pool
+#
+# The free list holds at most `capacity` objects; objects idle for
+# longer than `max_idle` seconds are dropped by evict_idle() so a
+# burst of spawns does not pin memory forever.
+#
+# acquire() passes its arguments to the factory for a new object, or
+# to reset(obj, *args) for a recycled one. reset defaults to the
+# factory's __init__, so any class works with its own constructor
+# arguments, e.g. NPCPool(factory=Warrior).acquire("Boromir"); a
+# factory that is not a class needs an explicit reset. GCMonitor measures
+# collector pauses, to compare pooled and unpooled runs.
+#
+# (CharacterPool in character_pool.py is a different tool: it stores
+# long-lived characters as columns rather than recycling objects.)
+# ============================================================
+
+import gc
+import time
+from bisect import bisect_right
+
+from .core import Character
+
+
+# ------------------------------------------------------------
+# NPCPool
+# ------------------------------------------------------------
+class NPCPool:
+    """Free list of released characters, re-initialized on acquire()."""
+
+    def __init__(self, factory=Character, capacity=1024, max_idle=None, clock=time.monotonic, reset=None):
+        if capacity < 0:
+            raise ValueError("capacity must not be negative")
+        if reset is None:
+            if not isinstance(factory, type):
+                raise TypeError("a reset callable is required when factory is not a class")
+            reset = factory.__init__
+        self.factory = factory
+        self.reset = reset
+        self.capacity = capacity
+        self.max_idle = max_idle
+        self._clock = clock
+        # Free list used as a stack; _stamps[i] is when _free[i] was
+        # released, so both run from oldest (bottom) to newest (top).
+        self._free = []
+        self._stamps = []
+        self._free_ids = set()     # guards against releasing one object twice
+        self.created = 0
+        self.reused = 0
+        self.released = 0
+        self.dropped = 0           # releases refused because the pool was full
+        self.evicted = 0           # idle objects dropped by evict_idle()
+
+    def __len__(self):
+        return len(self._free)
+
+    def acquire(self, *args, weapon=None):
+        """Return factory(*args), recycled through reset() when possible."""
+        if self._free:
+            character = self._free.pop()  # most recently released: still warm in cache
+            self._stamps.pop()
+            self._free_ids.discard(id(character))
+            self.reset(character, *args)
+            self.reused += 1
+        else:
+            character = self.factory(*args)
+            self.created += 1
+        if weapon is not None:
+            character.weapon = weapon
+        return character
+
+    def _push(self, character, now):
+        if id(character) in self._free_ids:
+            return False
+        if len(self._free) >= self.capacity:
+            self.dropped += 1
+            return False
+        self._free.append(character)
+        self._stamps.append(now)
+        self._free_ids.add(id(character))
+        self.released += 1
+        return True
+
+    def release(self, character):
+        """Return a character to the pool; False if it was not kept."""
+        return self._push(character, self._clock())
+
+    def reclaim(self, characters):
+        """Release every dead (health 0) character; returns how many were kept."""
+        now = self._clock()
+        push = self._push
+        return sum(push(c, now) for c in characters if c.health == 0)
+
+    def evict_idle(self, max_idle=None):
+        """Drop free objects idle longer than max_idle seconds; returns the count."""
+        max_idle = self.max_idle if max_idle is None else max_idle
+        if max_idle is None:
+            return 0
+        evicted = bisect_right(self._stamps, self._clock() - max_idle)
+        if evicted:
+            for character in self._free[:evicted]:
+                self._free_ids.discard(id(character))
+            del self._free[:evicted]
+            del self._stamps[:evicted]
+            self.evicted += evicted
+        return evicted
+
+    def clear(self):
+        """Drop every pooled object."""
+        self._free.clear()
+        self._stamps.clear()
+        self._free_ids.clear()
+
+    def stats(self):
+        """Counters plus the share of acquire() calls served from the pool."""
+        acquired = self.created + self.reused
+        return {
+            "free": len(self._free),
+            "capacity": self.capacity,
+            "acquired": acquired,
+            "created": self.created,
+            "reused": self.reused,
+            "reuse_rate": self.reused / acquired if acquired else 0.0,
+            "released": self.released,
+            "dropped": self.dropped,
+            "evicted": self.evicted,
+        }
+
+
+# ------------------------------------------------------------
+# GC Pause Measurement
+# ------------------------------------------------------------
+class GCMonitor:
+    """Counts garbage collections and their total pause time while active."""
+
+    def __init__(self):
+        self.collections = [0, 0, 0]
+        self.pause = 0.0
+        self.max_pause = 0.0
+        self._started = None
+
+    def _callback(self, phase, info):
+        if phase == "start":
+            self._started = time.perf_counter()
+        elif self._started is not None:
+            pause = time.perf_counter() - self._started
+            self._started = None
+            self.collections[info["generation"]] += 1
+            self.pause += pause
+            if pause > self.max_pause:
+                self.max_pause = pause
+
+    def __enter__(self):
+        gc.callbacks.append(self._callback)
+        return self
+
+    def __exit__(self, *exc_info):
+        gc.callbacks.remove(self._callback)
+
+    def stats(self):
+        return {
+            "collections": sum(self.collections),
+            "by_generation": tuple(self.collections),
+            "pause_ms": self.pause * 1e3,
+            "max_pause_ms": self.max_pause * 1e3,
+        }
+
+
+# ------------------------------------------------------------
+# Example Usage (Optional Manual Test)
+# ------------------------------------------------------------
+if __name__ == "__main__":
+    from .core import Warrior
+
+    hero = Warrior("Aragorn")
+    hero.health = 10 ** 9
+    npcs = NPCPool(capacity=256)
+    for wave in range(1000):
+        encounter = [npcs.acquire(f"Goblin{i}", 100, 8, 0) for i in range(200)]
+        for goblin in encounter:
+            while goblin.health > 0:
+                hero.power_strike(goblin)
+        npcs.reclaim(encounter)
+    print(npcs.stats())
@@ -0,0 +1,202 @@
+# ============================================================
+# Combat Profiling: Per-Class, Per-Method Counters
+# ============================================================
+# Counts calls, cumulative time and damage for the combat methods
+# without wrapping a whole run in cProfile:
+#
+#   with CombatProfiler() as profiler:
+#       run_simulation()
+#   print(profiler.snapshot()["Warrior.power_strike"])
+#   print(profiler.prometheus())
+#
+# While enabled, the profiled methods are replaced by timing
+# wrappers on the classes that define them, and a damage hook adds
+# up damage per attacking class and ability (and damage received
+# per class under "take_damage"). Disabling puts the original
+# functions back, so a disabled profiler costs nothing at all.
+# Subclasses existing at enable() time are wrapped too when they
+# define a profiled method themselves (Christopher's_RPG.py, damage
+# model engines, catalog classes); a call that reaches an overridden
+# method through super() is counted once. Every object is counted
+# under its own class name. Classes that copy methods instead of
+# inheriting them (the slotted hierarchy) must be listed in `classes`.
+# Damage is only counted for methods that are actually wrapped, so a
+# class created after enable() shows neither calls nor damage.
+#
+# Times are cumulative: attack() includes the take_damage() it
+# triggers. Counters are not locked, so totals from many threads
+# hitting the same method at once may be slightly low.
+# ============================================================
+
+import threading
+import time
+
+from .core import Character, Warrior, Mage, Rogue, add_damage_hook, remove_damage_hook
+
+PROFILED_METHODS = ("attack", "take_damage", "power_strike", "fireball", "sneak_attack")
+PROFILED_CLASSES = (Character, Warrior, Mage, Rogue)
+
+_active = None  # the enabled profiler; methods can only be wrapped once
+
+
+def _with_subclasses(classes):
+    """classes plus all of their subclasses, each listed once."""
+    seen = {}
+    pending = list(classes)
+    while pending:
+        cls = pending.pop(0)
+        if cls not in seen:
+            seen[cls] = None
+            pending.extend(cls.__subclasses__())
+    return list(seen)
+
+
+class CombatProfiler:
+    """Opt-in call / time / damage counters keyed by (class name, method)."""
+
+    def __init__(self, classes=PROFILED_CLASSES, methods=PROFILED_METHODS):
+        self.classes = tuple(classes)
+        self.methods = tuple(methods)
+        self._stats = {}       # (class name, method) -> [calls, seconds, damage]
+        self._originals = []   # (class, method name, original function)
+        self._local = threading.local()  # .running: {(id(obj), method)} being timed
+
+    # -- lifecycle --------------------------------------------
+    @property
+    def enabled(self):
+        return bool(self._originals)
+
+    def enable(self):
+        """Wrap the profiled methods and start counting."""
+        global _active
+        if _active is self:
+            return self
+        if _active is not None:
+            raise RuntimeError("another CombatProfiler is already enabled")
+        for cls in _with_subclasses(self.classes):
+            for method in self.methods:
+                original = cls.__dict__.get(method)
+                if callable(original):
+                    self._originals.append((cls, method, original))
+                    setattr(cls, method, self._wrap(original, method))
+        add_damage_hook(self._on_damage)
+        _active = self
+        return self
+
+    def disable(self):
+        """Restore the original methods; counters are kept."""
+        global _active
+        if _active is not self:
+            return
+        remove_damage_hook(self._on_damage)
+        for cls, method, original in reversed(self._originals):
+            setattr(cls, method, original)
+        self._originals = []
+        _active = None
+
+    def __enter__(self):
+        return self.enable()
+
+    def __exit__(self, *exc_info):
+        self.disable()
+
+    def reset(self):
+        """Zero every counter."""
+        self._stats.clear()
+
+    # -- recording --------------------------------------------
+    def _entry(self, key):
+        entry = self._stats.get(key)
+        if entry is None:
+            entry = self._stats[key] = [0, 0.0, 0]
+        return entry
+
+    def _wrap(self, function, method):
+        entry_for, perf_counter, local = self._entry, time.perf_counter, self._local
+
+        def timed(obj, *args, **kwargs):
+            running = getattr(local, "running", None)
+            if running is None:
+                running = local.running = set()
+            key = (id(obj), method)
+            if key in running:  # reached again through super(): already timed
+                return function(obj, *args, **kwargs)
+            running.add(key)
+            started = perf_counter()
+            try:
+                return function(obj, *args, **kwargs)
+            finally:
+                running.discard(key)
+                entry = entry_for((type(obj).__name__, method))
+                entry[0] += 1
+                entry[1] += perf_counter() - started
+
+        timed.__name__ = function.__name__
+        timed.__doc__ = function.__doc__
+        timed.__wrapped__ = function
+        timed.profiler = self
+        return timed
+
+    def _profiled(self, obj, method):
+        return getattr(getattr(type(obj), method, None), "profiler", None) is self
+
+    def _on_damage(self, attacker, target, ability, damage):
+        if damage <= 0:
+            return
+        if self._profiled(target, "take_damage"):
+            self._entry((type(target).__name__, "take_damage"))[2] += damage
+        if attacker is not None and self._profiled(attacker, ability):
+            self._entry((type(attacker).__name__, ability))[2] += damage
+
+    # -- export -----------------------------------------------
+    def snapshot(self):
+        """Counters as {"Class.method": {"calls", "seconds", "damage"}}."""
+        return {
+            f"{cls}.{method}": {"calls": calls, "seconds": seconds, "damage": damage}
+            for (cls, method), (calls, seconds, damage) in sorted(self._stats.items())
+        }
+
+    def by_method(self):
+        """Counters summed over classes, as {method: {"calls", "seconds", "damage"}}."""
+        totals = {}
+        for (_, method), (calls, seconds, damage) in self._stats.items():
+            total = totals.setdefault(method, {"calls": 0, "seconds": 0.0, "damage": 0})
+            total["calls"] += calls
+            total["seconds"] += seconds
+            total["damage"] += damage
+        return dict(sorted(totals.items()))
+
+    def prometheus(self, prefix="rpg"):
+        """Counters in the Prometheus text exposition format."""
+        metrics = (
+            ("calls_total", 0, "Calls per class and method."),
+            ("seconds_total", 1, "Cumulative seconds spent per class and method."),
+            ("damage_total", 2, "Damage dealt per attacking class and ability; take_damage counts damage received."),
+        )
+        stats = sorted(self._stats.items())
+        lines = []
+        for suffix, column, help_text in metrics:
+            name = f"{prefix}_method_{suffix}"
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} counter")
+            for (cls, method), values in stats:
+                lines.append(f'{name}{{class="{cls}",method="{method}"}} {values[column]}')
+        return "\n".join(lines) + "\n"
+
+
+# ------------------------------------------------------------
+# Example Usage (Optional Manual Test)
+# ------------------------------------------------------------
+if __name__ == "__main__":
+    party = [Warrior("Aragorn"), Mage("Gandalf"), Rogue("Bilbo")]
+    boss = Character("Balrog", 10 ** 9, 40, 40)
+    with CombatProfiler() as profiler:
+        for _ in range(10_000):
+            for hero in party:
+                hero.attack(boss)
+            party[0].power_strike(boss)
+            party[1].fireball(boss)
+            party[2].sneak_attack(boss)
+    for method, totals in profiler.by_method().items():
+        print(f"{method:<14}{totals['calls']:>8}{totals['seconds'] * 1e3:>10.1f} ms{totals['damage']:>12}")
+    print(profiler.prometheus(), end="")
@@ -0,0 +1,139 @@
+# ============================================================
+# Progression: Kill Experience and Batched Level-Ups
+# ============================================================
+# Players gain experience for kills while a KillExperience tracker
+# is attached (it uses the damage hooks in core.py):
+#
+#   with KillExperience() as kills:
+#       hero.attack(goblin)           # the killing blow awards XP
+#
+# award_experience() hands out experience to a whole roster at once,
+# e.g. at the end of a quest. Every new level is one bisect into the
+# precomputed XP_CURVE, and pooled characters are updated column-wise
+# through CharacterPool.award_experience(). Only players gain
+# experience: plain Characters, as objects or pool rows, are skipped.
+# ============================================================
+
+from numbers import Number
+from weakref import WeakSet
+
+from .core import (add_damage_hook, remove_damage_hook,
+                              kill_experience, level_for_experience)
+from .character_pool import CharacterPool
+
+
+# ------------------------------------------------------------
+# Kill Experience
+# ------------------------------------------------------------
+class KillExperience:
+    """Awards kill_experience(target) to whoever lands a killing blow."""
+
+    def __init__(self):
+        self._attached = False
+        # Dead targets whose kill was already awarded. Weak, so targets
+        # that are never revived do not pile up. Pool handles (views
+        # made on every access) and slotted objects (no weak references)
+        # are kept in _pinned until revived or the tracker detaches.
+        self._credited = WeakSet()
+        self._pinned = set()
+        self.kills = 0
+        self.awarded = 0
+
+    def attach(self):
+        """Start awarding experience for kills."""
+        if not self._attached:
+            add_damage_hook(self._on_damage)
+            self._attached = True
+        return self
+
+    def detach(self):
+        """Stop awarding experience."""
+        if self._attached:
+            remove_damage_hook(self._on_damage)
+            self._attached = False
+        self._credited.clear()
+        self._pinned.clear()
+
+    def __enter__(self):
+        return self.attach()
+
+    def __exit__(self, *exc_info):
+        self.detach()
+
+    def _on_damage(self, attacker, target, ability, damage):
+        if target.health > 0:
+            # Alive again (healed or recycled): a later death counts anew
+            if self._pinned:
+                self._pinned.discard(target)
+            if target in self._credited:
+                self._credited.discard(target)
+            return
+        if damage <= 0 or target in self._credited or target in self._pinned:
+            return
+        if getattr(target, "_pool", None) is not None:
+            self._pinned.add(target)
+        else:
+            try:
+                self._credited.add(target)
+            except TypeError:
+                self._pinned.add(target)
+        gain = getattr(attacker, "gain_experience", None)
+        if gain is not None:
+            amount = kill_experience(target)
+            gain(amount)
+            self.kills += 1
+            self.awarded += amount
+
+
+# ------------------------------------------------------------
+# Batched Awards
+# ------------------------------------------------------------
+def award_experience(players, amounts):
+    """Give experience to many players; returns those that levelled up.
+
+    amounts is one number for everybody or one number per player;
+    fractional amounts are rounded down to whole experience points, as
+    in the pool columns. Non-players in the roster are skipped.
+    """
+    players = list(players)
+    if isinstance(amounts, Number):
+        amounts = [amounts] * len(players)
+    elif len(amounts) != len(players):
+        raise ValueError("players and amounts must have the same length")
+    levelled = []
+    pooled = {}
+    for player, amount in zip(players, amounts):
+        pool = getattr(player, "_pool", None)
+        if isinstance(pool, CharacterPool):
+            entry = pooled.setdefault(id(pool), (pool, [], [], {}))
+            entry[1].append(player.index)
+            entry[2].append(amount)
+            entry[3][player.index] = player
+            continue
+        if getattr(player, "level_up", None) is None:
+            continue
+        player.experience += int(amount)
+        gained = level_for_experience(player.experience) - player.level
+        if gained > 0:
+            player.level_up(gained)
+            levelled.append(player)
+    for pool, indices, pool_amounts, handles in pooled.values():
+        levelled.extend(handles[index] for index in pool.award_experience(indices, pool_amounts))
+    return levelled
+
+
+# ------------------------------------------------------------
+# Example Usage (Optional Manual Test)
+# ------------------------------------------------------------
+if __name__ == "__main__":
+    from .core import Warrior, Character
+
+    hero = Warrior("Aragorn")
+    with KillExperience():
+        for i in range(3):
+            goblin = Character(f"Goblin{i}", 30, 5, 0)
+            hero.power_strike(goblin)
+    hero.display_stats()
+
+    party = [Warrior("W"), Warrior("X")]
+    print(f"Levelled up: {[p.name for p in award_experience(party, 1000)]}")
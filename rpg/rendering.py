@@ -0,0 +1,89 @@
+# ============================================================
+# Roster Rendering: Buffered, Batched Stat Output
+# ============================================================
+# display_stats() is fine for one character, but printing a roster
+# of thousands line by line is dominated by stdout writes. These
+# helpers format many characters into one string and write it with
+# a single call:
+#
+#   render(roster)                    # display_stats() blocks
+#   render(roster, fmt="table")       # aligned text table
+#   render(roster, fmt="jsonl")       # one JSON object per line
+#   render(roster, fmt="csv")         # CSV with a header row
+# ============================================================
+
+import csv
+import io
+import json
+import sys
+
+FIELDS = ("name", "class", "health", "strength", "magic", "weapon", "weapon_bonus")
+
+
+def stat_record(character):
+    """Return one character's stats as a dict keyed by FIELDS."""
+    weapon = character.weapon
+    return {
+        "name": character.name,
+        "class": getattr(character, "character_class", type(character).__name__),
+        "health": character.health,
+        "strength": character.strength,
+        "magic": character.magic,
+        "weapon": weapon.name if weapon else None,
+        "weapon_bonus": weapon.damage_bonus if weapon else 0,
+    }
+
+
+# ------------------------------------------------------------
+# Formatters (each returns one string)
+# ------------------------------------------------------------
+def format_text(characters):
+    """The display_stats() output of every character, concatenated."""
+    return "".join("\n".join(character.stat_lines()) + "\n" for character in characters)
+
+
+def format_table(characters):
+    """An aligned text table with one row per character."""
+    rows = [[str(value) if value is not None else "-" for value in stat_record(c).values()]
+            for c in characters]
+    header = [field.title().replace("_", " ") for field in FIELDS]
+    widths = [max([len(cell) for cell in column]) for column in zip(header, *rows)]
+    lines = ["  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip()
+             for row in [header, *rows]]
+    lines.insert(1, "  ".join("-" * width for width in widths))
+    return "\n".join(lines) + "\n"
+
+
+def format_jsonl(characters):
+    """One JSON object per character, one per line."""
+    return "".join(json.dumps(stat_record(character)) + "\n" for character in characters)
+
+
+def format_csv(characters):
+    """CSV text with a header row."""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=FIELDS, lineterminator="\n")
+    writer.writeheader()
+    writer.writerows(stat_record(character) for character in characters)
+    return buffer.getvalue()
+
+
+FORMATTERS = {
+    "text": format_text,
+    "table": format_table,
+    "jsonl": format_jsonl,
+    "csv": format_csv,
+}
+
+
+def render(characters, fmt="text", stream=None):
+    """Format every character and write the result with one write() call.
+
+    Writes to stdout unless another stream is given; returns the text length.
+    """
+    formatter = FORMATTERS.get(fmt)
+    if formatter is None:
+        raise ValueError(f"Unknown format {fmt!r}; expected one of {sorted(FORMATTERS)}")
+    text = formatter(characters)
+    (stream if stream is not None else sys.stdout).write(text)
+    return len(text)
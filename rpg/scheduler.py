@@ -0,0 +1,148 @@
+# ============================================================
+# Battle Scheduler: Speed-Based Turn Order on a Heap
+# ============================================================
+# Every actor has a speed; it takes a turn every 1 / speed time
+# units. All pending work lives in one heap of timed events:
+#   TURN   -> the actor acts (special ability if ready, else attack)
+#   READY  -> a special ability comes off cooldown
+#
+# Dead characters (health 0 after take_damage) are skipped lazily:
+# their next TURN event is simply dropped when it reaches the top of
+# the heap, and dead targets are discarded from the front of each
+# team's queue when next looked at. Nothing is ever rescanned.
+# ============================================================
+
+import heapq
+import itertools
+import time
+from collections import deque
+
+TURN = 0
+READY = 1
+
+# Special ability of each class and its cooldown in time units
+SPECIAL_ABILITIES = {
+    "Warrior": "power_strike",
+    "Mage": "fireball",
+    "Rogue": "sneak_attack",
+}
+COOLDOWNS = {
+    "power_strike": 3.0,
+    "fireball": 4.0,
+    "sneak_attack": 2.5,
+}
+
+
+class _Actor:
+    """Scheduler bookkeeping for one character."""
+
+    __slots__ = ("character", "team", "interval", "ability", "cooldown", "ready")
+
+    def __init__(self, character, team, speed, ability, cooldown):
+        self.character = character
+        self.team = team
+        self.interval = 1.0 / speed
+        self.ability = ability      # bound special-ability method or None
+        self.cooldown = cooldown
+        self.ready = ability is not None
+
+
+# ------------------------------------------------------------
+# BattleScheduler
+# ------------------------------------------------------------
+class BattleScheduler:
+    """Runs a multi-team battle in initiative order."""
+
+    def __init__(self, cooldowns=None):
+        self.cooldowns = dict(COOLDOWNS if cooldowns is None else cooldowns)
+        self.now = 0.0
+        self.actions = 0
+        self.ability_uses = 0
+        self._events = []
+        self._sequence = itertools.count()
+        self._teams = {}    # team -> deque of members; dead ones are pruned from the front
+
+    def add(self, character, team, speed=1.0, start=None):
+        """Schedule character on team; its first turn is at start (default: one interval)."""
+        if speed <= 0:
+            raise ValueError("speed must be positive")
+        ability_name = SPECIAL_ABILITIES.get(getattr(character, "character_class", None))
+        ability = getattr(character, ability_name, None) if ability_name else None
+        actor = _Actor(character, team, speed, ability, self.cooldowns.get(ability_name, 0.0))
+        self._teams.setdefault(team, deque()).append(character)
+        first_turn = self.now + actor.interval if start is None else start
+        self._push(first_turn, TURN, actor)
+        return actor
+
+    def _push(self, when, kind, actor):
+        heapq.heappush(self._events, (when, next(self._sequence), kind, actor))
+
+    def _front(self, team):
+        """First living member of team, discarding the dead ahead of it."""
+        members = self._teams[team]
+        while members and members[0].health <= 0:
+            members.popleft()
+        return members[0] if members else None
+
+    def _target_for(self, team):
+        """First living member of any other team."""
+        for other in self._teams:
+            if other != team:
+                target = self._front(other)
+                if target is not None:
+                    return target
+        return None
+
+    def living_teams(self):
+        """Teams with at least one living member."""
+        return [team for team in self._teams if self._front(team) is not None]
+
+    def step(self, until=None):
+        """Process events up to the next action; returns False when none is due."""
+        while self._events:
+            if until is not None and self._events[0][0] > until:
+                return False
+            when, _, kind, actor = heapq.heappop(self._events)
+            self.now = when
+            if kind == READY:
+                actor.ready = True
+                continue
+            if actor.character.health <= 0:
+                continue  # dead actors drop out here, lazily
+            target = self._target_for(actor.team)
+            if target is None:
+                self._push(when, TURN, actor)  # keep the turn in case enemies join later
+                return False
+            if actor.ready:
+                actor.ability(target)
+                actor.ready = False
+                self.ability_uses += 1
+                self._push(when + actor.cooldown, READY, actor)
+            else:
+                actor.character.attack(target)
+            self.actions += 1
+            self._push(when + actor.interval, TURN, actor)
+            return True
+        return False
+
+    def run(self, until=None, max_actions=None):
+        """Run until one team is left standing, time passes until, or max_actions.
+
+        Returns a dict with the action count, simulated time and throughput.
+        """
+        started = time.perf_counter()
+        first_action = self.actions
+        while max_actions is None or self.actions - first_action < max_actions:
+            if not self.step(until):
+                break
+        elapsed = time.perf_counter() - started
+        actions = self.actions - first_action
+        teams = self.living_teams()
+        return {
+            "actions": actions,
+            "ability_uses": self.ability_uses,
+            "time": self.now,
+            "seconds": elapsed,
+            "actions_per_second": actions / elapsed if elapsed > 0 else float("inf"),
+            "winner": teams[0] if len(teams) == 1 else None,
+        }
@@ -0,0 +1,165 @@
+# ============================================================
+# Monte Carlo Balance Simulator
+# ============================================================
+# Runs many independent duels between character classes of the
+# random-damage model (Christopher's_RPG.py) and aggregates:
+#   - win / loss / draw counts
+#   - turn-count histogram
+#   - damage-per-action histogram for each side
+#
+# Duels are split into fixed-size chunks. Chunk k always uses dice
+# stream k, so results depend only on the seed, never on how many
+# worker processes ran the chunks.
+# ============================================================
+
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from .dice import SeededDice
+from . import load_random_model
+
+# Special ability used by each class
+SPECIAL_ABILITIES = {
+    "Warrior": "power_strike",
+    "Mage": "fireball",
+    "Rogue": "sneak_attack",
+}
+
+# ------------------------------------------------------------
+# Results
+# ------------------------------------------------------------
+class MatchupResult:
+    """Aggregated outcome of many duels between two classes."""
+
+    def __init__(self, first, second):
+        self.first = first
+        self.second = second
+        self.first_wins = 0
+        self.second_wins = 0
+        self.draws = 0
+        self.turns = Counter()          # turns taken -> number of duels
+        self.first_damage = Counter()   # damage per action -> count
+        self.second_damage = Counter()
+
+    @property
+    def duels(self):
+        return self.first_wins + self.second_wins + self.draws
+
+    def win_rate(self):
+        """Fraction of duels won by the first class."""
+        return self.first_wins / self.duels if self.duels else 0.0
+
+    def merge(self, other):
+        """Add another result for the same matchup into this one."""
+        self.first_wins += other.first_wins
+        self.second_wins += other.second_wins
+        self.draws += other.draws
+        self.turns.update(other.turns)
+        self.first_damage.update(other.first_damage)
+        self.second_damage.update(other.second_damage)
+        return self
+
+    def summary(self):
+        """Return the headline numbers as a plain dict."""
+        total_turns = sum(turns * count for turns, count in self.turns.items())
+        return {
+            "matchup": f"{self.first} vs {self.second}",
+            "duels": self.duels,
+            "first_win_rate": self.win_rate(),
+            "second_win_rate": self.second_wins / self.duels if self.duels else 0.0,
+            "draw_rate": self.draws / self.duels if self.duels else 0.0,
+            "mean_turns": total_turns / self.duels if self.duels else 0.0,
+        }
+
+
+# ------------------------------------------------------------
+# Duels
+# ------------------------------------------------------------
+def duel(first, second, result, special_every=3, max_turns=200, first_moves=True):
+    """Fight one duel between two characters and record it in result.
+
+    Each side uses its special ability on every special_every-th turn
+    of its own and a basic attack otherwise.
+    """
+    fighters = [(first, second, result.first_damage), (second, first, result.second_damage)]
+    if not first_moves:
+        fighters.reverse()
+    specials = [getattr(actor, SPECIAL_ABILITIES[actor.character_class]) for actor, _, _ in fighters]
+    for turn in range(max_turns):
+        side = turn & 1
+        actor, target, damage_log = fighters[side]
+        before = target.health
+        if (turn >> 1) % special_every == special_every - 1:
+            specials[side](target)
+        else:
+            actor.attack(target)
+        damage_log[before - target.health] += 1
+        if target.health == 0:
+            result.turns[turn + 1] += 1
+            if actor is first:
+                result.first_wins += 1
+            else:
+                result.second_wins += 1
+            return
+    result.turns[max_turns] += 1
+    result.draws += 1
+
+
+def run_chunk(first, second, seed, chunk, count, special_every=3, max_turns=200):
+    """Run count duels with dice stream chunk and return their MatchupResult."""
+    model = load_random_model()
+    first_cls = getattr(model, first)
+    second_cls = getattr(model, second)
+    dice = SeededDice(seed, stream=chunk)
+    result = MatchupResult(first, second)
+    for index in range(count):
+        duel(first_cls(first, dice=dice), second_cls(second, dice=dice), result,
+             special_every, max_turns, first_moves=index % 2 == 0)
+    return result
+
+
+def _run_chunk_args(args):
+    return run_chunk(*args)
+
+
+def simulate_matchups(matchups, duels=10_000, seed=0, workers=None,
+                      chunk_size=2_000, special_every=3, max_turns=200):
+    """Simulate duels for every (first, second) class pair.
+
+    Chunks are fanned out over a ProcessPoolExecutor (workers=None uses
+    every core, workers=0 runs in this process). Returns a dict mapping
+    each pair to its merged MatchupResult.
+    """
+    for first, second in matchups:
+        for name in (first, second):
+            if name not in SPECIAL_ABILITIES:
+                raise ValueError(f"Unknown character class: {name}")
+    tasks = []
+    for pair_index, (first, second) in enumerate(matchups):
+        for start in range(0, duels, chunk_size):
+            # Every (pair, chunk) gets its own dice stream
+            chunk = pair_index * (duels // chunk_size + 1) + start // chunk_size
+            count = min(chunk_size, duels - start)
+            tasks.append((first, second, seed, chunk, count, special_every, max_turns))
+
+    results = {tuple(pair): MatchupResult(*pair) for pair in matchups}
+    if workers == 0:
+        _merge_into(results, map(_run_chunk_args, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            _merge_into(results, executor.map(_run_chunk_args, tasks))
+    return results
+
+
+def _merge_into(results, partials):
+    for partial in partials:
+        results[(partial.first, partial.second)].merge(partial)
+
+
+# ------------------------------------------------------------
+# Example Usage (Optional Manual Test)
+# ------------------------------------------------------------
+if __name__ == "__main__":
+    pairs = [("Warrior", "Mage"), ("Warrior", "Rogue"), ("Mage", "Rogue")]
+    for outcome in simulate_matchups(pairs, duels=20_000, seed=1).values():
+        print(outcome.summary())
@@ -0,0 +1,173 @@
+# ============================================================
+# Slotted Character Hierarchy
+# ============================================================
+# Same classes and behavior as core.py, but every
+# class declares __slots__ so instances carry no per-object
+# __dict__. Methods are borrowed from the regular classes, so the
+# two hierarchies can never drift apart in their combat formulas.
+# Starting weapons are read-only and interned in SLOTTED_WEAPONS, so
+# all Warriors share one sword, as with the regular classes.
+#
+# Pick a representation at startup with select_classes():
+#   classes = select_classes(slotted=True)
+#   hero = classes.Warrior("Aragorn")
+# ============================================================
+
+import os
+from types import SimpleNamespace
+
+from . import core as regular
+
+
+# ------------------------------------------------------------
+# Base Class: SlottedCharacter
+# ------------------------------------------------------------
+class SlottedCharacter:
+    """Base class for all characters, without a per-instance __dict__."""
+
+    __slots__ = ("name", "health", "strength", "magic", "weapon", "position")
+
+    def __init__(self, name, health, strength, magic):
+        self.name = name
+        self.health = health
+        self.strength = strength
+        self.magic = magic
+        self.weapon = None  # Composition: may hold a SlottedWeapon object
+        self.position = None
+
+    damage_table = regular.Character.damage_table
+    take_damage = regular.Character.take_damage
+    _deal = regular.Character._deal
+    attack = regular.Character.attack
+    stat_lines = regular.Character.stat_lines
+    display_stats = regular.Character.display_stats
+
+
+# ------------------------------------------------------------
+# Composition Class: SlottedWeapon
+# ------------------------------------------------------------
+class SlottedWeapon:
+    """A weapon held by a character, without a per-instance __dict__."""
+
+    __slots__ = ("name", "damage_bonus")
+
+    def __init__(self, name, damage_bonus):
+        self.name = name
+        self.damage_bonus = damage_bonus
+
+    display_info = regular.Weapon.display_info
+
+
+class SlottedSharedWeapon(SlottedWeapon):
+    """A read-only SlottedWeapon that many characters can hold at once."""
+
+    __slots__ = ()
+
+    def __init__(self, name, damage_bonus):
+        object.__setattr__(self, "name", name)
+        object.__setattr__(self, "damage_bonus", damage_bonus)
+
+    __setattr__ = regular.SharedWeapon.__setattr__
+    __delattr__ = regular.SharedWeapon.__delattr__
+
+
+# Registry for the starting weapons of the slotted Player subclasses
+SLOTTED_WEAPONS = regular.WeaponRegistry(SlottedSharedWeapon)
+
+
+# ------------------------------------------------------------
+# Derived Class: SlottedPlayer
+# ------------------------------------------------------------
+class SlottedPlayer(SlottedCharacter):
+    """A player character with a class type, level and experience."""
+
+    __slots__ = ("character_class", "level", "experience")
+
+    def __init__(self, name, health, strength, magic, character_class, level=1):
+        if not 1 <= level <= regular.MAX_LEVEL:
+            raise ValueError(f"level must be between 1 and {regular.MAX_LEVEL}, not {level}")
+        super().__init__(name, health, strength, magic)
+        self.character_class = character_class
+        self.level = level
+        self.experience = regular.XP_CURVE[level - 1]
+
+    gain_experience = regular.Player.gain_experience
+    level_up = regular.Player.level_up
+
+    def stat_lines(self):
+        """Show all inherited stats plus class, level and experience."""
+        lines = super().stat_lines()
+        lines.append(f"Class: {self.character_class}")
+        lines.append(f"Level: {self.level}")
+        lines.append(f"Experience: {self.experience}")
+        return lines
+
+
+# ------------------------------------------------------------
+# Subclasses: SlottedWarrior, SlottedMage, SlottedRogue
+# ------------------------------------------------------------
+class SlottedWarrior(SlottedPlayer):
+    """Warrior: Strong and durable with a powerful melee ability."""
+
+    __slots__ = ()
+
+    def __init__(self, name, level=1):
+        super().__init__(name, health=150, strength=15, magic=3, character_class="Warrior", level=level)
+        self.weapon = SLOTTED_WEAPONS.intern("Iron Sword", 10)
+
+    damage_table = regular.Warrior.damage_table
+    attack = regular.Warrior.attack
+    power_strike = regular.Warrior.power_strike
+
+
+class SlottedMage(SlottedPlayer):
+    """Mage: Fragile but capable of high magic damage."""
+
+    __slots__ = ()
+
+    def __init__(self, name, level=1):
+        super().__init__(name, health=80, strength=5, magic=20, character_class="Mage", level=level)
+        self.weapon = SLOTTED_WEAPONS.intern("Magic Staff", 12)
+
+    damage_table = regular.Mage.damage_table
+    attack = regular.Mage.attack
+    fireball = regular.Mage.fireball
+
+
+class SlottedRogue(SlottedPlayer):
+    """Rogue: Agile and precise, specializes in critical sneak attacks."""
+
+    __slots__ = ()
+
+    def __init__(self, name, level=1):
+        super().__init__(name, health=100, strength=10, magic=8, character_class="Rogue", level=level)
+        self.weapon = SLOTTED_WEAPONS.intern("Steel Dagger", 8)
+
+    damage_table = regular.Rogue.damage_table
+    attack = regular.Rogue.attack
+    sneak_attack = regular.Rogue.sneak_attack
+
+
+# ------------------------------------------------------------
+# Representation Selection
+# ------------------------------------------------------------
+REGULAR_CLASSES = SimpleNamespace(
+    Character=regular.Character, Player=regular.Player, Warrior=regular.Warrior,
+    Mage=regular.Mage, Rogue=regular.Rogue, Weapon=regular.Weapon,
+)
+
+SLOTTED_CLASSES = SimpleNamespace(
+    Character=SlottedCharacter, Player=SlottedPlayer, Warrior=SlottedWarrior,
+    Mage=SlottedMage, Rogue=SlottedRogue, Weapon=SlottedWeapon,
+)
+
+
+def select_classes(slotted=None):
+    """Return the class namespace to build characters from.
+
+    When slotted is None the RPG_SLOTTED environment variable decides
+    ("1", "true" or "yes" selects the slotted hierarchy).
+    """
+    if slotted is None:
+        slotted = os.environ.get("RPG_SLOTTED", "").lower() in ("1", "true", "yes")
+    return SLOTTED_CLASSES if slotted else REGULAR_CLASSES
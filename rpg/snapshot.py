@@ -0,0 +1,260 @@
+# ============================================================
+# World Snapshots: Fixed-Width Binary Format + mmap Loading
+# ============================================================
+# Layout (little-endian, every section padded to 8 bytes):
+#
+#   header          struct HEADER (magic, version, counts)
+#   health          int64   * count
+#   strength        int64   * count
+#   magic           int64   * count
+#   experience      int64   * count
+#   levels          int16   * count
+#   weapon_ids      int32   * count   (-1 = no weapon)
+#   class_ids       int8    * count   (index into the class table)
+#   weapon_bonus    int64   * weapons
+#   string_offsets  uint64  * (strings + 1)
+#   string_data     utf-8 bytes
+#
+# The string table holds, in order: every character name, every
+# class name, every weapon name. Weapons are stored once, no matter
+# how many characters hold them. Version 1 files (written before
+# levels were stored) still load, with every character at level 1.
+#
+# Snapshot() maps the file with mmap and exposes the stat columns as
+# zero-copy memoryviews; characters are only decoded when accessed.
+# ============================================================
+
+import mmap
+import struct
+import sys
+from array import array
+
+from .core import Character, Warrior, Mage, Rogue, WEAPONS
+from .character_pool import CharacterPool, CLASS_NAMES, NO_WEAPON
+
+MAGIC = b"RPGSNAP1"
+VERSION = 2
+
+# magic, version, count, weapons, classes, strings
+HEADER = struct.Struct("<8sIQQQQ")
+
+# Classes rebuilt by Snapshot.__getitem__; anything else becomes a Character
+_PLAYER_CLASSES = {"Warrior": Warrior, "Mage": Mage, "Rogue": Rogue}
+
+
+class SnapshotError(ValueError):
+    """Raised when a file is not a valid snapshot."""
+
+
+def _pad(size):
+    return (size + 7) & ~7
+
+
+def _column_bytes(column):
+    """Little-endian bytes of an array column."""
+    if sys.byteorder == "big":
+        column = array(column.typecode, column)
+        column.byteswap()
+    return column.tobytes()
+
+
+def _copy_column(column, view):
+    """Append a snapshot column (memoryview or array) to an array with one memcpy."""
+    if isinstance(view, memoryview):
+        with view.cast("B") as raw:
+            column.frombytes(raw)
+    else:
+        column.frombytes(view)
+
+
+# ------------------------------------------------------------
+# Writing
+# ------------------------------------------------------------
+def write_snapshot(path, world):
+    """Write a CharacterPool (or any iterable of Characters) to path.
+
+    Objects are stored as their nearest Character, Warrior, Mage or
+    Rogue base class (see CharacterPool.add_character). Returns the
+    number of characters written.
+    """
+    if isinstance(world, CharacterPool):
+        pool = world
+    else:
+        pool = CharacterPool()
+        for character in world:
+            pool.add_character(character)
+
+    count = len(pool)
+    strings = pool.names + list(CLASS_NAMES) + [weapon.name for weapon in pool.weapons]
+    encoded = [text.encode("utf-8") for text in strings]
+    offsets = array("Q", [0])
+    position = 0
+    for blob in encoded:
+        position += len(blob)
+        offsets.append(position)
+    bonuses = array("q", [weapon.damage_bonus for weapon in pool.weapons])
+
+    sections = [
+        _column_bytes(pool.health),
+        _column_bytes(pool.strength),
+        _column_bytes(pool.magic),
+        _column_bytes(pool.experience),
+        _column_bytes(pool.levels),
+        _column_bytes(pool.weapon_ids),
+        _column_bytes(pool.class_ids),
+        _column_bytes(bonuses),
+        _column_bytes(offsets),
+        b"".join(encoded),
+    ]
+    with open(path, "wb") as handle:
+        handle.write(HEADER.pack(MAGIC, VERSION, count, len(pool.weapons),
+                                 len(CLASS_NAMES), len(strings)))
+        for section in sections:
+            handle.write(section)
+            handle.write(b"\0" * (_pad(len(section)) - len(section)))
+    return count
+
+
+# ------------------------------------------------------------
+# Reading
+# ------------------------------------------------------------
+class Snapshot:
+    """Read-only, memory-mapped view of a snapshot file."""
+
+    def __init__(self, path):
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise SnapshotError(f"{path} is empty")
+        if len(self._map) < HEADER.size:
+            self.close()
+            raise SnapshotError(f"{path} is too short to be a snapshot")
+        magic, version, count, weapons, classes, strings = HEADER.unpack_from(self._map)
+        if magic != MAGIC or not 1 <= version <= VERSION:
+            self.close()
+            raise SnapshotError(f"{path} is not a version 1-{VERSION} snapshot")
+        self.count = count
+        self._views = []
+        offset = HEADER.size
+        self.health, offset = self._column(offset, "q", count)
+        self.strength, offset = self._column(offset, "q", count)
+        self.magic, offset = self._column(offset, "q", count)
+        if version >= 2:
+            self.experience, offset = self._column(offset, "q", count)
+            self.levels, offset = self._column(offset, "h", count)
+        else:
+            self.experience = array("q", [0]) * count
+            self.levels = array("h", [1]) * count
+        self.weapon_ids, offset = self._column(offset, "i", count)
+        self.class_ids, offset = self._column(offset, "b", count)
+        self._bonuses, offset = self._column(offset, "q", weapons)
+        self._offsets, offset = self._column(offset, "Q", strings + 1)
+        self._strings = offset
+        self._classes = [self._string(count + i) for i in range(classes)]
+        self._weapons = [WEAPONS.intern(self._string(count + classes + i), self._bonuses[i])
+                         for i in range(weapons)]
+
+    def _column(self, offset, typecode, length):
+        size = length * array(typecode).itemsize
+        if offset + size > len(self._map):
+            self.close()
+            raise SnapshotError("snapshot is truncated")
+        raw = memoryview(self._map)[offset:offset + size]
+        if sys.byteorder == "big":
+            view = array(typecode, raw.tobytes())
+            view.byteswap()
+            raw.release()
+        else:
+            view = raw.cast(typecode)
+            self._views.extend((raw, view))
+        return view, offset + _pad(size)
+
+    def _string(self, index):
+        start = self._strings + self._offsets[index]
+        end = self._strings + self._offsets[index + 1]
+        return self._map[start:end].decode("utf-8")
+
+    def __len__(self):
+        return self.count
+
+    def name(self, index):
+        """Name of the character at index."""
+        if not 0 <= index < self.count:
+            raise IndexError("character index out of range")
+        return self._string(index)
+
+    def class_name(self, index):
+        """Class name ("Warrior", "Character", ...) of the character at index."""
+        return self._classes[self.class_ids[index]]
+
+    def weapon(self, index):
+        """Shared weapon held by the character at index, or None."""
+        weapon_id = self.weapon_ids[index]
+        return None if weapon_id == NO_WEAPON else self._weapons[weapon_id]
+
+    def __getitem__(self, index):
+        """Decode one character into a regular object."""
+        if index < 0:
+            index += self.count
+        name = self.name(index)
+        cls = _PLAYER_CLASSES.get(self.class_name(index))
+        if cls is None:
+            character = Character(name, self.health[index], self.strength[index], self.magic[index])
+        else:
+            character = cls(name, self.levels[index])
+            character.health = self.health[index]
+            character.strength = self.strength[index]
+            character.magic = self.magic[index]
+            character.experience = self.experience[index]
+        character.weapon = self.weapon(index)
+        return character
+
+    def __iter__(self):
+        for index in range(self.count):
+            yield self[index]
+
+    def to_pool(self):
+        """Copy the whole snapshot into a CharacterPool in bulk."""
+        pool = CharacterPool()
+        blob = self._map[self._strings:self._strings + self._offsets[self.count]]
+        offsets = self._offsets.tolist()
+        if blob.isascii():
+            # Byte offsets equal character offsets, so decode once and slice
+            text = blob.decode("ascii")
+            pool.names = [text[offsets[i]:offsets[i + 1]] for i in range(self.count)]
+        else:
+            pool.names = [blob[offsets[i]:offsets[i + 1]].decode("utf-8") for i in range(self.count)]
+        pool.positions = [None] * self.count
+        _copy_column(pool.health, self.health)
+        _copy_column(pool.strength, self.strength)
+        _copy_column(pool.magic, self.magic)
+        _copy_column(pool.experience, self.experience)
+        _copy_column(pool.levels, self.levels)
+        _copy_column(pool.weapon_ids, self.weapon_ids)
+        if self._classes == list(CLASS_NAMES):
+            _copy_column(pool.class_ids, self.class_ids)
+        else:
+            remap = [CLASS_NAMES.index(name) if name in CLASS_NAMES else 0 for name in self._classes]
+            pool.class_ids.extend(remap[class_id] for class_id in self.class_ids)
+        for weapon in self._weapons:
+            pool.weapon_id(weapon)
+        return pool
+
+    def close(self):
+        """Release the memoryviews and unmap the file."""
+        for view in reversed(getattr(self, "_views", ())):
+            view.release()
+        self._views = []
+        if getattr(self, "_map", None) is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
@@ -0,0 +1,185 @@
+# ============================================================
+# Spatial Index + Area-of-Effect Abilities
+# ============================================================
+# SpatialGrid buckets characters into square cells so that radius
+# and nearest-k queries only look at nearby cells instead of the
+# whole world. Moving a character updates at most two cells.
+#
+# The AoE helpers reuse the regular single-target abilities, so
+# splash damage follows exactly the same formulas:
+#   fireball_area(mage, grid, center, radius)
+#   power_strike_cleave(warrior, grid, count, reach)
+# ============================================================
+
+import heapq
+import math
+
+
+# ------------------------------------------------------------
+# SpatialGrid
+# ------------------------------------------------------------
+class SpatialGrid:
+    """Uniform-grid index of character positions."""
+
+    def __init__(self, cell_size=10.0):
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive")
+        self.cell_size = cell_size
+        self._cells = {}   # (cx, cy) -> {character: (x, y)}
+        self._where = {}   # character -> (cx, cy)
+
+    def __len__(self):
+        return len(self._where)
+
+    def __contains__(self, character):
+        return character in self._where
+
+    def _cell(self, x, y):
+        return (math.floor(x / self.cell_size), math.floor(y / self.cell_size))
+
+    def place(self, character, x, y):
+        """Insert character at (x, y), or move it there if already indexed."""
+        cell = self._cell(x, y)
+        old_cell = self._where.get(character)
+        if old_cell is not None and old_cell != cell:
+            bucket = self._cells[old_cell]
+            del bucket[character]
+            if not bucket:
+                del self._cells[old_cell]
+        self._cells.setdefault(cell, {})[character] = (x, y)
+        self._where[character] = cell
+        character.position = (x, y)
+
+    move = place
+
+    def remove(self, character):
+        """Drop character from the index."""
+        cell = self._where.pop(character)
+        bucket = self._cells[cell]
+        del bucket[character]
+        if not bucket:
+            del self._cells[cell]
+        character.position = None
+
+    def within(self, center, radius, include_dead=False):
+        """Characters within radius of center, nearest first."""
+        x, y = center
+        low_x, low_y = self._cell(x - radius, y - radius)
+        high_x, high_y = self._cell(x + radius, y + radius)
+        limit = radius * radius
+        found = []
+        cells = self._cells
+        if (high_x - low_x + 1) * (high_y - low_y + 1) > len(cells):
+            # Radius covers more cells than exist; scan occupied cells only
+            keys = [key for key in cells if low_x <= key[0] <= high_x and low_y <= key[1] <= high_y]
+        else:
+            keys = [(cx, cy) for cx in range(low_x, high_x + 1) for cy in range(low_y, high_y + 1)]
+        for key in keys:
+            bucket = cells.get(key)
+            if not bucket:
+                continue
+            for character, (cx, cy) in bucket.items():
+                distance = (cx - x) ** 2 + (cy - y) ** 2
+                if distance <= limit and (include_dead or character.health > 0):
+                    found.append((distance, len(found), character))
+        found.sort()
+        return [character for _, _, character in found]
+
+    def nearest(self, center, count, max_radius=math.inf, include_dead=False, exclude=None):
+        """Up to count characters closest to center, nearest first.
+
+        Searches rings of cells outward and stops as soon as no unseen
+        cell can hold anything closer than the current count-th hit, or
+        every occupied cell has been seen.
+        """
+        if count <= 0 or not self._cells:
+            return []
+        x, y = center
+        home_x, home_y = self._cell(x, y)
+        best = []  # heap of (-distance, -order, character); worst hit on top
+        order = 0
+        limit = max_radius * max_radius
+        for ring, bucket in self._occupied_rings(home_x, home_y):
+            # Closest possible point of this ring to center
+            gap = max(ring - 1, 0) * self.cell_size
+            if gap * gap > limit or (len(best) == count and gap * gap > -best[0][0]):
+                break
+            for character, (cx, cy) in bucket.items():
+                if (exclude is not None and character == exclude) or not (include_dead or character.health > 0):
+                    continue
+                distance = (cx - x) ** 2 + (cy - y) ** 2
+                if distance > limit:
+                    continue
+                entry = (-distance, -order, character)
+                order += 1
+                if len(best) < count:
+                    heapq.heappush(best, entry)
+                elif entry[:2] > best[0][:2]:
+                    heapq.heapreplace(best, entry)
+        best.sort(reverse=True)
+        return [character for _, _, character in best]
+
+    def _occupied_rings(self, home_x, home_y):
+        """Yield (ring, bucket) for every occupied cell, innermost ring first.
+
+        Walks rings cell by cell while they are small; once a ring has
+        more cells than there are occupied cells left, the remaining
+        occupied cells are sorted by ring instead, so sparse or widely
+        spread grids cost O(occupied cells), not O(extent ** 2).
+        """
+        cells = self._cells
+        remaining = len(cells)
+        ring = 0
+        while remaining:
+            if 8 * ring > remaining:
+                rest = sorted((max(abs(cx - home_x), abs(cy - home_y)), cx, cy) for cx, cy in cells)
+                for cell_ring, cx, cy in rest:
+                    if cell_ring >= ring:
+                        yield cell_ring, cells[(cx, cy)]
+                return
+            for key in _ring_cells(home_x, home_y, ring):
+                bucket = cells.get(key)
+                if bucket:
+                    remaining -= 1
+                    yield ring, bucket
+            ring += 1
+
+
+def _ring_cells(home_x, home_y, ring):
+    """Cells whose Chebyshev distance from (home_x, home_y) is exactly ring."""
+    if ring == 0:
+        yield (home_x, home_y)
+        return
+    for cx in range(home_x - ring, home_x + ring + 1):
+        yield (cx, home_y - ring)
+        yield (cx, home_y + ring)
+    for cy in range(home_y - ring + 1, home_y + ring):
+        yield (home_x - ring, cy)
+        yield (home_x + ring, cy)
+
+
+# ------------------------------------------------------------
+# Area-of-Effect Abilities
+# ------------------------------------------------------------
+def fireball_area(mage, grid, center, radius):
+    """Cast fireball on every living character within radius of center.
+
+    The caster is never hit. Returns the characters that were hit.
+    """
+    targets = [target for target in grid.within(center, radius) if target != mage]
+    for target in targets:
+        mage.fireball(target)
+    return targets
+
+
+def power_strike_cleave(warrior, grid, count, reach):
+    """Power strike the count nearest living characters within reach.
+
+    Returns the characters that were hit.
+    """
+    if warrior.position is None:
+        raise ValueError(f"{warrior.name} has no position; place it in the grid first")
+    targets = grid.nearest(warrior.position, count, max_radius=reach, exclude=warrior)
+    for target in targets:
+        warrior.power_strike(target)
+    return targets
@@ -0,0 +1,284 @@
+# ============================================================
+# Status Effects: Damage Over Time and Stat Modifiers
+# ============================================================
+# While an EffectEngine is attached, the special abilities leave
+# lingering effects on their target (through the damage hooks):
+#   fireball      -> burn    5 damage per tick for 3 ticks
+#   sneak_attack  -> bleed   4 damage per tick for 4 ticks
+#   power_strike  -> weaken  -3 strength for 3 ticks
+# poison (damage) and rally (+strength buff) can be applied by hand.
+#
+#   with EffectEngine() as effects:
+#       mage.fireball(goblin)
+#       effects.tick()                # goblin burns for 5
+#
+# Effects are scheduled on a hierarchical timer wheel, so a tick only
+# touches the effects that are due on it, however many millions are
+# active. Reapplying an effect refreshes it instead of stacking it.
+# Damage-over-time hits go through deal_damage(), attributed to the
+# caster with the effect name as the ability, so an active damage
+# router (thread_safe_damage, deferred_damage) sees them too.
+#
+# A hit that leaves a target at 0 health cleanses it (reverting its
+# modifiers), so a dead NPC recycled by NPCPool starts clean. Deaths
+# are seen through the same damage hook as the abilities, so keep
+# the engine attached while targets can die and be recycled.
+# ============================================================
+
+from collections import namedtuple
+
+from .core import add_damage_hook, remove_damage_hook, deal_damage
+
+# kind is "damage" (amount per tick) or "modifier" (amount added to
+# stat for the whole duration); an effect lasts ticks * period ticks.
+EffectDef = namedtuple("EffectDef", "kind amount ticks period stat")
+
+EFFECTS = {
+    "burn": EffectDef("damage", 5, 3, 1, None),
+    "bleed": EffectDef("damage", 4, 4, 1, None),
+    "poison": EffectDef("damage", 3, 6, 2, None),
+    "weaken": EffectDef("modifier", -3, 3, 1, "strength"),
+    "rally": EffectDef("modifier", 5, 5, 1, "strength"),
+}
+
+ABILITY_EFFECTS = {
+    "fireball": ("burn",),
+    "sneak_attack": ("bleed",),
+    "power_strike": ("weaken",),
+}
+
+
+# ------------------------------------------------------------
+# Hierarchical Timer Wheel
+# ------------------------------------------------------------
+class TimerWheel:
+    """Integer-tick timers in `levels` wheels of `slots` buckets each.
+
+    Level L holds timers due within slots ** (L + 1) ticks. When the
+    lower wheel wraps, the matching bucket of the next level is
+    cascaded down, so every timer is moved at most `levels` times
+    and advancing one tick only touches the timers due on it.
+    """
+
+    def __init__(self, slots=64, levels=4):
+        if slots < 2 or levels < 1:
+            raise ValueError("need at least 2 slots and 1 level")
+        self.slots = slots
+        self.levels = levels
+        self.now = 0
+        self._wheels = [[[] for _ in range(slots)] for _ in range(levels)]
+        self._spans = [slots ** level for level in range(levels)]
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def schedule(self, deadline, item):
+        """Fire item at tick deadline (at the earliest on the next tick)."""
+        if deadline <= self.now:
+            deadline = self.now + 1
+        self._place(deadline, item)
+        self.count += 1
+
+    def _place(self, deadline, item):
+        delta = deadline - self.now
+        level = 0
+        while level < self.levels - 1 and delta >= self._spans[level + 1]:
+            level += 1
+        slot = (deadline // self._spans[level]) % self.slots
+        self._wheels[level][slot].append((deadline, item))
+
+    def advance(self):
+        """Move to the next tick and return the items due on it."""
+        self.now += 1
+        now, slots = self.now, self.slots
+        for level in range(1, self.levels):
+            span = self._spans[level]
+            if now % span:
+                break
+            bucket = self._wheels[level][(now // span) % slots]
+            if bucket:
+                entries = bucket[:]
+                bucket.clear()
+                for deadline, item in entries:
+                    self._place(deadline, item)
+        bucket = self._wheels[0][now % slots]
+        if not bucket:
+            return []
+        due = [item for deadline, item in bucket if deadline == now]
+        if len(due) == len(bucket):
+            bucket.clear()
+        else:  # timers further out than the top wheel's range come back around
+            bucket[:] = [entry for entry in bucket if entry[0] != now]
+        self.count -= len(due)
+        return due
+
+
+# ------------------------------------------------------------
+# Effects
+# ------------------------------------------------------------
+class Effect:
+    """One active effect on one target."""
+
+    __slots__ = ("name", "definition", "target", "source", "remaining", "active")
+
+    def __init__(self, name, definition, target, source):
+        self.name = name
+        self.definition = definition
+        self.target = target
+        self.source = source
+        self.remaining = definition.ticks
+        self.active = True
+
+    def __repr__(self):
+        return f"<Effect {self.name} on {self.target.name!r}, {self.remaining} left>"
+
+
+class EffectEngine:
+    """Applies, ticks and expires status effects."""
+
+    def __init__(self, definitions=EFFECTS, ability_effects=ABILITY_EFFECTS, wheel=None):
+        self.definitions = definitions
+        self.ability_effects = ability_effects
+        self.wheel = wheel if wheel is not None else TimerWheel()
+        self._active = {}  # target -> {effect name: Effect}
+        self.active_count = 0
+        self._attached = False
+        self.applied = 0
+        self.damage_ticks = 0
+        self.expired = 0
+
+    # -- lifecycle --------------------------------------------
+    def attach(self):
+        """Start applying effects when special abilities hit."""
+        if not self._attached:
+            add_damage_hook(self._on_damage)
+            self._attached = True
+        return self
+
+    def detach(self):
+        """Stop reacting to abilities; active effects keep ticking."""
+        if self._attached:
+            remove_damage_hook(self._on_damage)
+            self._attached = False
+
+    def __enter__(self):
+        return self.attach()
+
+    def __exit__(self, *exc_info):
+        self.detach()
+
+    def _on_damage(self, attacker, target, ability, damage):
+        if target.health <= 0:
+            if target in self._active:
+                self.cleanse(target)
+            return
+        names = self.ability_effects.get(ability)
+        if names:
+            for name in names:
+                self.apply(target, name, attacker)
+
+    # -- effects ----------------------------------------------
+    def apply(self, target, name, source=None):
+        """Apply (or refresh) effect name on target; returns the Effect."""
+        definition = self.definitions[name]
+        on_target = self._active.get(target)
+        if on_target is None:
+            on_target = self._active[target] = {}
+        previous = on_target.get(name)
+        effect = Effect(name, definition, target, source)
+        if previous is not None:
+            previous.active = False  # its timer is skipped when it fires
+        else:
+            self.active_count += 1
+            if definition.kind == "modifier":
+                setattr(target, definition.stat, getattr(target, definition.stat) + definition.amount)
+        on_target[name] = effect
+        self.applied += 1
+        if definition.kind == "damage":
+            self.wheel.schedule(self.wheel.now + definition.period, effect)
+        else:
+            self.wheel.schedule(self.wheel.now + definition.ticks * definition.period, effect)
+        return effect
+
+    def _expire(self, effect):
+        effect.active = False
+        on_target = self._active[effect.target]
+        del on_target[effect.name]
+        if not on_target:
+            del self._active[effect.target]
+        self.active_count -= 1
+        definition = effect.definition
+        if definition.kind == "modifier":
+            target = effect.target
+            setattr(target, definition.stat, getattr(target, definition.stat) - definition.amount)
+        self.expired += 1
+
+    def tick(self, steps=1):
+        """Advance time; returns the number of effect events processed."""
+        events = 0
+        for _ in range(steps):
+            for effect in self.wheel.advance():
+                if not effect.active:
+                    continue
+                events += 1
+                definition = effect.definition
+                if definition.kind == "modifier":
+                    self._expire(effect)
+                    continue
+                target = effect.target
+                if target.health > 0:
+                    deal_damage(effect.source, target, definition.amount, effect.name)
+                    self.damage_ticks += 1
+                    if not effect.active:  # the tick killed the target and cleansed it
+                        continue
+                effect.remaining -= 1
+                if target.health <= 0:
+                    self.cleanse(target)
+                elif effect.remaining > 0:
+                    self.wheel.schedule(self.wheel.now + definition.period, effect)
+                else:
+                    self._expire(effect)
+        return events
+
+    def cleanse(self, target):
+        """Remove every effect on target (reverting modifiers); returns how many."""
+        effects = list(self._active.get(target, {}).values())
+        for effect in effects:
+            self._expire(effect)
+        return len(effects)
+
+    def effects_on(self, target):
+        """Names of the effects currently active on target."""
+        return sorted(self._active.get(target, ()))
+
+    def __len__(self):
+        return self.active_count
+
+    def stats(self):
+        return {
+            "active": self.active_count,
+            "scheduled": len(self.wheel),
+            "applied": self.applied,
+            "damage_ticks": self.damage_ticks,
+            "expired": self.expired,
+            "tick": self.wheel.now,
+        }
+
+
+# ------------------------------------------------------------
+# Example Usage (Optional Manual Test)
+# ------------------------------------------------------------
+if __name__ == "__main__":
+    from .core import Character, Mage, Rogue
+
+    mage, rogue = Mage("Gandalf"), Rogue("Bilbo")
+    goblin = Character("Goblin", 200, 8, 0)
+    with EffectEngine() as effects:
+        mage.fireball(goblin)
+        rogue.sneak_attack(goblin)
+        print(f"After abilities: {goblin.health} health, effects {effects.effects_on(goblin)}")
+        for _ in range(5):
+            effects.tick()
+            print(f"Tick {effects.wheel.now}: {goblin.health} health, effects {effects.effects_on(goblin)}")
+    print(effects.stats())
@@ -0,0 +1,70 @@
+import asyncio
+import pytest
+from rpg.battle_server import MatchHost, BattleClient, play_match
+
+class TestMatchHost:
+    """Test command handling without a socket"""
+
+    def test_create_and_act(self):
+        """Test that commands drive the regular classes"""
+        host = MatchHost()
+        state = host.handle({"cmd": "create", "classes": ["Warrior", "Mage"], "names": ["A", "B"]})
+        reply = host.handle({"cmd": "act", "match": state["match"], "player": 0, "action": "special"})
+
+        assert reply["ok"], "Valid command should succeed"
+        assert reply["players"][1]["health"] == 80 - 40, "Power strike should hit the mage"
+        assert reply["turn"] == 1, "Turn should pass to the other player"
+
+    def test_turn_order_enforced(self):
+        """Test that players cannot act out of turn"""
+        host = MatchHost()
+        match = host.handle({"cmd": "create", "classes": ["Rogue", "Rogue"]})["match"]
+        reply = host.handle({"cmd": "act", "match": match, "player": 1, "action": "attack"})
+
+        assert not reply["ok"] and "turn" in reply["error"], "Out-of-turn action should be rejected"
+
+    def test_bad_commands(self):
+        """Test that invalid commands return errors instead of raising"""
+        host = MatchHost()
+        assert not host.handle({"cmd": "create", "classes": ["Paladin", "Mage"]})["ok"], "Unknown class"
+        assert not host.handle({"cmd": "state", "match": 99})["ok"], "Unknown match"
+        assert not host.handle({"cmd": "dance"})["ok"], "Unknown command"
+        assert not host.handle({"cmd": "act"})["ok"], "Missing fields"
+
+    def test_finished_match_removed(self):
+        """Test that finished matches are freed"""
+        host = MatchHost()
+        match = host.handle({"cmd": "create", "classes": ["Warrior", "Mage"]})["match"]
+        player = 0
+        while True:
+            reply = host.handle({"cmd": "act", "match": match, "player": player, "action": "special"})
+            player = 1 - player
+            if reply["winner"] is not None:
+                break
+
+        assert reply["winner"] == 0, "Warrior should win"
+        assert host.stats()["matches"] == 0, "Finished match should be removed"
+
+class TestSocketServer:
+    """Test many concurrent matches over the local socket"""
+
+    def test_concurrent_matches(self):
+        """Test that hundreds of matches run at once on one event loop"""
+        async def scenario():
+            host = MatchHost()
+            address = await host.start()
+            clients = [await BattleClient.connect(*address) for _ in range(200)]
+            pairs = [("Warrior", "Mage"), ("Mage", "Rogue"), ("Rogue", "Warrior")]
+            results = await asyncio.gather(*(play_match(client, pairs[i % 3])
+                                             for i, client in enumerate(clients)))
+            bad = await clients[0].send(cmd="state", match=10_000)
+            for client in clients:
+                await client.close()
+            await host.stop()
+            return host, results, bad
+
+        host, results, bad = asyncio.run(scenario())
+
+        assert len(results) == 200 and all(r["winner"] in (0, 1) for r in results), "Every match should finish"
+        assert not bad["ok"], "Errors should be reported over the socket"
+        assert host.stats()["commands"] > 200, "Host should count commands"
@@ -0,0 +1,219 @@
+import pytest
+from project2_starter import Character, Player, Warrior, Mage, Rogue, Weapon
+from rpg.character_pool import CharacterPool, resolve_attacks, CHARACTER, WARRIOR, MAGE, ROGUE, NO_WEAPON
+from rpg.combat_events import EventStream
+from rpg.deferred_damage import deferred_damage
+
+class TestPoolStorage:
+    """Test that the pool stores stats in columns"""
+
+    def test_spawn_uses_class_templates(self):
+        """Test that spawned characters match the regular class stats"""
+        pool = CharacterPool()
+        for class_id, cls in ((WARRIOR, Warrior), (MAGE, Mage), (ROGUE, Rogue)):
+            handle = pool.spawn(class_id, "Pooled")
+            reference = cls("Pooled")
+            assert handle.health == reference.health, "Health should match the class template"
+            assert handle.strength == reference.strength, "Strength should match the class template"
+            assert handle.magic == reference.magic, "Magic should match the class template"
+            assert handle.weapon.name == reference.weapon.name, "Weapon should match the class template"
+            assert handle.character_class == reference.character_class, "Class name should match"
+
+    def test_weapons_are_shared_in_table(self):
+        """Test that identical weapons are stored once in the weapon table"""
+        pool = CharacterPool()
+        pool.spawn_many(WARRIOR, [f"W{i}" for i in range(100)])
+        pool.spawn(WARRIOR, "Extra")
+
+        assert len(pool) == 101, "Pool should hold every spawned character"
+        assert len(pool.weapons) == 1, "One Iron Sword should be shared by all warriors"
+        assert set(pool.weapon_ids) == {0}, "Every warrior should point at the same weapon id"
+
+    def test_character_without_weapon(self):
+        """Test that NPCs without weapons use the NO_WEAPON id"""
+        pool = CharacterPool()
+        goblin = pool.add("Goblin", 100, 8, 0)
+
+        assert goblin.weapon is None, "Goblin should have no weapon"
+        assert pool.weapon_ids[goblin.index] == NO_WEAPON, "Weapon column should hold NO_WEAPON"
+
+    def test_add_character_copies_object(self):
+        """Test that regular objects can be copied into the pool"""
+        pool = CharacterPool()
+        handle = pool.add_character(Mage("Copied"))
+
+        assert isinstance(handle, Mage), "Copied Mage should come back as a Mage handle"
+        assert handle.magic == 20, "Copied stats should be preserved"
+
+    def test_add_character_keeps_subclass_class(self):
+        """Test that subclasses map to their nearest pooled class"""
+        from rpg.class_catalog import load_catalog
+        from rpg.damage_models import build_engine
+
+        class Archmage(Mage):
+            pass
+
+        pool = CharacterPool()
+        catalog = load_catalog()
+        engine = build_engine("table", table={"Character": {"attack": 5}})
+        copies = [pool.add_character(c) for c in (catalog.spawn("Warrior", "W"), engine.Warrior("E"),
+                                                  Archmage("A"), Character("Goblin", 30, 4, 0))]
+
+        assert [type(c).__name__ for c in copies] == ["PooledWarrior", "PooledWarrior", "PooledMage",
+                                                      "PooledCharacter"], "Classes should be kept"
+        assert copies[2].magic == 20, "The archmage should keep attacking with magic"
+
+    def test_add_character_rejects_unknown_player_class(self):
+        """Test that a Player of an unsupported class is refused, not downgraded"""
+        pool = CharacterPool()
+        with pytest.raises(ValueError):
+            pool.add_character(Player("Bard", 90, 9, 9, "Bard", level=3))
+        assert len(pool) == 0, "Nothing should be stored"
+
+    def test_unknown_class_id_rejected(self):
+        """Test that invalid class ids raise ValueError"""
+        pool = CharacterPool()
+        with pytest.raises(ValueError):
+            pool.add("Bad", 10, 1, 1, class_id=9)
+
+class TestPooledHandles:
+    """Test that handles behave like the regular classes"""
+
+    def test_handles_keep_inheritance_chain(self):
+        """Test that handles pass isinstance checks for the whole hierarchy"""
+        pool = CharacterPool()
+        warrior = pool.spawn(WARRIOR, "ChainWarrior")
+
+        assert isinstance(warrior, Warrior), "Handle should be a Warrior"
+        assert isinstance(warrior, Player), "Handle should be a Player"
+        assert isinstance(warrior, Character), "Handle should be a Character"
+        assert not hasattr(warrior, "__dict__") or not warrior.__dict__, "Handle should not store stats per object"
+
+    def test_attacks_match_object_path(self):
+        """Test that pooled attacks deal the same damage as regular objects"""
+        pool = CharacterPool()
+        pairs = [(pool.spawn(WARRIOR, "W"), Warrior("W"), "power_strike"),
+                 (pool.spawn(MAGE, "M"), Mage("M"), "fireball"),
+                 (pool.spawn(ROGUE, "R"), Rogue("R"), "sneak_attack")]
+
+        for handle, reference, ability in pairs:
+            pooled_target = pool.add("Target", 100, 0, 0)
+            plain_target = Character("Target", 100, 0, 0)
+            handle.attack(pooled_target)
+            reference.attack(plain_target)
+            getattr(handle, ability)(pooled_target)
+            getattr(reference, ability)(plain_target)
+            assert pooled_target.health == plain_target.health, f"{ability} should match the object path"
+
+    def test_take_damage_clamps_at_zero(self):
+        """Test that take_damage writes clamped health into the column"""
+        pool = CharacterPool()
+        goblin = pool.add("Goblin", 50, 8, 0)
+        goblin.take_damage(100)
+
+        assert pool.health[goblin.index] == 0, "Health column should stop at 0"
+
+    def test_handles_can_hit_plain_objects(self):
+        """Test that pooled and regular characters can fight each other"""
+        pool = CharacterPool()
+        rogue = pool.spawn(ROGUE, "Mixed")
+        target = Character("Plain", 100, 0, 0)
+        rogue.attack(target)
+
+        assert target.health == 79, "Rogue attack should deal strength + 3 + weapon bonus"
+
+    def test_display_stats_matches_object(self, capsys):
+        """Test that display_stats output is identical for handles"""
+        pool = CharacterPool()
+        pool.spawn(MAGE, "Aria").display_stats()
+        pooled_output = capsys.readouterr().out
+        Mage("Aria").display_stats()
+        plain_output = capsys.readouterr().out
+
+        assert pooled_output == plain_output, "display_stats should print the same lines"
+
+    def test_equip_weapon_updates_column(self):
+        """Test that assigning a weapon stores its id in the pool"""
+        pool = CharacterPool()
+        warrior = pool.spawn(WARRIOR, "Equip")
+        warrior.weapon = Weapon("War Hammer", 20)
+
+        assert warrior.weapon.name == "War Hammer", "New weapon should be visible through the handle"
+        assert len(pool.weapons) == 2, "New weapon should be added to the table"
+
+class TestBatchAttacks:
+    """Test that resolve_attacks matches calling attack() pair by pair"""
+
+    def build_battle(self):
+        """Create a pool with mixed attackers and a few shared targets"""
+        pool = CharacterPool()
+        attackers = []
+        for i in range(30):
+            attackers.append(pool.spawn((WARRIOR, MAGE, ROGUE)[i % 3], f"A{i}"))
+        attackers.append(pool.add("Goblin", 100, 8, 0))
+        targets = [pool.add(f"T{i}", 120, 0, 0) for i in range(4)]
+        return pool, attackers, targets
+
+    def test_batch_matches_object_path(self):
+        """Test that batched health updates equal sequential attack() calls"""
+        batch_pool, batch_attackers, batch_targets = self.build_battle()
+        loop_pool, loop_attackers, loop_targets = self.build_battle()
+        pairs = [(i, i % 4) for i in range(len(batch_attackers))]
+
+        damages = batch_pool.resolve_attacks([batch_attackers[a] for a, _ in pairs],
+                                             [batch_targets[t] for _, t in pairs])
+        for a, t in pairs:
+            loop_attackers[a].attack(loop_targets[t])
+
+        assert list(batch_pool.health) == list(loop_pool.health), "Batch and loop should end with the same health"
+        assert list(damages[:3]) == [25, 32, 21], "Damage should follow each class formula"
+
+    def test_batch_clamps_health_at_zero(self):
+        """Test that overkill damage leaves health at exactly 0"""
+        pool = CharacterPool()
+        warriors = [pool.spawn(WARRIOR, f"W{i}") for i in range(10)]
+        target = pool.add("Boss", 50, 0, 0)
+
+        resolve_attacks(warriors, [target] * len(warriors))
+
+        assert target.health == 0, "Health should not go below 0"
+
+    def test_batch_accepts_indices(self):
+        """Test that plain pool indices work as attackers and targets"""
+        pool = CharacterPool()
+        first = pool.spawn_many(MAGE, ["M1", "M2"])
+        target = pool.add("Dummy", 100, 0, 0)
+
+        pool.resolve_attacks([first, first + 1], [target.index, target.index])
+
+        assert target.health == 36, "Two mage attacks should deal 32 each"
+
+    def test_batch_notifies_hooks(self):
+        """Test that active damage hooks see every batched attack"""
+        pool = CharacterPool()
+        warrior, mage = pool.spawn(WARRIOR, "W"), pool.spawn(MAGE, "M")
+        target = pool.add("Dummy", 100, 0, 0)
+        with EventStream() as stream:
+            pool.resolve_attacks([warrior, mage], [target, target])
+
+        assert [(e.attacker, e.ability, e.damage) for e in stream] == [("W", "attack", 25), ("M", "attack", 32)], \
+            "Each attack should be reported"
+        assert target.health == 100 - 57, "Damage should still be applied"
+
+    def test_batch_uses_damage_router(self):
+        """Test that an installed damage router receives batched attacks"""
+        pool = CharacterPool()
+        warriors = [pool.spawn(WARRIOR, f"W{i}") for i in range(3)]
+        target = pool.add("Dummy", 100, 0, 0)
+        with deferred_damage() as tick:
+            pool.resolve_attacks(warriors, [target] * 3)
+            assert target.health == 100 and tick.pending(target) == 75, "Hits should wait for the commit"
+
+        assert target.health == 25, "Commit should apply them"
+
+    def test_batch_rejects_mismatched_lengths(self):
+        """Test that attacker and target lists must line up"""
+        pool = CharacterPool()
+        warrior = pool.spawn(WARRIOR, "W")
+        with pytest.raises(ValueError):
+            pool.resolve_attacks([warrior, warrior], [warrior])
@@ -0,0 +1,102 @@
+import json
+import pytest
+from project2_starter import Character, Player, Warrior, Mage, Rogue
+from rpg.class_catalog import load_catalog, parse_catalog, compile_formula, CatalogError
+
+def definition(**abilities):
+    """A one-class definition mapping for tests"""
+    return {"classes": {"Paladin": {
+        "health": 130, "strength": 12, "magic": 10,
+        "weapon": {"name": "Holy Mace", "damage_bonus": 9},
+        "abilities": abilities or {"attack": "strength + weapon", "smite": "strength + magic * 2 + weapon"},
+    }}}
+
+class TestDefaultCatalog:
+    """Test that classes.json reproduces the hand-written classes"""
+
+    @pytest.mark.parametrize("cls", [Warrior, Mage, Rogue])
+    def test_matches_hand_written_class(self, cls):
+        """Test stats, weapon and damage table against the Python class"""
+        spawned = load_catalog().spawn(cls.__name__, "Copy")
+        original = cls("Copy")
+
+        assert isinstance(spawned, cls), "Catalog classes should subclass the originals"
+        assert spawned.stat_lines() == original.stat_lines(), "Stats should match"
+        assert spawned.damage_table() == original.damage_table(), "Formulas should match"
+
+    def test_abilities_work(self):
+        """Test that spawned characters fight like the originals"""
+        catalog = load_catalog()
+        warrior = catalog["Warrior"]("W")
+        target = Character("Dummy", 1000, 0, 0)
+        warrior.attack(target)
+        warrior.power_strike(target)
+
+        assert target.health == 1000 - 25 - 40, "Spawned warrior should deal normal damage"
+
+    def test_spawn_many_independent(self):
+        """Test that bulk spawns do not share mutable state"""
+        army = load_catalog().spawn_many("Rogue", ["A", "B"])
+        army[0].strength = 50
+        army[0].take_damage(30)
+
+        assert [r.name for r in army] == ["A", "B"], "Each spawn should keep its name"
+        assert (army[1].health, army[1].damage_table()["attack"]) == (100, 21), \
+            "Changing one spawn should not affect another"
+
+class TestCustomClasses:
+    """Test classes defined only in data"""
+
+    def test_new_class_and_ability(self, tmp_path):
+        """Test a class and special ability that have no Python code"""
+        path = tmp_path / "classes.json"
+        path.write_text(json.dumps(definition()))
+        paladin = load_catalog(str(path)).spawn("Paladin", "Uther")
+        target = Character("Dummy", 1000, 0, 0)
+        paladin.smite(target)
+
+        assert isinstance(paladin, Player) and paladin.character_class == "Paladin", "Should be a Player"
+        assert target.health == 1000 - (12 + 20 + 9), "Smite should follow its formula"
+
+    def test_level_in_formula(self):
+        """Test that formulas can scale with level"""
+        paladin = parse_catalog(definition(attack="strength + level * 5")).spawn("Paladin", "P")
+        target = Character("Dummy", 1000, 0, 0)
+        paladin.attack(target)
+        paladin.gain_experience(100)
+        paladin.attack(target)
+
+        assert target.health == 1000 - (12 + 5) - (14 + 2 * 5), "Level-up should change the next attack"
+
+    def test_level_assigned_directly(self):
+        """Test that setting level by hand is picked up without any cache to invalidate"""
+        paladin = parse_catalog(definition(attack="strength + level * 5")).spawn("Paladin", "P")
+        target = Character("Dummy", 1000, 0, 0)
+        paladin.level = 4
+        paladin.attack(target)
+
+        assert target.health == 1000 - (12 + 4 * 5), "The assigned level should be used"
+
+class TestValidation:
+    """Test that bad definitions are rejected at load time"""
+
+    @pytest.mark.parametrize("formula", ["__import__('os')", "strength.real", "mana * 2", "magic / 2", "1.5"])
+    def test_bad_formulas(self, formula):
+        """Test that only simple integer arithmetic on stats is accepted"""
+        with pytest.raises(CatalogError):
+            compile_formula(formula)
+
+    def test_missing_fields(self):
+        """Test that incomplete class definitions raise CatalogError"""
+        with pytest.raises(CatalogError):
+            parse_catalog({"classes": {"Bard": {"health": 10}}})
+        with pytest.raises(CatalogError):
+            parse_catalog(definition(smite="magic"))
+        with pytest.raises(CatalogError):
+            parse_catalog({})
+
+    @pytest.mark.parametrize("spec", [5, "Warrior", None, ["health", 10]])
+    def test_class_not_a_table(self, spec):
+        """Test that a class definition that is not a mapping raises CatalogError"""
+        with pytest.raises(CatalogError):
+            parse_catalog({"classes": {"W": spec}})
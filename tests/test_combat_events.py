@@ -0,0 +1,126 @@
+import io
+import json
+import threading
+import pytest
+from project2_starter import Character, Warrior, Mage, Rogue
+from rpg.character_pool import CharacterPool, WARRIOR
+from rpg.combat_events import EventStream, JsonLinesSink, filter_events, total_damage
+
+class TestEventRecording:
+    """Test that combat methods emit events"""
+
+    def test_attack_and_abilities_emit_events(self):
+        """Test one event per hit with attacker, ability and resulting health"""
+        warrior, mage, rogue = Warrior("W"), Mage("M"), Rogue("R")
+        target = Character("Dummy", 300, 0, 0)
+        with EventStream() as stream:
+            warrior.attack(target)
+            warrior.power_strike(target)
+            mage.fireball(target)
+            rogue.sneak_attack(target)
+        events = list(stream)
+
+        assert [e.ability for e in events] == ["attack", "power_strike", "fireball", "sneak_attack"], \
+            "Each hit should produce exactly one event"
+        assert events[0].attacker == "W" and events[0].damage == 25, "Event should record attacker and damage"
+        assert events[-1].health == target.health, "Event should record the resulting health"
+
+    def test_direct_take_damage_event(self):
+        """Test that direct take_damage calls are recorded without an attacker"""
+        target = Character("Trap", 50, 0, 0)
+        with EventStream() as stream:
+            target.take_damage(-5)
+            target.take_damage(70)
+        events = list(stream)
+
+        assert [(e.attacker, e.ability, e.damage) for e in events] == [(None, "take_damage", 0), (None, "take_damage", 70)], \
+            "Direct damage should be recorded with clamped amounts"
+        assert events[-1].health == 0, "Health should be clamped at 0"
+
+    def test_pooled_characters_emit_events(self):
+        """Test that pooled handles are observed too"""
+        pool = CharacterPool()
+        warrior = pool.spawn(WARRIOR, "Pooled")
+        target = pool.add("Goblin", 100, 8, 0)
+        with EventStream() as stream:
+            warrior.attack(target)
+
+        assert [e.target for e in stream] == ["Goblin"], "Pooled attack should be recorded"
+
+    def test_no_events_after_detach(self):
+        """Test that detaching stops recording"""
+        stream = EventStream().attach()
+        stream.detach()
+        Warrior("W").attack(Character("Dummy", 100, 0, 0))
+
+        assert len(stream) == 0, "Detached stream should stay empty"
+
+class TestBoundedBuffer:
+    """Test the overflow policies"""
+
+    def test_ring_keeps_most_recent(self):
+        """Test that ring mode keeps only the last maxlen events"""
+        target = Character("Dummy", 10_000, 0, 0)
+        with EventStream(maxlen=5, overflow="ring") as stream:
+            for _ in range(20):
+                target.take_damage(1)
+        events = list(stream)
+
+        assert len(events) == 5, "Ring buffer should stay bounded"
+        assert events[0].seq == 16 and stream.dropped == 15, "Oldest events should be dropped"
+
+    def test_drop_keeps_oldest(self):
+        """Test that drop mode discards new events when full"""
+        target = Character("Dummy", 10_000, 0, 0)
+        with EventStream(maxlen=3, overflow="drop") as stream:
+            for _ in range(10):
+                target.take_damage(1)
+
+        assert [e.seq for e in stream] == [1, 2, 3], "Drop mode should keep the first events"
+
+    def test_block_applies_backpressure(self):
+        """Test that block mode waits for a consumer thread"""
+        stream = EventStream(maxlen=2, overflow="block").attach()
+        received = []
+        consumer = threading.Thread(target=lambda: received.extend(stream.follow(timeout=5)))
+        consumer.start()
+        target = Character("Dummy", 10_000, 0, 0)
+        for _ in range(50):
+            target.take_damage(1)
+        stream.detach()
+        consumer.join(5)
+
+        assert [e.seq for e in received] == list(range(1, 51)), "Consumer should receive every event in order"
+        assert stream.dropped == 0, "Block mode should never drop events"
+
+    def test_invalid_policy(self):
+        """Test that unknown overflow policies are rejected"""
+        with pytest.raises(ValueError):
+            EventStream(overflow="spill")
+
+class TestSinksAndPipelines:
+    """Test sinks and generator helpers"""
+
+    def test_sink_sees_every_event(self):
+        """Test that sinks receive events even when the buffer drops them"""
+        output = io.StringIO()
+        target = Character("Dummy", 1000, 0, 0)
+        with EventStream(maxlen=1, sinks=[JsonLinesSink(output)]):
+            for _ in range(4):
+                Mage("M").attack(target)
+        lines = [json.loads(line) for line in output.getvalue().splitlines()]
+
+        assert len(lines) == 4, "Sink should see all events"
+        assert lines[0]["damage"] == 32, "JSON lines should include the damage"
+
+    def test_filter_and_totals(self):
+        """Test filtering and summing an event stream"""
+        warrior, rogue = Warrior("W"), Rogue("R")
+        target = Character("Dummy", 1000, 0, 0)
+        with EventStream() as stream:
+            warrior.attack(target)
+            rogue.attack(target)
+            rogue.sneak_attack(target)
+        totals = total_damage(filter_events(stream, attacker="R"))
+
+        assert totals == {"R": 21 + 38}, "Rogue damage should be summed"
@@ -0,0 +1,158 @@
+import pytest
+from project2_starter import Character, Warrior, Mage, Rogue, deliver_damage
+from rpg.status_effects import EffectEngine
+from rpg.combat_journal import CombatJournal, JournalError, replay, verify, _zigzag, _unzigzag
+
+def fight(keyframe_interval=8, rounds=30):
+    """A short recorded fight; returns (journal, participants, healths per turn)"""
+    party = [Warrior("Aragorn"), Mage("Gandalf"), Rogue("Bilbo")]
+    monsters = [Character("Orc", 400, 12, 0), Character("Troll", 600, 20, 0)]
+    everyone = party + monsters
+    history = [[c.health for c in everyone]]
+    with CombatJournal(everyone, keyframe_interval=keyframe_interval) as journal:
+        for _ in range(rounds):
+            for action in (lambda: party[0].power_strike(monsters[0]),
+                           lambda: party[1].fireball(monsters[1]),
+                           lambda: party[2].sneak_attack(monsters[1]),
+                           lambda: party[2].attack(monsters[0]),
+                           lambda: monsters[1].attack(party[0]),
+                           lambda: party[1].take_damage(3)):
+                action()
+                history.append([c.health for c in everyone])
+    return journal, everyone, history
+
+class TestEncoding:
+    """Test the varint building blocks"""
+
+    def test_zigzag_round_trip(self):
+        """Test that small negative and positive deltas round-trip"""
+        for value in (0, 1, -1, 63, -64, 10 ** 12, -(10 ** 12)):
+            assert _unzigzag(_zigzag(value)) == value, f"{value} should round-trip"
+        assert _zigzag(-1) == 1 and _zigzag(1) == 2, "Small magnitudes stay small"
+
+    def test_events_are_compact(self):
+        """Test that a typical event takes four bytes"""
+        journal, _, _ = fight()
+        stats = journal.stats()
+        assert stats["turns"] == 180, "Every damage event is one turn"
+        assert stats["bytes_per_turn"] == 4.0, "attacker, target, ability and delta fit a byte each"
+
+class TestSeek:
+    """Test reconstructing the state at any turn"""
+
+    @pytest.mark.parametrize("interval", [1, 7, 64, 1000])
+    def test_state_at_every_turn(self, interval):
+        """Test that every turn matches the live healths, whatever the keyframe spacing"""
+        journal, _, history = fight(keyframe_interval=interval)
+        for turn, healths in enumerate(history):
+            assert journal.state_at(turn) == healths, f"Turn {turn} should match"
+
+    def test_out_of_range(self):
+        """Test that seeking past the end is an error"""
+        journal, _, _ = fight()
+        with pytest.raises(IndexError):
+            journal.state_at(len(journal) + 1)
+
+    def test_events_slice(self):
+        """Test decoding a window of events"""
+        journal, _, _ = fight()
+        events = list(journal.events(8, 12))
+        assert [e.turn for e in events] == [9, 10, 11, 12], "Events should cover the window"
+        assert events[0].ability == "sneak_attack", "Turn 9 is the rogue's sneak attack"
+        assert events[0].attacker == 2 and events[0].target == 4, "Entity ids follow the roster"
+        direct = list(journal.events(5, 6))[0]
+        assert direct.attacker is None and direct.delta == 3, "take_damage has no attacker"
+
+    def test_late_joiner(self):
+        """Test a participant that was not in the starting roster"""
+        hero = Warrior("Aragorn")
+        with CombatJournal([hero], keyframe_interval=2) as journal:
+            for _ in range(3):
+                hero.attack(Character("Rat", 10, 1, 0))
+            wolf = Character("Wolf", 100, 5, 0)
+            hero.attack(wolf)
+            hero.attack(wolf)
+        assert journal.state_at(0)[4] == 100, "The joiner starts at its health before the first hit"
+        assert journal.state_at(5)[4] == wolf.health, "The final state should match"
+
+    def test_late_joiner_overkill(self):
+        """Test a joiner killed by its first hit keeps its real starting health"""
+        hero = Warrior("Aragorn")
+        with CombatJournal([hero]) as journal:
+            hero.attack(Character("Goblin", 10, 5, 0))
+
+        assert journal.state_at(0) == [150, 10], "The goblin had 10 health, not the 25 damage"
+        assert journal.state_at(1) == [150, 0], "And none afterwards"
+        assert journal.roster[1].health == 10, "The roster should record the real starting health"
+
+class TestPersistence:
+    """Test saving and loading journals"""
+
+    def test_round_trip(self, tmp_path):
+        """Test that a loaded journal seeks identically"""
+        journal, _, history = fight()
+        path = tmp_path / "fight.rpgj"
+        journal.save(path)
+        loaded = CombatJournal.load(path)
+        assert loaded.roster == journal.roster, "Roster should survive"
+        for turn in (0, 1, 57, len(history) - 1):
+            assert loaded.state_at(turn) == history[turn], f"Turn {turn} should match after loading"
+
+    def test_rejects_garbage(self):
+        """Test that foreign or truncated data is refused"""
+        journal, _, _ = fight()
+        with pytest.raises(JournalError):
+            CombatJournal.from_bytes(b"not a journal")
+        with pytest.raises(JournalError):
+            CombatJournal.from_bytes(journal.to_bytes()[:-3])
+
+class TestReplay:
+    """Test re-fighting a journal"""
+
+    def test_verify_identical(self):
+        """Test that a deterministic fight replays to the same state"""
+        journal, everyone, _ = fight()
+        assert verify(journal, everyone) is None, "Replay should reproduce every turn"
+        replayed = replay(journal)
+        assert [c.health for c in replayed] == [c.health for c in everyone], "Same end state"
+        assert type(replayed[0]) is Warrior and replayed[0].weapon is everyone[0].weapon, \
+            "Characters are rebuilt with their class and weapon"
+
+    def test_verify_after_loading(self):
+        """Test verifying a journal read back from bytes"""
+        journal, everyone, _ = fight()
+        loaded = CombatJournal.from_bytes(journal.to_bytes())
+        assert verify(loaded, everyone) is None, "A loaded journal should verify too"
+
+    def test_replay_until(self):
+        """Test replaying only part of a fight"""
+        journal, _, history = fight()
+        replayed = replay(journal, until=40)
+        assert [c.health for c in replayed] == history[40], "Partial replay stops at the turn"
+
+    def test_detects_tampering(self):
+        """Test that an edited delta is caught at its turn"""
+        journal, everyone, _ = fight()
+        data = bytearray(journal.to_bytes())
+        data[-1] ^= 1  # last event's health delta
+        assert verify(CombatJournal.from_bytes(bytes(data)), everyone) == len(journal), \
+            "The edited turn should be reported"
+
+    def test_detects_unjournaled_changes(self):
+        """Test that a mid-fight stat change shows up as a mismatch"""
+        hero, orc = Warrior("Aragorn"), Character("Orc", 500, 10, 0)
+        with CombatJournal([hero, orc]) as journal:
+            hero.power_strike(orc)
+            hero.strength += 10
+            hero.power_strike(orc)
+        assert verify(journal) == 2, "The second strike no longer matches"
+
+    def test_effects_replay(self):
+        """Test that damage-over-time ticks replay as direct damage"""
+        mage, orc = Mage("Gandalf"), Character("Orc", 500, 10, 0)
+        with CombatJournal([mage, orc]) as journal, EffectEngine() as effects:
+            mage.fireball(orc)
+            effects.tick(3)
+            deliver_damage(None, orc, 7, "trap")
+        assert [e.ability for e in journal.events()] == ["fireball", "burn", "burn", "burn", "trap"]
+        assert verify(journal, [mage, orc]) is None, "Effect ticks should replay"
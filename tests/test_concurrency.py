@@ -0,0 +1,145 @@
+import sys
+import threading
+import time
+import pytest
+from project2_starter import Character, Warrior, Mage, Rogue
+from rpg.character_pool import CharacterPool, WARRIOR
+from rpg.combat_events import EventStream
+from rpg.concurrency import StripedLocks, LockedDamageRouter, thread_safe_damage
+
+THREADS = 32
+HITS_PER_THREAD = 2_000
+
+def hammer(workers):
+    """Start every worker at the same moment and wait for all of them"""
+    barrier = threading.Barrier(len(workers))
+    threads = [threading.Thread(target=lambda w=w: (barrier.wait(), w())) for w in workers]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+class RacyTarget(Character):
+    """A target whose take_damage pauses between reading and writing health"""
+
+    def __init__(self, health, pause):
+        super().__init__("Boss", health, 0, 0)
+        self.pause = pause
+
+    def take_damage(self, amount):
+        health = self.health
+        self.pause()
+        self.health = health - amount
+
+class TestStripedLocks:
+    """Test lock striping"""
+
+    def test_same_target_same_lock(self):
+        """Test that a target always maps to the same stripe"""
+        locks = StripedLocks(8)
+        boss = Character("Boss", 100, 0, 0)
+
+        assert locks.lock_for(boss) is locks.lock_for(boss), "Stripe should be stable"
+        assert len(locks) == 8, "Stripe count should be configurable"
+
+    def test_pool_handles_share_stripe(self):
+        """Test that separate handles of one pooled character share a lock"""
+        locks = StripedLocks()
+        pool = CharacterPool()
+        boss = pool.add("Boss", 100, 0, 0)
+
+        assert locks.lock_for(boss) is locks.lock_for(pool[boss.index]), "Handles should share a stripe"
+
+    def test_invalid_stripes(self):
+        """Test that at least one stripe is required"""
+        with pytest.raises(ValueError):
+            StripedLocks(0)
+
+class TestNoLostDamage:
+    """Stress tests: 32 threads hammering one raid boss"""
+
+    @pytest.fixture(autouse=True)
+    def fast_switching(self):
+        """Switch threads as often as possible to provoke races"""
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        yield
+        sys.setswitchinterval(interval)
+
+    def test_attacks_from_32_threads(self):
+        """Test that every attack and ability lands exactly once"""
+        boss = Character("Boss", 10 ** 12, 0, 0)
+        party = [(Warrior, "power_strike", 25 + 40), (Mage, "fireball", 32 + 52),
+                 (Rogue, "sneak_attack", 21 + 38)]
+        workers, expected = [], 0
+        for i in range(THREADS):
+            cls, ability, per_round = party[i % 3]
+            hero = cls(f"Hero{i}")
+
+            def work(hero=hero, ability=getattr(hero, ability)):
+                for _ in range(HITS_PER_THREAD // 2):
+                    hero.attack(boss)
+                    ability(boss)
+
+            workers.append(work)
+            expected += per_round * (HITS_PER_THREAD // 2)
+
+        with thread_safe_damage():
+            hammer(workers)
+
+        assert boss.health == 10 ** 12 - expected, "No damage should be lost"
+
+    def test_direct_take_damage_and_pool(self):
+        """Test locked direct take_damage on a pooled boss"""
+        pool = CharacterPool()
+        boss = pool.add("Boss", 10 ** 9, 0, 0)
+        router = LockedDamageRouter()
+
+        def work():
+            for _ in range(HITS_PER_THREAD):
+                router.take_damage(pool[boss.index], 3)
+
+        hammer([work] * THREADS)
+
+        assert boss.health == 10 ** 9 - 3 * HITS_PER_THREAD * THREADS, "No direct damage should be lost"
+
+    def test_race_without_locks(self):
+        """Negative control: two unlocked hits that overlap lose one of them"""
+        both_read = threading.Barrier(2, timeout=5)
+        boss = RacyTarget(1000, both_read.wait)
+        heroes = [Warrior("W1"), Warrior("W2")]
+
+        hammer([lambda h=h: h.attack(boss) for h in heroes])
+
+        assert boss.health == 1000 - 25, "Without locks the second write overwrites the first"
+
+    def test_locks_prevent_the_race(self):
+        """Test that the same interleaving-prone target loses nothing when locked"""
+        boss = RacyTarget(10 ** 6, lambda: time.sleep(0))
+        heroes = [Warrior(f"W{i}") for i in range(8)]
+
+        def work(hero):
+            for _ in range(200):
+                hero.attack(boss)
+
+        with thread_safe_damage():
+            hammer([lambda h=h: work(h) for h in heroes])
+
+        assert boss.health == 10 ** 6 - 25 * 200 * 8, "Locked hits should all land"
+
+    def test_events_still_attributed(self):
+        """Test that locked hits still report their attacker to event streams"""
+        warrior = Warrior("W")
+        target = Character("Dummy", 1000, 0, 0)
+        with EventStream() as stream, thread_safe_damage():
+            warrior.power_strike(target)
+
+        assert [(e.attacker, e.ability) for e in stream] == [("W", "power_strike")], \
+            "Routing should keep attribution"
+
+    def test_router_restored(self):
+        """Test that leaving the context restores immediate damage"""
+        from project2_starter import set_damage_router
+        with thread_safe_damage():
+            pass
+        assert set_damage_router(None) is None, "No router should remain installed"
@@ -0,0 +1,121 @@
+import pytest
+import rpg
+import project2_starter as starter
+from rpg.dice import SeededDice
+from rpg.damage_models import (CombatEngine, DeterministicModel, RandomRangeModel, TableModel,
+                           build_engine, RANDOM_RANGES)
+
+class FixedDice:
+    """Dice that always roll the same number"""
+
+    def __init__(self, value):
+        self.value = value
+
+    def roll(self, low, high):
+        return self.value
+
+class TestEngines:
+    """Test engine construction"""
+
+    def test_deterministic_uses_original_classes(self):
+        """Test that the default model adds no layer at all"""
+        engine = CombatEngine()
+        assert engine.Warrior is starter.Warrior and engine["Mage"] is starter.Mage, "No subclass needed"
+
+    def test_subclasses_keep_isinstance(self):
+        """Test that model-bound classes are still the regular classes"""
+        engine = build_engine("random-range", dice=SeededDice(1))
+        hero = engine.Rogue("R")
+        assert isinstance(hero, starter.Rogue) and type(hero).__name__ == "Rogue", "Should subclass Rogue"
+        assert hero.damage_model is engine.model, "Model should be visible on the class"
+
+    @pytest.mark.parametrize("engine", [
+        build_engine("random-range", dice=SeededDice(1)),
+        build_engine("table", table={"Character": {"attack": 5}, "Mage": {"fireball": 60}}),
+    ])
+    def test_bound_hierarchy(self, engine):
+        """Test that bound classes inherit from the bound parents"""
+        hero = engine.Warrior("W")
+        assert isinstance(hero, engine.Player) and isinstance(hero, engine.Character), \
+            "Bound Warrior should be a bound Player and Character"
+        assert issubclass(engine.Player, engine.Character), "Bound Player should be a bound Character"
+
+    def test_parent_methods_do_not_hide_overrides(self):
+        """Test that a model method on Character leaves subclass overrides alone"""
+        engine = build_engine("table", table={"Character": {"attack": 5}})
+        target = engine.Character("Dummy", 1000, 0, 0)
+        engine.Player("P", 100, 1, 1, "Squire").attack(target)
+        engine.Warrior("W").attack(target)
+
+        assert target.health == 1000 - 5 - 25, "Player inherits the table attack, Warrior keeps its own"
+
+    def test_unknown_model(self):
+        """Test that model names are validated"""
+        with pytest.raises(ValueError):
+            build_engine("chaotic")
+
+class TestModels:
+    """Test the damage each model produces"""
+
+    def test_random_range_clamps(self):
+        """Test rolls are clamped and basic attacks stay deterministic"""
+        engine = CombatEngine(RandomRangeModel(FixedDice(99)))
+        warrior = engine.Warrior("W")
+        target = engine.Character("Dummy", 1000, 0, 0)
+        warrior.power_strike(target)
+        warrior.attack(target)
+
+        assert target.health == 1000 - RANDOM_RANGES["power_strike"].cap - 25, "Cap, then the usual attack"
+
+    def test_per_character_dice(self):
+        """Test that a character's own dice override the model default"""
+        engine = CombatEngine(RandomRangeModel(FixedDice(20)))
+        mage = engine.Mage("M")
+        mage.dice = FixedDice(33)
+        target = engine.Character("Dummy", 1000, 0, 0)
+        mage.fireball(target)
+
+        assert target.health == 1000 - 33, "Own dice should be used"
+
+    def test_table_model(self):
+        """Test table damage with fallback to the formulas"""
+        engine = build_engine("table", table={"Mage": {"fireball": 60}})
+        mage = engine.Mage("M")
+        target = engine.Character("Dummy", 1000, 0, 0)
+        mage.fireball(target)
+        mage.attack(target)
+
+        assert target.health == 1000 - 60 - 32, "Table fireball, formula attack"
+        assert engine.Warrior is starter.Warrior, "Classes without entries are unchanged"
+
+class TestRandomModelModule:
+    """Test that Christopher's_RPG.py runs on the shared engine"""
+
+    def test_same_classes(self):
+        """Test the random model's classes come from project2_starter"""
+        model = rpg.random_model
+        thorin = model.Warrior("Thorin", level=2, dice=FixedDice(30))
+        target = model.Character("Dummy", 500, 0, 0)
+        thorin.power_strike(target)
+
+        assert isinstance(thorin, starter.Warrior), "Random Warrior should be a starter Warrior"
+        assert (thorin.level, thorin.experience) == (2, starter.XP_CURVE[1]), "Level should be kept"
+        assert target.health == 470, "Power strike should use the dice"
+        assert model.Mage("Gandalf").dice is model.DEFAULT_DICE, "Default dice should be shared"
+
+    def test_own_hierarchy(self):
+        """Test Character -> Player -> subclass within the random model itself"""
+        model = rpg.random_model
+        for cls in (model.Warrior, model.Mage, model.Rogue):
+            hero = cls("Hero")
+            assert isinstance(hero, model.Player) and isinstance(hero, model.Character), \
+                f"{cls.__name__} should be a Player and a Character"
+        assert issubclass(model.Player, model.Character), "Player should subclass Character"
+
+    def test_take_damage_none(self):
+        """Test that None damage counts as no damage"""
+        goblin = rpg.random_model.Character("Goblin", 100, 8, 0)
+        goblin.take_damage(None)
+        goblin.take_damage(-5)
+
+        assert goblin.health == 100, "None and negative damage should do nothing"
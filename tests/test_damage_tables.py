@@ -0,0 +1,93 @@
+import pytest
+from project2_starter import Character, Warrior, Mage, Rogue, Weapon, WEAPONS
+from rpg.character_pool import CharacterPool, WARRIOR
+from rpg.slotted_characters import SlottedWarrior, SlottedMage
+
+class TestDamageTables:
+    """Test that damage_table() reports the attack formulas"""
+
+    def test_tables_match_formulas(self):
+        """Test that each class lists its attack and special ability damage"""
+        assert Warrior("W").damage_table() == {"attack": 25, "power_strike": 40}, "Warrior table"
+        assert Mage("M").damage_table() == {"attack": 32, "fireball": 52}, "Mage table"
+        assert Rogue("R").damage_table() == {"attack": 21, "sneak_attack": 38}, "Rogue table"
+        assert Character("C", 100, 7, 0).damage_table() == {"attack": 7}, "Character table"
+
+    @pytest.mark.parametrize("cls", [Character, Warrior, Mage, Rogue])
+    def test_tables_match_hits(self, cls):
+        """Test that every listed ability deals exactly its table entry"""
+        character = cls("C") if cls is not Character else cls("C", 100, 7, 0)
+        character.strength += 4
+        character.weapon = Weapon("Club", 3)
+        for ability, damage in character.damage_table().items():
+            target = Character("Dummy", 1000, 0, 0)
+            getattr(character, ability)(target)
+            assert target.health == 1000 - damage, f"{cls.__name__}.{ability} should match its table"
+
+    def test_attack_overridden_per_class(self):
+        """Test that each subclass keeps its own attack"""
+        for cls in (Warrior, Mage, Rogue):
+            assert cls.attack is not Character.attack, f"{cls.__name__} should override attack"
+
+class TestCurrentStats:
+    """Test that stat and weapon changes apply to the next attack, with no cache to refresh"""
+
+    @pytest.mark.parametrize("change, expected", [
+        (lambda m: setattr(m, "magic", 30), 30 + 12),
+        (lambda m: setattr(m, "weapon", WEAPONS.intern("Elder Staff", 20)), 20 + 20),
+        (lambda m: setattr(m, "weapon", None), 20),
+    ])
+    def test_changes_apply(self, change, expected):
+        """Test that changing magic or the weapon changes the next attack"""
+        mage = Mage("M")
+        target = Character("Dummy", 1000, 0, 0)
+        mage.attack(target)
+        change(mage)
+        mage.attack(target)
+
+        assert target.health == 1000 - 32 - expected, "New stats should be used immediately"
+
+    def test_strength_applies(self):
+        """Test that changing strength changes the special ability"""
+        rogue = Rogue("R")
+        rogue.strength = 20
+        target = Character("Dummy", 1000, 0, 0)
+        rogue.sneak_attack(target)
+
+        assert target.health == 1000 - (40 + 10 + 8), "Sneak attack should use the new strength"
+
+    def test_in_place_weapon_edit(self):
+        """Test that a plain Weapon edited in place is picked up"""
+        club = Character("Brute", 100, 5, 0)
+        club.weapon = Weapon("Club", 2)
+        target = Character("Dummy", 1000, 0, 0)
+        club.attack(target)
+        club.weapon.damage_bonus = 50
+        club.attack(target)
+
+        assert target.health == 1000 - 7 - 55, "The edited bonus should be used"
+
+class TestOtherRepresentations:
+    """Test damage on slotted objects and pool handles"""
+
+    def test_slotted_classes(self):
+        """Test that slotted classes use current stats the same way"""
+        warrior = SlottedWarrior("W")
+        target = SlottedMage("M")
+        target.health = 1000
+        warrior.power_strike(target)
+        warrior.strength = 20
+        warrior.power_strike(target)
+
+        assert target.health == 1000 - 40 - 50, "Slotted warrior should use the new strength"
+
+    def test_pool_handles_never_stale(self):
+        """Test that an edit through one handle is seen by another"""
+        pool = CharacterPool()
+        hero = pool.spawn(WARRIOR, "W")
+        target = pool.add("Dummy", 1000, 0, 0)
+        hero.attack(target)
+        pool[hero.index].strength = 30
+        hero.attack(target)
+
+        assert target.health == 1000 - 25 - 40, "Pool handles should read current stats"
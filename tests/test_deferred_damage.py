@@ -0,0 +1,141 @@
+import threading
+import pytest
+from project2_starter import Character, Warrior, Mage, Rogue
+from rpg.character_pool import CharacterPool, WARRIOR, MAGE
+from rpg.combat_events import EventStream
+from rpg.deferred_damage import DamageAccumulator, deferred_damage
+
+class TestDeferredCommit:
+    """Test per-tick accumulation and bulk commit"""
+
+    def test_damage_waits_for_commit(self):
+        """Test that hits are recorded but not applied until commit"""
+        warrior, mage = Warrior("W"), Mage("M")
+        target = Character("Dummy", 200, 0, 0)
+        with deferred_damage() as tick:
+            warrior.attack(target)
+            mage.fireball(target)
+            assert target.health == 200, "Health should not change before commit"
+            assert tick.pending(target) == 25 + 52, "Pending damage should be summed"
+            updated = tick.commit()
+            assert target.health == 200 - 77, "Commit should apply the summed damage"
+
+        assert updated == 1, "One character should be written"
+        assert tick.hits == 2 and tick.writes == 1, "Two hits should become one write"
+
+    def test_commit_clamps_at_zero(self):
+        """Test that overkill damage is clamped once"""
+        target = Character("Weak", 30, 0, 0)
+        with deferred_damage():
+            for _ in range(5):
+                Rogue("R").sneak_attack(target)
+
+        assert target.health == 0, "Health should stop at 0"
+
+    def test_simultaneous_resolution(self):
+        """Test that characters killed this tick still strike back"""
+        warrior = Warrior("W")
+        goblin = Character("Goblin", 20, 8, 0)
+        with deferred_damage():
+            warrior.power_strike(goblin)
+            goblin.attack(warrior)
+
+        assert goblin.health == 0, "Goblin should die at commit"
+        assert warrior.health == 150 - 8, "Goblin's hit from the same tick should land"
+
+    def test_exit_restores_immediate_damage(self):
+        """Test that damage is immediate again after the context"""
+        target = Character("Dummy", 100, 0, 0)
+        with deferred_damage():
+            pass
+        Warrior("W").attack(target)
+
+        assert target.health == 75, "Attacks should apply at once outside deferred mode"
+
+class TestBulkAndThreads:
+    """Test pooled bulk writes, hooks and worker threads"""
+
+    def test_pool_targets_committed_in_bulk(self):
+        """Test that pooled targets are written through the pool columns"""
+        pool = CharacterPool()
+        first = pool.spawn_many(MAGE, [f"M{i}" for i in range(50)])
+        boss = pool.add("Boss", 10_000, 0, 0)
+        with deferred_damage():
+            for i in range(50):
+                pool[first + i].attack(boss)
+
+        assert boss.health == 10_000 - 50 * 32, "Pooled boss should take all pending damage"
+
+    def test_hooks_see_attributed_sums(self):
+        """Test that commit reports one event per attacker and ability, not per hit"""
+        target = Character("Dummy", 500, 0, 0)
+        warrior = Warrior("W")
+        with EventStream() as stream:
+            with deferred_damage() as tick:
+                warrior.attack(target)
+                Mage("M").attack(target)
+                warrior.attack(target)
+                warrior.power_strike(target)
+        events = [(e.attacker, e.ability, e.damage) for e in stream]
+
+        assert events == [("W", "attack", 50), ("M", "attack", 32), ("W", "power_strike", 40)], \
+            "Commit should keep attackers and abilities"
+        assert target.health == 500 - 122 and tick.writes == 3, "One write per partial sum"
+
+    def test_hits_before_hooks_stay_ticks(self):
+        """Test that hits recorded before a hook was added commit as plain tick damage"""
+        target = Character("Dummy", 500, 0, 0)
+        with deferred_damage() as tick:
+            Warrior("W").attack(target)
+            with EventStream() as stream:
+                Mage("M").attack(target)
+                tick.commit()
+        events = [(e.attacker, e.ability, e.damage) for e in stream]
+
+        assert events == [("M", "attack", 32), (None, "tick", 25)], "Unattributed hits become a tick"
+
+    def test_kill_experience_awarded(self):
+        """Test that a deferred kill still gives the attacker experience"""
+        from rpg.progression import KillExperience
+        warrior = Warrior("W")
+        goblin = Character("Goblin", 30, 8, 0)
+        with KillExperience(), deferred_damage():
+            warrior.power_strike(goblin)
+
+        assert goblin.health == 0 and warrior.experience > 0, "The warrior should get the kill"
+
+    def test_threads_record_without_locks(self):
+        """Test that per-thread buffers merge correctly"""
+        boss = Character("Boss", 10 ** 9, 0, 0)
+        accumulator = DamageAccumulator()
+
+        def work():
+            warrior = Warrior("W")
+            for _ in range(1000):
+                warrior.attack(boss)
+
+        with deferred_damage(accumulator):
+            threads = [threading.Thread(target=work) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            assert accumulator.pending() == 1, "Only the boss should have pending damage"
+
+        assert boss.health == 10 ** 9 - 8 * 1000 * 25, "All thread buffers should be committed"
+
+    def test_finished_thread_buffers_dropped(self):
+        """Test that commit() forgets the buffers of threads that have exited"""
+        boss = Character("Boss", 10 ** 6, 0, 0)
+        accumulator = DamageAccumulator()
+        with deferred_damage(accumulator):
+            for _ in range(5):
+                threads = [threading.Thread(target=Warrior("W").attack, args=(boss,)) for _ in range(20)]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+                accumulator.commit()
+                assert len(accumulator._buffers) == 0, "Finished workers should not keep buffers"
+
+        assert boss.health == 10 ** 6 - 100 * 25, "Hits from finished threads should still land"
@@ -0,0 +1,80 @@
+import pytest
+from rpg.dice import SystemDice, SeededDice, stream_seed
+from rpg import load_random_model
+
+class TestSeededDice:
+    """Test reproducible block-drawn dice"""
+
+    def test_same_seed_same_rolls(self):
+        """Test that two dice with the same seed and stream agree"""
+        first = SeededDice(42, stream=3, block_size=16)
+        second = SeededDice(42, stream=3, block_size=16)
+
+        assert [first.roll(10, 50) for _ in range(100)] == [second.roll(10, 50) for _ in range(100)], \
+            "Same seed should replay the same rolls"
+
+    def test_streams_are_independent(self):
+        """Test that different streams give different sequences"""
+        dice = SeededDice(7)
+        assert dice.spawn(1).rolls(1, 1000, 20) != dice.spawn(2).rolls(1, 1000, 20), \
+            "Different streams should not repeat each other"
+        assert stream_seed(7, 1) != stream_seed(7, 2), "Stream seeds should differ"
+
+    def test_rolls_matches_roll(self):
+        """Test that bulk rolls continue the same sequence as single rolls"""
+        single = SeededDice(5, block_size=8)
+        bulk = SeededDice(5, block_size=8)
+        expected = [single.roll(25, 45) for _ in range(30)]
+
+        assert bulk.rolls(25, 45, 3) + bulk.rolls(25, 45, 27) == expected, \
+            "Bulk and single rolls should produce the same sequence"
+
+    def test_rolls_stay_in_range(self):
+        """Test that every roll lies within the requested bounds"""
+        rolls = SeededDice(1).rolls(15, 40, 5000)
+        assert min(rolls) >= 15 and max(rolls) <= 40, "Rolls should stay inside [low, high]"
+
+    def test_invalid_block_size(self):
+        """Test that a zero block size is rejected"""
+        with pytest.raises(ValueError):
+            SeededDice(1, block_size=0)
+
+    def test_system_dice_range(self):
+        """Test that SystemDice wraps random.randint"""
+        dice = SystemDice()
+        assert all(10 <= roll <= 50 for roll in dice.rolls(10, 50, 100)), "System rolls should be in range"
+        assert dice.spawn(9) is dice, "System dice share one global stream"
+
+class TestSeededAbilities:
+    """Test that random-range abilities replay from a seed"""
+
+    def test_battle_replays_from_seed(self):
+        """Test that the same seed reproduces a whole fight"""
+        rpg = load_random_model()
+
+        def fight(seed):
+            dice = SeededDice(seed)
+            warrior = rpg.Warrior("Thorin", dice=dice.spawn(0))
+            mage = rpg.Mage("Gandalf", dice=dice.spawn(1))
+            rogue = rpg.Rogue("Loki", dice=dice.spawn(2))
+            log = []
+            for _ in range(10):
+                target = rpg.Character("Dummy", 500, 0, 0)
+                warrior.power_strike(target)
+                mage.fireball(target)
+                rogue.sneak_attack(target)
+                log.append(target.health)
+            return log
+
+        assert fight(99) == fight(99), "Same seed should replay the same fight"
+        assert fight(99) != fight(100), "Different seeds should produce different fights"
+
+    def test_default_dice_is_system(self):
+        """Test that characters without dice keep the global random behavior"""
+        rpg = load_random_model()
+        mage = rpg.Mage("Plain")
+        target = rpg.Character("Dummy", 100, 0, 0)
+        mage.fireball(target)
+
+        assert isinstance(mage.dice, SystemDice), "Default dice should be SystemDice"
+        assert 50 <= target.health <= 90, "Fireball should roll 10-50 damage"
@@ -0,0 +1,101 @@
+import pytest
+from project2_starter import Character, Warrior, Mage, Rogue, Weapon, WEAPONS
+from rpg.character_pool import CharacterPool, MAGE
+from rpg.inventory import ItemIndex
+
+class TestInventory:
+    """Test bags and equipment slots"""
+
+    def test_starts_with_current_weapon(self):
+        """Test that a new inventory holds and wields the starting weapon"""
+        index = ItemIndex()
+        bag = index.inventory_for(Warrior("W"))
+
+        assert [w.name for w in bag] == ["Iron Sword"], "Starting weapon should be in the bag"
+        assert bag.slot().name == "Iron Sword", "Starting weapon should be equipped"
+        assert index.inventory_for(bag.owner) is bag, "Inventory should be created once"
+
+    def test_best_weapon(self):
+        """Test that best() tracks the highest bonus through adds and removes"""
+        bag = ItemIndex().inventory_for(Rogue("R"))
+        axe = WEAPONS.intern("Great Axe", 20)
+        bag.add(WEAPONS.intern("Short Bow", 11))
+        bag.add(axe)
+
+        assert bag.best() is axe, "Axe has the highest bonus"
+        bag.remove(axe)
+        assert bag.best().name == "Short Bow", "Next best after removing the axe"
+
+    def test_equip_changes_damage(self):
+        """Test that equipping in the weapon slot changes attack damage"""
+        warrior = Warrior("W")
+        bag = ItemIndex().inventory_for(warrior)
+        target = Character("Dummy", 1000, 0, 0)
+        warrior.attack(target)
+        bag.add(Weapon("Flame Blade", 18))
+        bag.equip_best()
+        warrior.attack(target)
+
+        assert target.health == 1000 - 25 - 33, "New weapon should be used right away"
+        assert warrior.weapon.name == "Flame Blade", "Weapon slot should set character.weapon"
+
+    def test_remove_equipped(self):
+        """Test that removing the last copy of an equipped weapon unequips it"""
+        mage = Mage("M")
+        bag = ItemIndex().inventory_for(mage)
+        bag.remove(mage.weapon)
+
+        assert mage.weapon is None and len(bag) == 0, "Mage should be unarmed"
+
+    def test_invalid_operations(self):
+        """Test errors for items not carried and unknown slots"""
+        bag = ItemIndex().inventory_for(Character("Goblin", 100, 8, 0))
+        with pytest.raises(ValueError):
+            bag.equip(WEAPONS.intern("Iron Sword", 10))
+        with pytest.raises(ValueError):
+            bag.remove(WEAPONS.intern("Iron Sword", 10))
+        bag.add(WEAPONS.intern("Club", 2))
+        with pytest.raises(ValueError):
+            bag.equip(WEAPONS.intern("Club", 2), slot="head")
+
+class TestItemIndex:
+    """Test global item queries"""
+
+    def test_holders_and_wielders(self):
+        """Test who carries and who wields a Magic Staff"""
+        index = ItemIndex()
+        mage, warrior = Mage("M"), Warrior("W")
+        index.inventory_for(mage)
+        index.inventory_for(warrior).add(WEAPONS.intern("Magic Staff", 12))
+
+        assert set(index.holders("Magic Staff")) == {mage, warrior}, "Both carry a staff"
+        assert index.wielders("Magic Staff") == [mage], "Only the mage wields it"
+        assert index.holders("Excalibur") == [], "Unknown items have no holders"
+
+    def test_pool_handles(self):
+        """Test that pooled characters are indexed like objects"""
+        index = ItemIndex()
+        pool = CharacterPool()
+        index.inventory_for(pool.spawn(MAGE, "PM"))
+
+        assert index.wielders("Magic Staff") == [pool[0]], "Handle should be found by value"
+        assert index.inventory_for(pool[0]) is index.inventory_for(pool[0]), "Handles share an inventory"
+
+    def test_bonus_range(self):
+        """Test damage-bonus range queries"""
+        index = ItemIndex()
+        bag = index.inventory_for(Character("Collector", 100, 1, 0))
+        for bonus in (3, 8, 12, 18):
+            bag.add(WEAPONS.intern(f"Blade{bonus}", bonus))
+
+        assert [w.damage_bonus for w in index.items_by_bonus(8, 12)] == [8, 12], "Inclusive range"
+        assert index.strongest().damage_bonus == 18, "Strongest known item"
+
+    def test_forget(self):
+        """Test that forgetting a character clears it from the index"""
+        index = ItemIndex()
+        mage = Mage("M")
+        index.inventory_for(mage)
+        index.forget(mage)
+
+        assert index.holders("Magic Staff") == [] and index.wielders("Magic Staff") == [], "Mage should be gone"
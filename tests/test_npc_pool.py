@@ -0,0 +1,133 @@
+import pytest
+from project2_starter import Character, Warrior, WEAPONS
+from rpg.slotted_characters import SlottedCharacter
+from rpg.npc_pool import NPCPool, GCMonitor
+
+class FakeClock:
+    """Manually advanced clock for idle-eviction tests"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+class TestRecycling:
+    """Test that dead NPCs are reset and re-issued"""
+
+    def test_reuses_dead_character(self):
+        """Test that a reclaimed character comes back with fresh stats"""
+        npcs = NPCPool()
+        goblin = npcs.acquire("Goblin", 100, 8, 0, weapon=WEAPONS.intern("Club", 2))
+        goblin.position = (3, 4)
+        goblin.take_damage(500)
+        npcs.reclaim([goblin])
+        orc = npcs.acquire("Orc", 120, 12, 0)
+
+        assert orc is goblin, "The dead goblin should be recycled"
+        assert (orc.name, orc.health, orc.strength, orc.weapon, orc.position) == \
+            ("Orc", 120, 12, None, None), "Recycled NPC should be fully reset"
+        assert orc.damage_table() == {"attack": 12}, "Damage should come from the new stats"
+
+    def test_reclaim_skips_living(self):
+        """Test that only dead characters are taken back"""
+        npcs = NPCPool()
+        alive, dead = npcs.acquire("A", 10, 1, 0), npcs.acquire("B", 10, 1, 0)
+        dead.take_damage(10)
+
+        assert npcs.reclaim([alive, dead]) == 1 and len(npcs) == 1, "Only the dead NPC should be pooled"
+
+    def test_double_release_ignored(self):
+        """Test that one object is never handed out twice"""
+        npcs = NPCPool()
+        goblin = npcs.acquire("Goblin", 100, 8, 0)
+        assert npcs.release(goblin) and not npcs.release(goblin), "Second release should be refused"
+        assert npcs.acquire("G", 1, 1, 0) is not npcs.acquire("G", 1, 1, 0), "Distinct objects"
+
+    def test_other_factories(self):
+        """Test recycling slotted characters"""
+        npcs = NPCPool(factory=SlottedCharacter)
+        first = npcs.acquire("Goblin", 100, 8, 0)
+        npcs.release(first)
+
+        assert npcs.acquire("Imp", 30, 4, 2) is first and first.magic == 2, "Slotted NPCs should recycle"
+
+    def test_class_constructor_arguments(self):
+        """Test that acquire passes the factory's own constructor arguments"""
+        npcs = NPCPool(factory=Warrior)
+        first = npcs.acquire("Boromir")
+        first.gain_experience(500)
+        first.take_damage(1000)
+        npcs.reclaim([first])
+        second = npcs.acquire("Faramir", 2)
+
+        assert second is first, "The dead warrior should be recycled"
+        assert (second.name, second.level, second.experience, second.health) == ("Faramir", 2, 100, 150), \
+            "Warrior.__init__ should reset it"
+
+    def test_reset_callable(self):
+        """Test a factory function with its own reset"""
+        def reset(character, name):
+            Character.__init__(character, name, 50, 5, 0)
+
+        npcs = NPCPool(factory=lambda name: Character(name, 50, 5, 0), reset=reset)
+        rat = npcs.acquire("Rat")
+        rat.take_damage(50)
+        npcs.reclaim([rat])
+
+        assert npcs.acquire("Bat") is rat and (rat.name, rat.health) == ("Bat", 50), "reset should be used"
+        with pytest.raises(TypeError):
+            NPCPool(factory=lambda name: Character(name, 50, 5, 0))
+
+class TestCapacityAndEviction:
+    """Test the pool's memory bounds"""
+
+    def test_capacity(self):
+        """Test that releases beyond capacity are dropped"""
+        npcs = NPCPool(capacity=2)
+        kept = [npcs.release(Character(f"G{i}", 0, 1, 0)) for i in range(3)]
+
+        assert kept == [True, True, False] and npcs.stats()["dropped"] == 1, "Third release should be dropped"
+
+    def test_evict_idle(self):
+        """Test that only objects idle longer than max_idle are evicted"""
+        clock = FakeClock()
+        npcs = NPCPool(max_idle=10, clock=clock)
+        npcs.release(Character("Old", 0, 1, 0))
+        clock.now = 8
+        newer = Character("New", 0, 1, 0)
+        npcs.release(newer)
+        clock.now = 12
+
+        assert npcs.evict_idle() == 1 and len(npcs) == 1, "Only the old NPC should be evicted"
+        assert npcs.acquire("X", 1, 1, 0) is newer, "Newer NPC should remain available"
+
+    def test_invalid_capacity(self):
+        """Test that capacity cannot be negative"""
+        with pytest.raises(ValueError):
+            NPCPool(capacity=-1)
+
+class TestStats:
+    """Test reuse and GC statistics"""
+
+    def test_reuse_rate(self):
+        """Test the reuse rate over several encounters"""
+        hero = Warrior("Hero")
+        npcs = NPCPool()
+        for _ in range(4):
+            encounter = [npcs.acquire("Goblin", 30, 8, 0) for _ in range(10)]
+            for goblin in encounter:
+                hero.power_strike(goblin)
+            npcs.reclaim(encounter)
+        stats = npcs.stats()
+
+        assert (stats["created"], stats["reused"]) == (10, 30), "Later waves should be recycled"
+        assert stats["reuse_rate"] == 0.75, "Reuse rate should be reused / acquired"
+
+    def test_gc_monitor(self):
+        """Test that forced collections are counted"""
+        import gc
+        with GCMonitor() as monitor:
+            gc.collect()
+
+        assert monitor.stats()["by_generation"][2] >= 1, "Full collection should be recorded"
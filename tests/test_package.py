@@ -0,0 +1,87 @@
+import os
+import subprocess
+import sys
+import pytest
+import rpg
+from rpg import simulation
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def fresh_modules(code):
+    """Names of the optional modules loaded after running code in a new interpreter"""
+    probe = (f"{code}; import sys, rpg; print(' '.join(m for m in rpg.SUBSYSTEMS + ('threading', 'random') "
+             f"if 'rpg.' + m in sys.modules or m in sys.modules))")
+    output = subprocess.run([sys.executable, "-c", probe], cwd=ROOT, capture_output=True, text=True, check=True)
+    return output.stdout.split()
+
+class TestLazyImports:
+    """Test that optional subsystems load only on demand"""
+
+    def test_core_import_is_minimal(self):
+        """Test that importing the core loads no optional subsystem"""
+        assert fresh_modules("from rpg import Warrior, Character") == [], "Only the core should be imported"
+
+    def test_subsystem_loaded_on_access(self):
+        """Test that touching a subsystem imports just that subsystem"""
+        loaded = fresh_modules("import rpg; rpg.render")
+        assert "rendering" in loaded and "simulation" not in loaded, "Only rendering should load"
+
+    def test_lazy_attributes(self):
+        """Test module and shortcut attributes"""
+        from rpg import snapshot, CharacterPool
+        from rpg import character_pool
+
+        assert CharacterPool is character_pool.CharacterPool, "Shortcut should be the real class"
+        assert snapshot.write_snapshot is rpg.write_snapshot, "Module attribute should be the real module"
+        assert "simulation" in dir(rpg), "Lazy names should be listed"
+        with pytest.raises(AttributeError):
+            rpg.no_such_subsystem
+
+    def test_submodule_imports(self):
+        """Test that explicit submodule imports and lazy attributes agree"""
+        import rpg.simulation
+        from rpg.status_effects import EffectEngine
+
+        assert rpg.simulation is simulation is sys.modules["rpg.simulation"], "One module object"
+        assert EffectEngine is rpg.EffectEngine, "Shortcut should be the real class"
+        with pytest.raises(ModuleNotFoundError):
+            import rpg.no_such_subsystem
+
+    def test_no_global_side_effects(self, tmp_path):
+        """Test that importing the package leaves sys.path, sys.meta_path and top-level names alone"""
+        os.symlink(os.path.join(ROOT, "rpg"), tmp_path / "rpg")
+        probe = ("import sys; path, finders = list(sys.path), list(sys.meta_path); "
+                 "import rpg, rpg.simulation, rpg.dice, rpg.snapshot; "
+                 "print(sys.path == path, sys.meta_path == finders, 'dice' in sys.modules, "
+                 "'snapshot' in sys.modules, rpg.Warrior('W').health)")
+        env = {key: value for key, value in os.environ.items() if key != "PYTHONPATH"}
+        output = subprocess.run([sys.executable, "-c", probe], cwd=tmp_path, env=env,
+                                capture_output=True, text=True, check=True)
+
+        assert output.stdout.split() == ["True", "True", "False", "False", "150"], \
+            "The package should be self-contained"
+
+    def test_starter_shim(self):
+        """Test that project2_starter re-exports the core objects"""
+        import project2_starter
+        from rpg import core
+
+        assert project2_starter.Warrior is core.Warrior is rpg.Warrior, "Classes should be shared"
+        assert project2_starter.add_damage_hook is core.add_damage_hook, "Hooks should be shared"
+
+class TestRandomModel:
+    """Test loading Christopher's_RPG.py through the package"""
+
+    def test_single_module(self):
+        """Test that the package and the simulator share one module object"""
+        model = rpg.random_model
+        assert model is simulation.load_random_model(), "Loader should be shared"
+        assert model is sys.modules["christophers_rpg"], "Module should be registered"
+        assert model.Warrior("Conan").health == 150, "Classes should work"
+
+    def test_single_copy_everywhere(self):
+        """Test that every way of reaching the random model yields one module"""
+        from rpg import random_model
+
+        assert random_model is rpg.load_random_model() is sys.modules["christophers_rpg"], \
+            "Import forms should share the registered module"
@@ -0,0 +1,108 @@
+import pytest
+from project2_starter import Character, Warrior, Mage, Rogue, damage_hooks_active
+from rpg.character_pool import CharacterPool, ROGUE
+from rpg.profiling import CombatProfiler
+
+class TestCounters:
+    """Test per-class and per-method counters"""
+
+    def test_calls_and_damage(self):
+        """Test counts for attacks, abilities and damage received"""
+        warrior, mage = Warrior("W"), Mage("M")
+        target = Character("Dummy", 1000, 0, 0)
+        with CombatProfiler() as profiler:
+            warrior.attack(target)
+            warrior.power_strike(target)
+            mage.fireball(target)
+        stats = profiler.snapshot()
+
+        assert stats["Warrior.attack"]["calls"] == 1 and stats["Warrior.attack"]["damage"] == 25, "Warrior attack"
+        assert stats["Warrior.power_strike"]["damage"] == 40, "Power strike damage"
+        assert stats["Mage.fireball"]["damage"] == 52, "Fireball damage"
+        assert stats["Character.take_damage"] == {"calls": 3, "seconds": stats["Character.take_damage"]["seconds"],
+                                                  "damage": 25 + 40 + 52}, "Damage received"
+        assert stats["Warrior.attack"]["seconds"] > 0, "Time should be recorded"
+
+    def test_by_method_sums_classes(self):
+        """Test totals over all classes, including pool handles"""
+        pool = CharacterPool()
+        rogue = pool.spawn(ROGUE, "R")
+        target = Character("Dummy", 1000, 0, 0)
+        with CombatProfiler() as profiler:
+            Rogue("R2").attack(target)
+            rogue.attack(target)
+
+        assert profiler.by_method()["attack"]["calls"] == 2, "Both rogues should be counted"
+        assert "PooledRogue.attack" in profiler.snapshot(), "Handles should be reported by their class"
+
+    def test_overriding_subclasses(self):
+        """Test that Christopher's_RPG.py classes are wrapped and their rows agree"""
+        import rpg
+        model = rpg.random_model
+        original = model.Warrior.power_strike
+        warrior, mage = model.Warrior("Conan"), model.Mage("Merlin")
+        target = model.Character("Dummy", 1000, 0, 0)
+        with CombatProfiler() as profiler:
+            warrior.power_strike(target)
+            mage.fireball(target)
+            target.take_damage(5)
+        stats = profiler.snapshot()
+
+        assert stats["Warrior.power_strike"]["calls"] == 1, "Overridden ability should be timed"
+        assert stats["Mage.fireball"]["calls"] == 1, "Overridden ability should be timed"
+        assert stats["Character.take_damage"]["calls"] == 3, "super() calls should not be counted twice"
+        assert stats["Character.take_damage"]["damage"] == 1000 - target.health, "Damage received should agree"
+        assert model.Warrior.power_strike is original, "Disabling should restore subclass methods"
+
+    def test_no_damage_without_calls(self):
+        """Test that every row with damage also has calls"""
+        from rpg.damage_models import build_engine
+        engine = build_engine("table", table={"Character": {"attack": 5}, "Mage": {"fireball": 60}})
+        target = Character("Dummy", 1000, 0, 0)
+        with CombatProfiler() as profiler:
+            engine.Mage("M").fireball(target)
+            engine.Character("C", 10, 1, 0).attack(target)
+
+        for name, row in profiler.snapshot().items():
+            assert row["calls"] > 0 or row["damage"] == 0, f"{name} has damage but no calls"
+        assert profiler.snapshot()["Mage.fireball"]["damage"] == 60, "Engine abilities should be counted"
+
+class TestLifecycle:
+    """Test enabling and disabling"""
+
+    def test_disabled_restores_methods(self):
+        """Test that a disabled profiler leaves no wrappers or hooks behind"""
+        original = Character.take_damage
+        with CombatProfiler():
+            assert Character.take_damage is not original, "Method should be wrapped while enabled"
+        assert Character.take_damage is original, "Original method should be restored"
+        assert not damage_hooks_active(), "Damage hook should be removed"
+
+    def test_only_one_active(self):
+        """Test that two profilers cannot wrap the same methods"""
+        with CombatProfiler():
+            with pytest.raises(RuntimeError):
+                CombatProfiler().enable()
+
+    def test_counts_kept_after_disable(self):
+        """Test that nothing is counted while disabled"""
+        profiler = CombatProfiler()
+        Warrior("W").attack(Character("Dummy", 100, 0, 0))
+        with profiler:
+            Warrior("W").attack(Character("Dummy", 100, 0, 0))
+        Warrior("W").attack(Character("Dummy", 100, 0, 0))
+
+        assert profiler.snapshot()["Warrior.attack"]["calls"] == 1, "Only the profiled call should count"
+
+class TestPrometheus:
+    """Test the text exposition export"""
+
+    def test_format(self):
+        """Test metric names, labels and values"""
+        with CombatProfiler() as profiler:
+            Warrior("W").attack(Character("Dummy", 100, 0, 0))
+        text = profiler.prometheus()
+
+        assert "# TYPE rpg_method_calls_total counter" in text, "Type lines should be present"
+        assert 'rpg_method_calls_total{class="Warrior",method="attack"} 1\n' in text, "Call sample"
+        assert 'rpg_method_damage_total{class="Character",method="take_damage"} 25\n' in text, "Damage sample"
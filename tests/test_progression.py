@@ -0,0 +1,172 @@
+import gc
+import pytest
+from project2_starter import (Character, Player, Warrior, Mage, XP_CURVE, MAX_LEVEL,
+                              level_for_experience)
+from rpg.character_pool import CharacterPool, WARRIOR, MAGE
+from rpg.slotted_characters import SlottedRogue
+from rpg.progression import KillExperience, award_experience
+
+class TestExperienceCurve:
+    """Test the precomputed XP curve"""
+
+    def test_levels_from_curve(self):
+        """Test level lookup at and around the thresholds"""
+        assert level_for_experience(0) == 1, "New players should be level 1"
+        assert level_for_experience(XP_CURVE[1] - 1) == 1, "Just below level 2"
+        assert level_for_experience(XP_CURVE[1]) == 2, "Exactly at level 2"
+        assert level_for_experience(10 ** 12) == MAX_LEVEL, "Levels should be capped"
+
+    def test_player_attributes(self):
+        """Test that players start with level and experience"""
+        mage = Mage("M")
+        assert (mage.level, mage.experience) == (1, 0), "Players should start at level 1"
+        assert Player("P", 100, 10, 10, "Bard", level=3).experience == XP_CURVE[2], \
+            "Starting level should set matching experience"
+
+    @pytest.mark.parametrize("level", [0, -1, MAX_LEVEL + 1])
+    def test_invalid_starting_level(self, level):
+        """Test that starting levels outside the curve are rejected"""
+        with pytest.raises(ValueError):
+            Warrior("W", level=level)
+        with pytest.raises(ValueError):
+            SlottedRogue("R", level=level)
+
+class TestGainExperience:
+    """Test single-player experience and level-ups"""
+
+    def test_multi_level_gain(self):
+        """Test that a large award applies every level-up at once"""
+        warrior = Warrior("W")
+        gained = warrior.gain_experience(XP_CURVE[3])
+
+        assert gained == 3 and warrior.level == 4, "Warrior should reach level 4"
+        assert (warrior.health, warrior.strength, warrior.magic) == (150 + 36, 15 + 9, 3 + 3), \
+            "Stats should scale with every level gained"
+
+    def test_level_up_changes_damage(self):
+        """Test that stronger stats change the next attack"""
+        warrior = Warrior("W")
+        warrior.gain_experience(XP_CURVE[1])
+        target = Character("Dummy", 1000, 0, 0)
+        warrior.attack(target)
+
+        assert target.health == 1000 - (18 + 10), "Attack should use the levelled strength"
+
+    def test_slotted_players(self):
+        """Test that slotted players level up the same way"""
+        rogue = SlottedRogue("R")
+        assert rogue.gain_experience(XP_CURVE[1]) == 1, "Slotted rogue should level up"
+        assert rogue.strength == 12, "Slotted stats should scale"
+
+    def test_level_up_capped(self):
+        """Test that level_up stops at MAX_LEVEL and keeps experience in step"""
+        warrior = Warrior("W", level=MAX_LEVEL - 2)
+        health = warrior.health
+
+        assert warrior.level_up(5) == 2 and warrior.level == MAX_LEVEL, "Level should stop at the cap"
+        assert warrior.health == health + 12 * 2, "Only the levels gained should add stats"
+        assert warrior.experience == XP_CURVE[-1], "Experience should reach the cap's threshold"
+        assert warrior.level_up() == 0 and warrior.gain_experience(10 ** 9) == 0, \
+            "Nothing should be gained past the cap"
+
+    def test_direct_level_up_syncs_experience(self):
+        """Test that a manual level-up does not leave experience behind the curve"""
+        mage = Mage("M")
+        mage.level_up(2)
+        assert mage.experience == XP_CURVE[2], "Experience should match the new level"
+        assert mage.gain_experience(XP_CURVE[3] - XP_CURVE[2]) == 1, "Next level should need the usual amount"
+
+class TestKillExperience:
+    """Test experience for killing blows"""
+
+    def test_only_killing_blow_awards(self):
+        """Test that only the hit that kills awards experience, once"""
+        warrior, mage = Warrior("W"), Mage("M")
+        goblin = Character("Goblin", 50, 5, 0)
+        with KillExperience() as kills:
+            mage.attack(goblin)
+            warrior.attack(goblin)
+            warrior.attack(goblin)
+
+        assert (mage.experience, warrior.experience) == (0, 50), "Only the killer gains experience"
+        assert kills.kills == 1, "Overkill should not count twice"
+
+    def test_dead_targets_not_kept(self):
+        """Test that credited kills do not keep dead targets alive"""
+        warrior = Warrior("W")
+        with KillExperience() as kills:
+            for i in range(100):
+                warrior.power_strike(Character(f"Goblin{i}", 10, 0, 0))
+            gc.collect()
+            assert kills.kills == 100 and len(kills._credited) == 0, "Dead goblins should be collectable"
+
+    def test_pinned_cleared_on_detach(self):
+        """Test that pool handles, which cannot be weakly referenced, are released on detach"""
+        pool = CharacterPool()
+        hero, goblin = pool.spawn(WARRIOR, "W"), pool.add("Goblin", 10, 0, 0)
+        with KillExperience() as kills:
+            hero.attack(goblin)
+            del goblin
+            hero.attack(pool[1])
+            assert kills.kills == 1 and len(kills._pinned) == 1, "A pooled kill should be credited once"
+
+        assert len(kills._pinned) == 0, "Detaching should forget credited kills"
+
+    def test_not_attached(self):
+        """Test that kills award nothing without a tracker"""
+        warrior = Warrior("W")
+        warrior.power_strike(Character("Goblin", 10, 0, 0))
+        assert warrior.experience == 0, "No tracker, no experience"
+
+class TestAwardExperience:
+    """Test batched awards over a roster"""
+
+    def test_mixed_roster(self):
+        """Test objects and pool handles in one call"""
+        pool = CharacterPool()
+        pooled = pool.spawn(MAGE, "PM")
+        roster = [Warrior("W"), pooled, Mage("M")]
+        levelled = award_experience(roster, [XP_CURVE[1], XP_CURVE[2], 10])
+
+        assert levelled == roster[:2], "Warrior and pooled mage should level"
+        assert pooled.level == 3 and pool.magic[pooled.index] == 20 + 8, "Pool columns should update"
+        assert roster[2].level == 1 and roster[2].experience == 10, "Small award should not level"
+
+    def test_pool_matches_objects(self):
+        """Test that the columnar path gives the same stats as gain_experience"""
+        pool = CharacterPool()
+        first = pool.spawn_many(WARRIOR, [f"W{i}" for i in range(100)])
+        amounts = [i * 37 for i in range(100)]
+        pool.award_experience(range(first, first + 100), amounts)
+        for i, amount in enumerate(amounts):
+            warrior = Warrior("W")
+            warrior.gain_experience(amount)
+            handle = pool[first + i]
+            assert (handle.level, handle.health, handle.strength) == \
+                (warrior.level, warrior.health, warrior.strength), "Pool should match objects"
+
+    def test_non_players_skipped(self):
+        """Test that plain Characters are skipped on both the object and pool paths"""
+        pool = CharacterPool()
+        npc_row = pool.add_character(Character("Goblin", 50, 5, 0))
+        warrior_row = pool.spawn(WARRIOR, "PW")
+        goblin = Character("Goblin", 50, 5, 0)
+        levelled = award_experience([goblin, npc_row, warrior_row], XP_CURVE[1])
+
+        assert levelled == [warrior_row], "Only the player should level up"
+        assert not hasattr(goblin, "experience"), "The object should be left alone"
+        assert (npc_row.level, npc_row.experience, npc_row.health) == (1, 0, 50), \
+            "The pool row should be left alone"
+
+    def test_float_amounts(self):
+        """Test that any real number works as a shared amount"""
+        warrior, pooled = Warrior("W"), CharacterPool().spawn(MAGE, "PM")
+        levelled = award_experience([warrior, pooled], XP_CURVE[1] + 0.5)
+
+        assert levelled == [warrior, pooled], "Float awards should level both paths"
+        assert warrior.experience == pooled.experience == XP_CURVE[1], "Both paths should round down alike"
+
+    def test_length_mismatch(self):
+        """Test that per-player amounts must line up"""
+        with pytest.raises(ValueError):
+            award_experience([Warrior("W")], [1, 2])
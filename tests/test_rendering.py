@@ -0,0 +1,83 @@
+import csv
+import io
+import json
+import pytest
+from project2_starter import Character, Warrior, Mage, Rogue
+from rpg.character_pool import CharacterPool, WARRIOR
+from rpg.rendering import render, stat_record, FIELDS
+
+class TestDisplayStatsOutput:
+    """Test the exact single-character output"""
+
+    def test_player_output_lines(self, capsys):
+        """Test the exact display_stats output of a Warrior"""
+        Warrior("Aragorn").display_stats()
+
+        assert capsys.readouterr().out == (
+            "Name: Aragorn\nHealth: 150\nStrength: 15\nMagic: 3\n"
+            "Weapon: Iron Sword (+10 dmg)\nClass: Warrior\nLevel: 1\nExperience: 0\n"
+        ), "display_stats should print the stat, class, level and experience lines"
+
+    def test_npc_without_weapon(self, capsys):
+        """Test that characters without a weapon skip the weapon line"""
+        Character("Goblin", 100, 8, 0).display_stats()
+
+        assert capsys.readouterr().out == "Name: Goblin\nHealth: 100\nStrength: 8\nMagic: 0\n", \
+            "NPC output should not include a weapon line"
+
+class TestRender:
+    """Test batched rendering of many characters"""
+
+    def roster(self):
+        return [Warrior("W"), Mage("M"), Rogue("R"), Character("Goblin", 100, 8, 0)]
+
+    def test_text_matches_display_stats(self, capsys):
+        """Test that text format equals calling display_stats on each character"""
+        roster = self.roster()
+        for character in roster:
+            character.display_stats()
+        expected = capsys.readouterr().out
+        buffer = io.StringIO()
+        render(roster, stream=buffer)
+
+        assert buffer.getvalue() == expected, "Text rendering should match display_stats"
+
+    def test_single_write(self):
+        """Test that rendering issues exactly one write call"""
+        class CountingStream(io.StringIO):
+            writes = 0
+            def write(self, text):
+                CountingStream.writes += 1
+                return super().write(text)
+
+        render([Warrior(f"W{i}") for i in range(1000)], fmt="table", stream=CountingStream())
+        assert CountingStream.writes == 1, "Roster should be written in one call"
+
+    def test_jsonl_and_csv(self):
+        """Test structured formats"""
+        roster = self.roster()
+        jsonl, table = io.StringIO(), io.StringIO()
+        render(roster, fmt="jsonl", stream=jsonl)
+        render(roster, fmt="csv", stream=table)
+        records = [json.loads(line) for line in jsonl.getvalue().splitlines()]
+        rows = list(csv.DictReader(io.StringIO(table.getvalue())))
+
+        assert records[1] == stat_record(roster[1]), "JSON lines should hold every field"
+        assert records[3]["weapon"] is None, "Missing weapons should be null"
+        assert [row["name"] for row in rows] == ["W", "M", "R", "Goblin"], "CSV should have one row per character"
+        assert tuple(rows[0]) == FIELDS, "CSV header should list the fields"
+
+    def test_pool_handles_render(self):
+        """Test that pooled characters render like regular ones"""
+        pool = CharacterPool()
+        pool.spawn_many(WARRIOR, ["A", "B"])
+        pooled, plain = io.StringIO(), io.StringIO()
+        render(pool, fmt="table", stream=pooled)
+        render([Warrior("A"), Warrior("B")], fmt="table", stream=plain)
+
+        assert pooled.getvalue() == plain.getvalue(), "Pooled table should match the regular one"
+
+    def test_unknown_format(self):
+        """Test that unknown formats raise ValueError"""
+        with pytest.raises(ValueError):
+            render(self.roster(), fmt="xml", stream=io.StringIO())
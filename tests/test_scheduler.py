@@ -0,0 +1,79 @@
+import pytest
+from project2_starter import Character, Warrior, Mage, Rogue
+from rpg.scheduler import BattleScheduler
+
+class TestTurnOrder:
+    """Test speed-based initiative"""
+
+    def test_faster_actor_acts_more(self):
+        """Test that an actor with double speed takes twice the turns"""
+        scheduler = BattleScheduler()
+        fast = Character("Fast", 10_000, 1, 0)
+        slow = Character("Slow", 10_000, 1, 0)
+        scheduler.add(fast, "a", speed=2.0)
+        scheduler.add(slow, "b", speed=1.0)
+        scheduler.run(until=10.0)
+
+        assert slow.health == 10_000 - 20, "Fast actor should attack 20 times in 10 time units"
+        assert fast.health == 10_000 - 10, "Slow actor should attack 10 times in 10 time units"
+
+    def test_invalid_speed(self):
+        """Test that speed must be positive"""
+        with pytest.raises(ValueError):
+            BattleScheduler().add(Warrior("W"), "a", speed=0)
+
+class TestCooldowns:
+    """Test special abilities as timed events"""
+
+    def test_ability_respects_cooldown(self):
+        """Test that specials are used once per cooldown and attacks fill the gaps"""
+        scheduler = BattleScheduler(cooldowns={"power_strike": 3.0})
+        warrior = Warrior("W")
+        dummy = Character("Dummy", 100_000, 0, 0)
+        scheduler.add(warrior, "heroes", speed=1.0)
+        scheduler.add(dummy, "dummies", speed=0.001)
+        stats = scheduler.run(until=9.0)
+
+        # Turns at t=1..9: specials at 1, 4, 7; basic attacks otherwise
+        assert stats["ability_uses"] == 3, "Power strike should be used once per cooldown"
+        assert dummy.health == 100_000 - (3 * 40 + 6 * 25), "Damage should mix specials and attacks"
+
+class TestBattles:
+    """Test full battles with lazy dead skipping"""
+
+    def test_battle_has_winner(self):
+        """Test that a battle runs until one team remains"""
+        scheduler = BattleScheduler()
+        for i in range(20):
+            scheduler.add(Warrior(f"W{i}"), "north", speed=1.0)
+        for i in range(20):
+            scheduler.add(Character(f"Goblin{i}", 30, 3, 0), "south", speed=1.5)
+        stats = scheduler.run()
+
+        assert stats["winner"] == "north", "Warriors should beat weak goblins"
+        assert stats["actions"] > 0 and stats["actions_per_second"] > 0, "Throughput should be reported"
+
+    def test_dead_actors_stop_acting(self):
+        """Test that killed characters never take another turn"""
+        scheduler = BattleScheduler()
+        mage = Mage("M")
+        victim = Character("Victim", 1, 1000, 0)
+        scheduler.add(mage, "a", speed=10.0)
+        scheduler.add(victim, "b", speed=1.0)
+        stats = scheduler.run()
+
+        assert victim.health == 0, "Victim should die before its first turn"
+        assert mage.health == 80, "Dead characters should not attack"
+        assert stats["winner"] == "a", "Mage should win"
+
+    def test_max_actions_and_resume(self):
+        """Test that runs can be split and resumed"""
+        scheduler = BattleScheduler()
+        for i in range(5):
+            scheduler.add(Rogue(f"R{i}"), "x")
+            scheduler.add(Rogue(f"S{i}"), "y")
+        first = scheduler.run(max_actions=7)
+        second = scheduler.run(max_actions=7)
+
+        assert first["actions"] == 7 and second["actions"] == 7, "Each run should stop at max_actions"
+        assert scheduler.actions == 14, "Total action count should accumulate"
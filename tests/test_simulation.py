@@ -0,0 +1,42 @@
+import pytest
+from rpg.simulation import simulate_matchups, run_chunk, MatchupResult
+
+class TestSimulateMatchups:
+    """Test the Monte Carlo matchup simulator"""
+
+    def test_counts_add_up(self):
+        """Test that every duel ends in exactly one outcome"""
+        results = simulate_matchups([("Warrior", "Mage"), ("Mage", "Rogue")], duels=500,
+                                    seed=3, workers=0, chunk_size=128)
+
+        for result in results.values():
+            assert result.duels == 500, "Every requested duel should be counted"
+            assert sum(result.turns.values()) == 500, "Turn histogram should cover every duel"
+            assert 0.0 <= result.win_rate() <= 1.0, "Win rate should be a fraction"
+
+    def test_results_independent_of_workers(self):
+        """Test that worker count does not change seeded results"""
+        pairs = [("Rogue", "Mage")]
+        serial = simulate_matchups(pairs, duels=300, seed=11, workers=0, chunk_size=50)
+        parallel = simulate_matchups(pairs, duels=300, seed=11, workers=2, chunk_size=50)
+
+        assert serial[("Rogue", "Mage")].summary() == parallel[("Rogue", "Mage")].summary(), \
+            "Seeded simulations should not depend on the worker count"
+        assert serial[("Rogue", "Mage")].turns == parallel[("Rogue", "Mage")].turns, \
+            "Turn histograms should match"
+
+    def test_unknown_class_rejected(self):
+        """Test that unknown class names raise ValueError"""
+        with pytest.raises(ValueError):
+            simulate_matchups([("Warrior", "Paladin")], duels=10, workers=0)
+
+    def test_merge_combines_chunks(self):
+        """Test that merging partial results sums their counters"""
+        first = run_chunk("Warrior", "Rogue", seed=1, chunk=0, count=20)
+        second = run_chunk("Warrior", "Rogue", seed=1, chunk=1, count=30)
+        merged = MatchupResult("Warrior", "Rogue").merge(first).merge(second)
+
+        assert merged.duels == 50, "Merged result should hold both chunks"
+        assert sum(merged.first_damage.values()) == (sum(first.first_damage.values())
+                                                     + sum(second.first_damage.values())), \
+            "Damage histograms should be summed"
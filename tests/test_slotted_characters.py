@@ -0,0 +1,85 @@
+import pytest
+from project2_starter import Character, Warrior, Mage, Rogue, XP_CURVE
+from rpg.slotted_characters import (SlottedCharacter, SlottedPlayer, SlottedWarrior, SlottedMage,
+                                SlottedRogue, SlottedWeapon, SlottedSharedWeapon, select_classes,
+                                REGULAR_CLASSES, SLOTTED_CLASSES, SLOTTED_WEAPONS)
+
+class TestSlottedLayout:
+    """Test that slotted classes carry no instance __dict__"""
+
+    def test_no_instance_dict(self):
+        """Test that every slotted class rejects unknown attributes"""
+        for entity in (SlottedCharacter("Npc", 50, 5, 0), SlottedWarrior("W"),
+                       SlottedMage("M"), SlottedRogue("R"), SlottedWeapon("Club", 3),
+                       SlottedSharedWeapon("Axe", 4)):
+            assert not hasattr(entity, "__dict__"), f"{type(entity).__name__} should not have a __dict__"
+            with pytest.raises(AttributeError):
+                entity.unexpected = 1
+
+    def test_player_fields(self):
+        """Test that slotted players keep character_class and level"""
+        mage = SlottedMage("LevelMage")
+
+        assert mage.character_class == "Mage", "Class name should be set"
+        assert mage.level == 1, "Level should default to 1"
+        assert isinstance(mage, SlottedPlayer), "Mage should inherit from SlottedPlayer"
+        assert isinstance(mage, SlottedCharacter), "Mage should inherit from SlottedCharacter"
+
+    def test_shared_starting_weapons(self):
+        """Test that slotted starting weapons are interned and read-only"""
+        first, second = SlottedWarrior("A"), SlottedWarrior("B")
+
+        assert first.weapon is second.weapon, "Warriors should share their sword"
+        assert first.weapon is SLOTTED_WEAPONS.intern("Iron Sword", 10), "Sword should come from the registry"
+        with pytest.raises(AttributeError):
+            first.weapon.damage_bonus = 99
+
+class TestSlottedBehavior:
+    """Test that slotted classes behave like the regular classes"""
+
+    def test_combat_matches_regular(self):
+        """Test attacks and abilities deal the same damage in both hierarchies"""
+        pairs = [(SlottedWarrior("W"), Warrior("W"), "power_strike"),
+                 (SlottedMage("M"), Mage("M"), "fireball"),
+                 (SlottedRogue("R"), Rogue("R"), "sneak_attack")]
+
+        for slotted, plain, ability in pairs:
+            slotted_target = SlottedCharacter("Target", 100, 0, 0)
+            plain_target = Character("Target", 100, 0, 0)
+            slotted.attack(slotted_target)
+            plain.attack(plain_target)
+            getattr(slotted, ability)(slotted_target)
+            getattr(plain, ability)(plain_target)
+            assert slotted_target.health == plain_target.health, f"{ability} should match the regular class"
+
+    def test_display_stats_matches_regular(self, capsys):
+        """Test that display_stats prints identical output"""
+        SlottedRogue("Shadow").display_stats()
+        slotted_output = capsys.readouterr().out
+        Rogue("Shadow").display_stats()
+        plain_output = capsys.readouterr().out
+
+        assert slotted_output == plain_output, "display_stats output should be identical"
+
+class TestSelectClasses:
+    """Test picking a representation by flag"""
+
+    def test_explicit_flag(self):
+        """Test that the slotted flag selects the matching namespace"""
+        assert select_classes(slotted=True) is SLOTTED_CLASSES, "True should select slotted classes"
+        assert select_classes(slotted=False) is REGULAR_CLASSES, "False should select regular classes"
+
+    @pytest.mark.parametrize("slotted", [False, True])
+    def test_same_constructor_api(self, slotted):
+        """Test that both representations accept a starting level"""
+        classes = select_classes(slotted)
+        for name in ("Warrior", "Mage", "Rogue"):
+            hero = getattr(classes, name)("Hero", level=3)
+            assert (hero.level, hero.experience) == (3, XP_CURVE[2]), f"{name} should start at level 3"
+
+    def test_environment_flag(self, monkeypatch):
+        """Test that RPG_SLOTTED is read when no flag is given"""
+        monkeypatch.setenv("RPG_SLOTTED", "1")
+        assert select_classes().Warrior is SlottedWarrior, "RPG_SLOTTED=1 should select slotted classes"
+        monkeypatch.delenv("RPG_SLOTTED")
+        assert select_classes().Warrior is Warrior, "Default should be the regular classes"
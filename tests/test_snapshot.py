@@ -0,0 +1,138 @@
+import struct
+import pytest
+from array import array
+from project2_starter import Character, Warrior, Mage, Rogue, Weapon, XP_CURVE
+from rpg.character_pool import CharacterPool, WARRIOR, MAGE, ROGUE, CLASS_NAMES
+from rpg.snapshot import write_snapshot, Snapshot, SnapshotError, HEADER, MAGIC
+
+class TestSnapshotRoundTrip:
+    """Test writing and reopening world snapshots"""
+
+    def test_objects_round_trip(self, tmp_path):
+        """Test that regular objects survive a snapshot"""
+        path = tmp_path / "world.snap"
+        warrior = Warrior("Thorin")
+        warrior.take_damage(40)
+        goblin = Character("Goblin", 100, 8, 0)
+        goblin.weapon = Weapon("Rusty Club", 2)
+        written = write_snapshot(path, [warrior, Mage("Gandalf"), Rogue("Loki"), goblin])
+
+        with Snapshot(path) as snapshot:
+            assert written == len(snapshot) == 4, "All characters should be stored"
+            restored = snapshot[0]
+            assert isinstance(restored, Warrior), "Class should be restored"
+            assert restored.health == 110, "Current health should be restored"
+            assert snapshot[3].weapon.name == "Rusty Club", "NPC weapon should be restored"
+            assert snapshot.class_name(1) == "Mage", "Class names should come from the string table"
+            assert snapshot[-1].name == "Goblin", "Negative indexes should work"
+
+    def test_pool_round_trip(self, tmp_path):
+        """Test bulk restore into a CharacterPool"""
+        path = tmp_path / "pool.snap"
+        pool = CharacterPool()
+        for class_id in (WARRIOR, MAGE, ROGUE):
+            pool.spawn_many(class_id, [f"Hero{i}" for i in range(1000)])
+        pool.add("Dragón", 900, 40, 40)
+        pool.health[5] = 1
+        write_snapshot(path, pool)
+
+        with Snapshot(path) as snapshot:
+            restored = snapshot.to_pool()
+
+        assert restored.names == pool.names, "Names should round-trip, including non-ASCII"
+        assert list(restored.health) == list(pool.health), "Health column should round-trip"
+        assert list(restored.class_ids) == list(pool.class_ids), "Class ids should round-trip"
+        assert [w.name for w in restored.weapons] == [w.name for w in pool.weapons], \
+            "Weapon table should round-trip"
+
+    def test_levels_round_trip(self, tmp_path):
+        """Test that level and experience are stored with the stats"""
+        path = tmp_path / "levels.snap"
+        veteran = Warrior("Veteran")
+        veteran.gain_experience(XP_CURVE[9] + 25)
+        pool = CharacterPool()
+        pool.spawn(MAGE, "Pooled").level = 4
+        pool.add_character(veteran)
+        write_snapshot(path, [veteran])
+        write_snapshot(tmp_path / "pool.snap", pool)
+
+        with Snapshot(path) as snapshot:
+            restored = snapshot[0]
+        with Snapshot(tmp_path / "pool.snap") as snapshot:
+            restored_pool = snapshot.to_pool()
+
+        assert (restored.level, restored.experience, restored.strength) == \
+            (10, XP_CURVE[9] + 25, veteran.strength), "Level, experience and stats should agree"
+        assert list(restored_pool.levels) == [4, 10], "Pool levels should round-trip"
+        assert restored_pool.experience[1] == XP_CURVE[9] + 25, "Pool experience should round-trip"
+
+    def test_subclasses_round_trip(self, tmp_path):
+        """Test that catalog and engine heroes come back with their class and level"""
+        from rpg.class_catalog import load_catalog
+        from rpg.damage_models import build_engine
+        path = tmp_path / "subclasses.snap"
+        catalog_warrior = load_catalog().spawn("Warrior", "Catalog")
+        catalog_warrior.gain_experience(XP_CURVE[2])
+        engine_mage = build_engine("table", table={"Character": {"attack": 5}}).Mage("Engine", 4)
+        write_snapshot(path, [catalog_warrior, engine_mage])
+
+        with Snapshot(path) as snapshot:
+            warrior, mage = snapshot[0], snapshot[1]
+
+        assert type(warrior) is Warrior and warrior.level == 3, "Catalog warrior should stay a level 3 Warrior"
+        assert warrior.strength == catalog_warrior.strength, "Its stats should be kept"
+        assert type(mage) is Mage and mage.level == 4, "Engine mage should stay a level 4 Mage"
+
+    def test_reads_version_1(self, tmp_path):
+        """Test that snapshots written before levels were stored still load"""
+        path = tmp_path / "old.snap"
+        strings = ["Old"] + list(CLASS_NAMES)
+        offsets = array("Q", [0])
+        for text in strings:
+            offsets.append(offsets[-1] + len(text))
+        sections = [array("q", [70]), array("q", [15]), array("q", [3]), array("i", [-1]),
+                    array("b", [1]), array("q"), offsets]
+        data = HEADER.pack(MAGIC, 1, 1, 0, len(CLASS_NAMES), len(strings))
+        for section in sections:
+            raw = section.tobytes()
+            data += raw + b"\0" * (-len(raw) % 8)
+        path.write_bytes(data + "".join(strings).encode())
+
+        with Snapshot(path) as snapshot:
+            old = snapshot[0]
+            assert (old.name, old.health, old.level, old.experience) == ("Old", 70, 1, 0), \
+                "Version 1 characters should load at level 1"
+
+    def test_weapons_stored_once(self, tmp_path):
+        """Test that shared weapons are written once"""
+        path = tmp_path / "shared.snap"
+        write_snapshot(path, [Warrior(f"W{i}") for i in range(500)])
+
+        with Snapshot(path) as snapshot:
+            assert snapshot[0].weapon is snapshot[499].weapon, "Restored warriors should share one weapon"
+            assert snapshot.health[250] == 150, "Columns should be readable without decoding characters"
+
+class TestSnapshotErrors:
+    """Test rejection of invalid files"""
+
+    def test_wrong_magic(self, tmp_path):
+        """Test that other files are rejected"""
+        path = tmp_path / "bad.snap"
+        path.write_bytes(b"not a snapshot at all, definitely not" * 4)
+        with pytest.raises(SnapshotError):
+            Snapshot(path)
+
+    def test_truncated_file(self, tmp_path):
+        """Test that truncated snapshots are rejected"""
+        path = tmp_path / "cut.snap"
+        write_snapshot(path, [Warrior(f"W{i}") for i in range(100)])
+        path.write_bytes(path.read_bytes()[:200])
+        with pytest.raises(SnapshotError):
+            Snapshot(path)
+
+    def test_empty_file(self, tmp_path):
+        """Test that empty files are rejected"""
+        path = tmp_path / "empty.snap"
+        path.write_bytes(b"")
+        with pytest.raises(SnapshotError):
+            Snapshot(path)
@@ -0,0 +1,148 @@
+import math
+import random
+import pytest
+from project2_starter import Character, Warrior, Mage
+from rpg.character_pool import CharacterPool, MAGE
+from rpg.spatial import SpatialGrid, fireball_area, power_strike_cleave
+
+def brute_within(characters, center, radius):
+    """Reference radius query by scanning everything"""
+    return sorted((c for c in characters
+                   if math.dist(c.position, center) <= radius and c.health > 0),
+                  key=lambda c: math.dist(c.position, center))
+
+class TestSpatialGrid:
+    """Test radius and nearest queries"""
+
+    def build(self, count=500, seed=4):
+        rng = random.Random(seed)
+        grid = SpatialGrid(cell_size=8)
+        characters = [Character(f"C{i}", 50, 5, 0) for i in range(count)]
+        for character in characters:
+            grid.place(character, rng.uniform(-100, 100), rng.uniform(-100, 100))
+        return grid, characters
+
+    def test_within_matches_brute_force(self):
+        """Test that radius queries find exactly the characters in range"""
+        grid, characters = self.build()
+        for center, radius in (((0, 0), 15), ((50, -20), 40), ((-99, 99), 3), ((0, 0), 500)):
+            expected = brute_within(characters, center, radius)
+            assert set(grid.within(center, radius)) == set(expected), "Radius query should match brute force"
+
+    def test_nearest_matches_brute_force(self):
+        """Test that nearest-k returns the k closest characters in order"""
+        grid, characters = self.build()
+        center = (12.5, -7.25)
+        expected = sorted(characters, key=lambda c: math.dist(c.position, center))[:10]
+        found = grid.nearest(center, 10)
+
+        assert [math.dist(c.position, center) for c in found] == \
+            [math.dist(c.position, center) for c in expected], "Nearest-k should return the closest characters"
+
+    def test_nearest_sparse_world(self):
+        """Test nearest-k on a few characters spread very far apart"""
+        rng = random.Random(11)
+        grid = SpatialGrid(cell_size=1)
+        characters = [Character(f"C{i}", 50, 5, 0) for i in range(20)]
+        for character in characters:
+            grid.place(character, rng.uniform(-1e6, 1e6), rng.uniform(-1e6, 1e6))
+        for center in ((0, 0), characters[3].position, (-1e6, 1e6)):
+            expected = sorted(characters, key=lambda c: math.dist(c.position, center))[:5]
+            assert grid.nearest(center, 5) == expected, "Sparse nearest-k should match brute force"
+        assert len(grid.nearest((0, 0), 50)) == 20, "Asking for more than exist returns everyone"
+
+    def test_nearest_after_far_removal(self):
+        """Test that a removed far-away character does not widen later searches"""
+        class CountingCells(dict):
+            lookups = 0
+
+            def get(self, key, default=None):
+                CountingCells.lookups += 1
+                return super().get(key, default)
+
+        grid = SpatialGrid(cell_size=1)
+        grid._cells = CountingCells()
+        near = [Character("A", 50, 5, 0), Character("B", 50, 5, 0)]
+        grid.place(near[0], 0, 0)
+        grid.place(near[1], 3, 3)
+        drifter = Character("Drifter", 50, 5, 0)
+        grid.place(drifter, 20000, 20000)
+        grid.remove(drifter)
+
+        assert grid.nearest((0, 0), 3) == near, "Only the two remaining characters exist"
+        assert CountingCells.lookups < 100, "The search should stop once every occupied cell is seen"
+
+    def test_move_updates_queries(self):
+        """Test that moving a character updates the index"""
+        grid = SpatialGrid(cell_size=5)
+        goblin = Character("Goblin", 100, 8, 0)
+        grid.place(goblin, 0, 0)
+        grid.move(goblin, 100, 100)
+
+        assert grid.within((0, 0), 10) == [], "Old position should be empty"
+        assert grid.within((100, 100), 1) == [goblin], "New position should find the goblin"
+        assert goblin.position == (100, 100), "Character should know its position"
+        grid.remove(goblin)
+        assert len(grid) == 0 and goblin.position is None, "Removed character should leave the index"
+
+    def test_dead_characters_skipped(self):
+        """Test that characters at 0 health are ignored by default"""
+        grid = SpatialGrid()
+        corpse = Character("Corpse", 0, 0, 0)
+        grid.place(corpse, 1, 1)
+
+        assert grid.within((0, 0), 5) == [], "Dead characters should be skipped"
+        assert grid.within((0, 0), 5, include_dead=True) == [corpse], "include_dead should return them"
+
+    def test_invalid_cell_size(self):
+        """Test that the cell size must be positive"""
+        with pytest.raises(ValueError):
+            SpatialGrid(cell_size=0)
+
+class TestAreaAbilities:
+    """Test AoE variants of the special abilities"""
+
+    def test_fireball_area_hits_everyone_in_radius(self):
+        """Test that splash fireball damages targets in range only"""
+        grid = SpatialGrid(cell_size=4)
+        mage = Mage("Caster")
+        grid.place(mage, 0, 0)
+        near = [Character(f"Near{i}", 100, 0, 0) for i in range(3)]
+        far = Character("Far", 100, 0, 0)
+        for i, target in enumerate(near):
+            grid.place(target, i + 1, 0)
+        grid.place(far, 30, 30)
+
+        hit = fireball_area(mage, grid, (0, 0), 5)
+
+        assert hit == near, "Every target in the radius should be hit, nearest first"
+        assert all(t.health == 48 for t in near), "Splash should use the fireball formula"
+        assert far.health == 100 and mage.health == 80, "Caster and distant targets should be spared"
+
+    def test_power_strike_cleave(self):
+        """Test that cleave hits the nearest targets within reach"""
+        grid = SpatialGrid(cell_size=2)
+        warrior = Warrior("Cleaver")
+        grid.place(warrior, 0, 0)
+        targets = [Character(f"T{i}", 100, 0, 0) for i in range(4)]
+        for i, target in enumerate(targets):
+            grid.place(target, 0, i + 1)
+
+        hit = power_strike_cleave(warrior, grid, count=2, reach=10)
+
+        assert hit == targets[:2], "Cleave should hit the two nearest targets"
+        assert [t.health for t in targets] == [60, 60, 100, 100], "Only hit targets should take damage"
+
+    def test_pooled_characters_in_grid(self):
+        """Test that pooled handles can be indexed and hit"""
+        pool = CharacterPool()
+        mage = pool.spawn(MAGE, "PoolMage")
+        goblin = pool.add("Goblin", 100, 8, 0)
+        grid = SpatialGrid()
+        grid.place(mage, 0, 0)
+        grid.place(pool[goblin.index], 2, 0)
+
+        fireball_area(mage, grid, (0, 0), 3)
+
+        assert goblin.health == 48, "Pooled target should take splash damage"
+        assert pool.positions[goblin.index] == (2, 0), "Position should be stored in the pool"
@@ -0,0 +1,174 @@
+import random
+import pytest
+from project2_starter import Character, Warrior, Mage, Rogue, set_damage_router
+from rpg.deferred_damage import deferred_damage
+from rpg.character_pool import CharacterPool
+from rpg.combat_events import EventStream
+from rpg.status_effects import EffectEngine, TimerWheel
+
+class TestTimerWheel:
+    """Test the hierarchical timer wheel"""
+
+    def test_matches_brute_force(self):
+        """Test that every timer fires exactly on its deadline, across cascades"""
+        wheel = TimerWheel(slots=4, levels=3)  # top wheel range: 64 ticks
+        rng = random.Random(7)
+        deadlines = {i: rng.randint(1, 300) for i in range(500)}
+        for item, deadline in deadlines.items():
+            wheel.schedule(deadline, item)
+        fired = {}
+        for _ in range(300):
+            for item in wheel.advance():
+                fired[item] = wheel.now
+
+        assert fired == deadlines, "Every timer should fire on its own tick"
+        assert len(wheel) == 0, "Nothing should remain scheduled"
+
+    def test_schedule_while_running(self):
+        """Test timers added after time has advanced"""
+        wheel = TimerWheel(slots=8, levels=2)
+        for _ in range(13):
+            wheel.advance()
+        wheel.schedule(wheel.now + 20, "late")
+        wheel.schedule(wheel.now, "now")
+        fired = {item: None for _ in range(20) for item in wheel.advance()}
+
+        assert list(fired) == ["now", "late"], "Past deadlines fire next tick; others on time"
+
+    def test_invalid_shape(self):
+        """Test that a wheel needs at least two slots"""
+        with pytest.raises(ValueError):
+            TimerWheel(slots=1)
+
+class TestAbilityEffects:
+    """Test effects applied by the special abilities"""
+
+    def test_fireball_burns(self):
+        """Test burn damage over three ticks, attributed to the caster"""
+        mage = Mage("M")
+        goblin = Character("Goblin", 200, 8, 0)
+        with EffectEngine() as effects, EventStream() as stream:
+            mage.fireball(goblin)
+            effects.tick(5)
+
+        assert goblin.health == 200 - 52 - 3 * 5, "Fireball plus three burn ticks"
+        assert [(e.attacker, e.ability) for e in stream][1:] == [("M", "burn")] * 3, "Burn belongs to the mage"
+
+    def test_ticks_use_active_router(self):
+        """Test that damage over time goes through an installed damage router"""
+        mage = Mage("M")
+        goblin = Character("Goblin", 200, 8, 0)
+        effects = EffectEngine()
+        effects.apply(goblin, "burn", source=mage)
+        routed = []
+        previous = set_damage_router(lambda *hit: routed.append(hit))
+        try:
+            effects.tick(3)
+        finally:
+            set_damage_router(previous)
+
+        assert routed == [(mage, goblin, 5, "burn")] * 3, "Every tick should reach the router"
+        assert goblin.health == 200, "The router decides when damage lands"
+
+    def test_ticks_deferred(self):
+        """Test that damage over time waits for the deferred commit"""
+        goblin = Character("Goblin", 200, 8, 0)
+        effects = EffectEngine()
+        effects.apply(goblin, "bleed")
+        with deferred_damage() as pending:
+            effects.tick(2)
+            assert goblin.health == 200 and pending.pending(goblin) == 8, "Bleed should be pending"
+            pending.commit()
+
+        assert goblin.health == 200 - 8, "Commit should apply the bleed"
+
+    def test_weaken_reverts(self):
+        """Test that power strike weakens the target only for its duration"""
+        target = Warrior("Target")
+        target.health = 1000
+        with EffectEngine() as effects:
+            Warrior("W").power_strike(target)
+            assert target.strength == 12 and effects.effects_on(target) == ["weaken"], "Weakened"
+            effects.tick(3)
+
+        assert target.strength == 15 and target.damage_table()["attack"] == 25, "Strength and damage restored"
+
+    def test_refresh_not_stack(self):
+        """Test that reapplying an effect refreshes its duration"""
+        rogue = Rogue("R")
+        goblin = Character("Goblin", 1000, 8, 0)
+        with EffectEngine() as effects:
+            rogue.sneak_attack(goblin)
+            effects.tick(2)
+            rogue.sneak_attack(goblin)
+            effects.tick(10)
+
+        assert goblin.health == 1000 - 2 * 38 - (2 + 4) * 4, "Bleed should restart, not double"
+        assert len(effects) == 0, "Every effect should have expired"
+
+    def test_dead_targets_stop_ticking(self):
+        """Test that damage over time stops on a dead target"""
+        goblin = Character("Goblin", 60, 8, 0)
+        effects = EffectEngine()
+        effects.apply(goblin, "poison")
+        goblin.take_damage(60)
+
+        assert effects.tick(20) == 1 and len(effects) == 0, "Poison should end at the first tick"
+
+    def test_killing_tick_cleanses(self):
+        """Test that a damage tick that kills its target removes the other effects too"""
+        goblin = Character("Goblin", 5, 8, 0)
+        effects = EffectEngine()
+        effects.apply(goblin, "burn")
+        effects.apply(goblin, "weaken")
+        effects.tick()
+
+        assert goblin.health == 0 and effects.effects_on(goblin) == [], "Nothing should stay on the dead goblin"
+        assert goblin.strength == 8 and len(effects) == 0, "Weaken should be reverted"
+
+    def test_not_attached(self):
+        """Test that abilities apply nothing without an attached engine"""
+        effects = EffectEngine()
+        Mage("M").fireball(Character("Goblin", 200, 8, 0))
+        assert len(effects) == 0, "No effects without attach()"
+
+class TestEffectManagement:
+    """Test cleansing, buffs and pooled targets"""
+
+    def test_cleanse_reverts_buff(self):
+        """Test that cleanse removes effects and reverts modifiers"""
+        warrior = Warrior("W")
+        effects = EffectEngine()
+        effects.apply(warrior, "rally")
+        effects.apply(warrior, "poison")
+
+        assert warrior.strength == 20, "Rally should raise strength"
+        assert effects.cleanse(warrior) == 2 and warrior.strength == 15, "Cleanse should revert rally"
+        assert effects.tick(20) == 0, "Cleansed timers should be skipped"
+
+    def test_recycled_npc_starts_clean(self):
+        """Test that a weakened NPC killed and recycled by NPCPool carries nothing over"""
+        from rpg.npc_pool import NPCPool
+        npcs = NPCPool()
+        goblin = npcs.acquire("Goblin", 100, 8, 0)
+        with EffectEngine() as effects:
+            Warrior("W").power_strike(goblin)
+            assert effects.effects_on(goblin) == ["weaken"], "Power strike should weaken"
+            goblin.take_damage(100)
+            npcs.reclaim([goblin])
+            reborn = npcs.acquire("Goblin", 100, 8, 0)
+            effects.tick(3)
+
+        assert reborn is goblin and effects.effects_on(reborn) == [], "The recycled goblin has no effects"
+        assert reborn.strength == 8, "Its strength should not be changed by the old weaken"
+
+    def test_pool_handles(self):
+        """Test effects on pooled characters through fresh handles"""
+        pool = CharacterPool()
+        goblin = pool.add("Goblin", 100, 8, 0)
+        effects = EffectEngine()
+        effects.apply(goblin, "bleed")
+        effects.apply(pool[0], "bleed")
+        effects.tick(4)
+
+        assert pool.health[0] == 100 - 16 and effects.stats()["applied"] == 2, "One refreshed bleed"
@@ -0,0 +1,72 @@
+import pytest
+from project2_starter import Warrior, Mage, Rogue, Weapon, SharedWeapon, WeaponRegistry, WEAPONS
+
+class TestWeaponInterning:
+    """Test that identical weapons are shared"""
+
+    def test_intern_returns_same_instance(self):
+        """Test that interning the same definition twice returns one object"""
+        registry = WeaponRegistry()
+        first = registry.intern("Iron Sword", 10)
+        second = registry.intern("Iron Sword", 10)
+
+        assert first is second, "Identical definitions should share one instance"
+        assert isinstance(first, Weapon), "Shared weapons should still be Weapons"
+        assert registry.stats()["hits"] == 1, "Second lookup should count as a hit"
+        assert registry.stats()["misses"] == 1, "First lookup should count as a miss"
+
+    def test_different_bonus_is_different_weapon(self):
+        """Test that the damage bonus is part of the weapon identity"""
+        registry = WeaponRegistry()
+
+        assert registry.intern("Iron Sword", 10) is not registry.intern("Iron Sword", 15), \
+            "Different bonuses should be different weapons"
+
+    def test_shared_weapons_are_read_only(self):
+        """Test that shared weapons cannot be modified in place"""
+        weapon = WeaponRegistry().intern("Magic Staff", 12)
+        with pytest.raises(AttributeError):
+            weapon.damage_bonus = 99
+
+    def test_starting_weapons_are_shared(self):
+        """Test that class constructors reuse one weapon per class"""
+        assert Warrior("A").weapon is Warrior("B").weapon, "Warriors should share their sword"
+        assert Mage("A").weapon is Mage("B").weapon, "Mages should share their staff"
+        assert Rogue("A").weapon is Rogue("B").weapon, "Rogues should share their dagger"
+        assert "Iron Sword" in WEAPONS, "Default registry should know the Iron Sword"
+
+    def test_equipping_new_weapon_still_works(self):
+        """Test that a character can swap in its own Weapon"""
+        warrior = Warrior("Swapper")
+        warrior.weapon = Weapon("War Hammer", 20)
+
+        assert warrior.weapon.damage_bonus == 20, "Equipped weapon should replace the shared one"
+        assert Warrior("Other").weapon.damage_bonus == 10, "Other warriors should keep the sword"
+
+class TestWeaponCatalog:
+    """Test bulk loading and lookups by name"""
+
+    def test_bulk_load(self):
+        """Test loading thousands of definitions at once"""
+        registry = WeaponRegistry()
+        added = registry.load((f"Blade {i}", i % 25) for i in range(5000))
+        added += registry.load([{"name": "Blade 0", "damage_bonus": 0}, {"name": "Axe", "damage_bonus": 9}])
+
+        assert added == 5001, "Only new definitions should be counted"
+        assert len(registry) == 5001, "Registry should hold every unique weapon"
+        assert registry.get("Axe").damage_bonus == 9, "Loaded weapons should be retrievable by name"
+
+    def test_get_unknown_weapon(self):
+        """Test that unknown names raise KeyError"""
+        with pytest.raises(KeyError):
+            WeaponRegistry().get("Excalibur")
+
+    def test_memory_saved_counter(self):
+        """Test that hits report saved memory"""
+        registry = WeaponRegistry()
+        registry.load([("Club", 3)])
+        for _ in range(10):
+            registry.get("Club")
+
+        assert registry.stats()["bytes_saved"] > 0, "Hits should report memory saved"
+        assert isinstance(registry.get("Club"), SharedWeapon), "Lookups should return shared weapons"